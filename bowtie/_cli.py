@@ -2,9 +2,17 @@ from __future__ import annotations
 
 from collections import Counter
 from collections.abc import Callable, Iterable
-from contextlib import AsyncExitStack, asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import (
+    AbstractAsyncContextManager,
+    AsyncExitStack,
+    aclosing,
+    asynccontextmanager,
+    nullcontext,
+    suppress,
+)
 from fnmatch import fnmatch
-from functools import wraps
+from functools import partial, wraps
 from io import TextIOWrapper
 from pathlib import Path
 from statistics import mean, median, quantiles
@@ -18,8 +26,10 @@ import os
 import sys
 import tarfile
 
+from attrs import field, mutable
 from click.shell_completion import CompletionItem
 from diagnostic import DiagnosticError
+from imaged import NoSuchEngine, Unsupported
 from inflect import engine as InflectEngine
 from rich import box, console, panel
 from rich.progress import (
@@ -44,21 +54,35 @@ from bowtie import (
     DOCS,
     HOMEPAGE,
     _benchmarks,
+    _columnar,
+    _compression,
     _connectables,
     _github,
+    _index,
     _report,
     _suite,
 )
 from bowtie._commands import OutputFormat, SeqCase, Unsuccessful
+from bowtie._containers import (
+    DEFAULT_MAX_PULLS,
+    MAX_PULLS_ENV_VAR,
+    Pulls,
+    chosen_engine,
+)
 from bowtie._core import (
     Dialect,
     Example,
     Implementation,
+    ImplementationInfo,
+    Registrations,
+    Restarts,
+    SlowResponses,
     Test,
     TestCase,
     convert_table_to_markdown,
 )
 from bowtie._direct_connectable import Direct
+from bowtie._pool import POOL_ENV_VAR, Pool
 from bowtie.exceptions import (
     CannotConnect,
     DialectError,
@@ -69,8 +93,11 @@ from bowtie.exceptions import (
 
 if TYPE_CHECKING:
     from collections.abc import (
+        AsyncGenerator,
         AsyncIterator,
         Awaitable,
+        Container,
+        Coroutine,
         Mapping,
         Sequence,
         Set,
@@ -82,9 +109,9 @@ if TYPE_CHECKING:
     from httpx import Response
     from referencing.jsonschema import SchemaResource
 
-    from bowtie._commands import AnyTestResult, SeqResult
+    from bowtie._commands import AnyTestResult, Seq, SeqResult
     from bowtie._connectables import Connectable, ConnectableId
-    from bowtie._core import DialectRunner, ImplementationInfo
+    from bowtie._core import DialectRunner
     from bowtie._registry import ValidatorRegistry
 
 
@@ -144,9 +171,13 @@ _COMMAND_GROUPS = {
             name="Advanced Usage",
             commands=[
                 "combine",
+                "convert-report",
                 "filter-dialects",
                 "filter-implementations",
+                "index",
                 "latest-report",
+                "pool",
+                "pull",
                 "run",
                 "site",
                 "statistics",
@@ -194,7 +225,14 @@ _OPTION_GROUPS = {
                     ["fail-fast", "filter", "max-error", "max-fail"],
                 ),
                 ("Test Modification Options", ["set-schema"]),
-                ("Execution Options", ["jobs"]),
+                (
+                    "Execution Options",
+                    [
+                        "jobs",
+                        "instances-per-implementation",
+                        "work-stealing",
+                    ],
+                ),
             ],
         ),
         (
@@ -212,7 +250,14 @@ _OPTION_GROUPS = {
                     ],
                 ),
                 ("Test Modification Options", ["set-schema"]),
-                ("Execution Options", ["jobs"]),
+                (
+                    "Execution Options",
+                    [
+                        "jobs",
+                        "instances-per-implementation",
+                        "work-stealing",
+                    ],
+                ),
             ],
         ),
         ("info", [("Basic Options", ["implementation", "format"])]),
@@ -255,7 +300,14 @@ _OPTION_GROUPS = {
                     "Test Run Options",
                     ["fail-fast", "filter", "max-error", "max-fail", "output"],
                 ),
-                ("Execution Options", ["jobs"]),
+                (
+                    "Execution Options",
+                    [
+                        "jobs",
+                        "instances-per-implementation",
+                        "work-stealing",
+                    ],
+                ),
             ],
         ),
         (
@@ -465,6 +517,11 @@ def implementation_subcommand(
 
 _F = Literal["json", "pretty", "markdown"]
 
+#: Any of the kinds of report which can be summarized.
+type _AnyReport = (
+    _report.Report | _columnar.ColumnarReport | _index.IndexedReport
+)
+
 
 def format_option(**option_kwargs: Any) -> Callable[[FC], FC]:
     if not option_kwargs:
@@ -511,26 +568,68 @@ def format_option(**option_kwargs: Any) -> Callable[[FC], FC]:
     return _format_option
 
 
+VALIDATE_REPORT = click.option(
+    "--validate-report/--no-validate-report",
+    default=True,
+    show_default=True,
+    is_eager=True,
+    expose_value=False,
+    callback=lambda ctx, _, value: ctx.meta.update(validate_report=value),
+    help=(
+        "Validate reports being read against Bowtie's report schema. "
+        "Not doing so makes reading large reports much faster, and is safe "
+        "for reports which Bowtie itself produced."
+    ),
+)
+
+
+def _should_validate_reports() -> bool:
+    """
+    Whether the current command should validate the reports it reads.
+    """
+    context = click.get_current_context(silent=True)
+    if context is None:  # e.g. when reading reports from outside the CLI
+        return True
+    return context.meta.get("validate_report", True)
+
+
 class _Report(click.File):
     """
     Select a previously produced Bowtie report.
+
+    Columnar reports are memory-mapped rather than parsed, as are reports
+    with an index alongside them (whose lines are then read as needed).
+    Compressed reports are decompressed as they are read.
     """
 
     name = "report"
-    mode = "r"
+
+    def __init__(self, **kwargs: Any):
+        super().__init__(mode="rb", **kwargs)
 
     def convert(  # type: ignore[reportIncompatibleMethodOverride]
         self,
         value: str | PathLike[str] | IO[Any] | _report.Report,
         param: click.Parameter | None,
         ctx: click.Context,
-    ) -> _report.Report:
+    ) -> _AnyReport:
         if isinstance(value, _report.Report):
             return value
 
         input = super().convert(value, param, ctx)
+        serialized = _compression.decompressed(input)
         try:
-            return _report.Report.from_serialized(input)
+            if serialized is input:
+                if _columnar.is_columnar(input):
+                    return _columnar.ColumnarReport.from_file(input)
+                validate = _should_validate_reports()
+                indexed = _index.indexed(input, validate=validate)
+                if indexed is not None:
+                    return indexed
+            return _report.Report.from_serialized(
+                serialized,
+                validate=_should_validate_reports(),
+            )
         except _report.EmptyReport:
             error = DiagnosticError(
                 code="empty-report",
@@ -592,6 +691,21 @@ class _Report(click.File):
             )
             STDERR.print(error)
             ctx.exit(EX.DATAERR)
+        except _report.UnsupportedReportVersion as err:
+            error = DiagnosticError(
+                code="unsupported-report-version",
+                message="The Bowtie report is too new to read.",
+                causes=[
+                    (
+                        f"{input.name} is a version {err} report, but this "
+                        "version of Bowtie only reads reports up to version "
+                        f"{_report.REPORT_VERSION}."
+                    ),
+                ],
+                hint_stmt="Upgrade Bowtie to read this report.",
+            )
+            STDERR.print(error)
+            ctx.exit(EX.DATAERR)
 
 
 @subcommand
@@ -609,11 +723,37 @@ class _Report(click.File):
         "(whether the results match what test cases expected)"
     ),
 )
+@click.option(
+    "--implementation",
+    "-i",
+    "implementations",
+    multiple=True,
+    metavar="ID",
+    help=(
+        "Only summarize the given implementation(s) from the report. "
+        "Reports with an index are then only partially read."
+    ),
+)
 @click.argument("report", default="-", type=_Report())
-def summary(report: _report.Report, format: _F, show: str):
+@VALIDATE_REPORT
+def summary(
+    report: _AnyReport,
+    format: _F,
+    show: str,
+    implementations: Sequence[ConnectableId],
+):
     """
     Generate an (in-terminal) summary of a Bowtie run.
     """
+    if implementations:
+        missing = set(implementations).difference(report.implementations)
+        if missing:
+            raise click.BadParameter(
+                f"not in the report: {', '.join(sorted(missing))}",
+                param_hint="--implementation",
+            )
+        report = report.only(implementations)
+
     if show == "failures":
         results = report.worst_to_best()
         exit_code = (
@@ -709,7 +849,7 @@ def summary(report: _report.Report, format: _F, show: str):
 
 
 def _failure_table(
-    report: _report.Report,
+    report: _AnyReport,
     results: list[tuple[ConnectableId, ImplementationInfo, Unsuccessful]],
 ):
     test = "tests" if report.total_tests != 1 else "test"
@@ -744,7 +884,7 @@ def _failure_table(
 
 
 def _failure_table_in_markdown(
-    report: _report.Report,
+    report: _AnyReport,
     results: list[tuple[ConnectableId, ImplementationInfo, Unsuccessful]],
 ):
     test = "tests" if report.total_tests != 1 else "test"
@@ -786,7 +926,7 @@ def _failure_table_in_markdown(
 
 
 def _results_table(
-    report: _report.Report,
+    report: _AnyReport,
     results: Iterable[
         tuple[TestCase, Iterable[tuple[Test, Mapping[str, AnyTestResult]]]],
     ],
@@ -850,7 +990,7 @@ def _results_table(
 
 
 def _results_table_in_markdown(
-    report: _report.Report,
+    report: _AnyReport,
     results: Iterable[
         tuple[TestCase, Iterable[tuple[Test, Mapping[str, AnyTestResult]]]],
     ],
@@ -988,12 +1128,14 @@ def _annotation_cell(
         if not sys.stdin.isatty()
         else _report.Report.from_serialized(
             asyncio.run(Dialect.latest().latest_report()).iter_lines(),
+            validate=_should_validate_reports(),
         )
     ),
     type=_Report(),
 )
+@VALIDATE_REPORT
 def statistics(
-    report: _report.Report,
+    report: _AnyReport,
     n: int,
     format: _F,
 ):
@@ -1237,6 +1379,55 @@ JOBS = click.option(
     help="Maximum number of implementations to run concurrently.",
 )
 
+INSTANCES = click.option(
+    "--instances-per-implementation",
+    "instances",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help=(
+        "How many instances of each implementation to start, sharing "
+        "test cases between them. Each instance runs one case at a time, "
+        "so running more than one can speed up slow implementations."
+    ),
+)
+
+WORK_STEALING = click.option(
+    "--work-stealing",
+    "work_stealing",
+    is_flag=True,
+    default=False,
+    help=(
+        "Once every implementation has started, use job slots freed by "
+        "implementations which finish to start further instances of "
+        "those still running, sharing their remaining test cases."
+    ),
+)
+
+WRITE_INDEX = click.option(
+    "--write-index",
+    "write_index",
+    default=None,
+    type=click.File(mode="w"),
+    help=(
+        "Also write an index of the report to the given path, which should "
+        "sit alongside the report (as REPORT.index) so that commands "
+        "reading it can read only the lines they need."
+    ),
+)
+
+COMPRESS = click.option(
+    "--compress",
+    "compression",
+    default=None,
+    type=click.Choice(["gzip", "zstd"]),
+    help=(
+        "Compress the reports written with the given compression, adding a "
+        "``.gz`` or ``.zst`` suffix to their names. Zstandard needs Python "
+        "3.14 or the zstandard package."
+    ),
+)
+
 _inflect_engine = InflectEngine()
 
 POSSIBLE_DIALECT_SHORTNAMES = _inflect_engine.join(sorted(Dialect.by_alias()))  # type: ignore[reportArgumentType]
@@ -1358,6 +1549,9 @@ class JSON(click.File):
 @SET_SCHEMA
 @VALIDATE
 @JOBS
+@INSTANCES
+@WORK_STEALING
+@WRITE_INDEX
 @click.argument(
     "input",
     default="-",
@@ -1792,6 +1986,242 @@ def latest_report(dialect: Dialect):
     asyncio.run(write(dialect.latest_report()))
 
 
+@subcommand
+@click.argument(
+    "report",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+)
+def index(report: Path):
+    """
+    Index a report, so that commands reading it read only what they need.
+
+    The index is written alongside the report (as ``REPORT.index``), and is
+    ignored should the report later change.
+    """
+    with report.open("rb") as file:
+        compression = _compression.compression_of(file)
+        if compression is not None:
+            STDERR.print(
+                f"[bold red]{report} is {compression}-compressed, and only "
+                "uncompressed reports can be indexed.[/]",
+            )
+            return EX.DATAERR
+        if _columnar.is_columnar(file):
+            STDERR.print(
+                f"[bold red]{report} is a columnar report, which needs "
+                "no index.[/]",
+            )
+            return EX.DATAERR
+        try:
+            indexed = _index.ReportIndex.of(file)
+        except _report.MissingFooter:
+            STDERR.print(f"[bold red]{report} is missing its footer.[/]")
+            return EX.DATAERR
+        except json.JSONDecodeError as err:
+            STDERR.print(f"[bold red]{report} is not valid JSON: {err}[/]")
+            return EX.DATAERR
+        except _report.InvalidReport:
+            STDERR.print(f"[bold red]{report} is not a valid report.[/]")
+            return EX.DATAERR
+    _index.path_for(report).write_text(indexed.serialized())
+
+
+@subcommand
+@click.argument("input", default="-", type=click.File(mode="rb"))
+@click.argument("output", default="-", type=click.File(mode="wb"))
+@VALIDATE_REPORT
+def convert_report(input: IO[bytes], output: IO[bytes]):
+    """
+    Convert a report to or from Bowtie's columnar report format.
+
+    JSON Lines reports (which may be compressed) are converted to columnar
+    ones, which can be memory-mapped by ``summary``, ``statistics`` and
+    ``trend`` rather than parsed, and columnar reports are converted back to
+    JSON Lines.
+    """
+    input = _compression.decompressed(input)
+    try:
+        if _columnar.is_columnar(input):
+            columnar = _columnar.ColumnarReport.from_file(input)
+            for line in columnar.serialized():
+                output.write(f"{line}\n".encode())
+            return
+        _columnar.write(
+            (json.loads(line) for line in input),
+            output,
+            validate=_should_validate_reports(),
+        )
+    except _report.EmptyReport:
+        STDERR.print(
+            DiagnosticError(
+                code="empty-report",
+                message="The Bowtie report is empty.",
+                causes=[f"{input.name} contains no test result data."],
+                hint_stmt=None,
+            ),
+        )
+        return EX.NOINPUT
+    except json.JSONDecodeError as err:
+        STDERR.print(
+            DiagnosticError(
+                code="report-not-json",
+                message="The Bowtie report looks corrupt.",
+                causes=[f"{input.name} is not valid JSON.", str(err)],
+                hint_stmt=(
+                    "Ensure you are passing in a report generated by Bowtie."
+                ),
+            ),
+        )
+        return EX.DATAERR
+    except _report.MissingFooter:
+        STDERR.print(
+            DiagnosticError(
+                code="truncated-report",
+                message="The Bowtie report looks corrupt.",
+                causes=[
+                    (
+                        f"{input.name} is missing its footer, which usually "
+                        "means it has been somehow truncated."
+                    ),
+                ],
+                hint_stmt=None,
+            ),
+        )
+        return EX.DATAERR
+    except _report.InvalidReport as err:
+        STDERR.print(
+            DiagnosticError(
+                code="invalid-report",
+                message="The Bowtie report is invalid.",
+                causes=[f"{input.name} could not be converted.", str(err)],
+                hint_stmt=None,
+            ),
+        )
+        return EX.DATAERR
+
+
+@subcommand
+@click.option(
+    "--socket",
+    type=click.Path(dir_okay=False, path_type=Path),
+    envvar=POOL_ENV_VAR,
+    required=True,
+    help=(
+        "Where to listen for other Bowtie invocations asking for a "
+        f"container. Defaults to the value of ${POOL_ENV_VAR}."
+    ),
+)
+@click.option(
+    "--warm",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="How many containers to keep started for each image once asked for.",
+)
+@click.option(
+    "--ttl",
+    "ttl_sec",
+    type=click.FloatRange(min=0, min_open=True),
+    default=600,
+    show_default=True,
+    help="How many seconds a started container may go unused before removal.",
+)
+def pool(socket: Path, warm: int, ttl_sec: float):
+    """
+    Keep implementation containers warm for other Bowtie invocations.
+
+    Runs until interrupted. Other invocations of Bowtie which have
+    BOWTIE_POOL set to the same socket will use containers started
+    here rather than starting (and waiting for) their own.
+
+    Each container is used by a single invocation, and a replacement is
+    started in the background once it is.
+    """
+    try:
+        engine = chosen_engine()
+    except NoSuchEngine as error:
+        STDERR.print(error)
+        return EX.UNAVAILABLE
+
+    if not engine.attaches:
+        STDERR.print(
+            Unsupported(engine=engine.name, operation="keep containers warm"),
+        )
+        return EX.UNAVAILABLE
+
+    warmed = Pool(engine=engine, warm=warm, ttl_sec=ttl_sec)
+    with suppress(KeyboardInterrupt):
+        asyncio.run(warmed.serve(socket))
+
+
+@subcommand
+@click.option(
+    "--implementation",
+    "-i",
+    "connectables",
+    type=_connectables.ClickParam(),
+    default=lambda: (
+        Implementation.known()
+        if sys.stdin.isatty() or "CI" in os.environ
+        else [line.strip() for line in sys.stdin]
+    ),
+    multiple=True,
+    metavar="IMPLEMENTATION",
+    help=(
+        "A connectable ID for a JSON Schema implementation whose image "
+        "should be pulled. May be repeated multiple times to pull multiple "
+        "images. Connectables which aren't images are ignored."
+    ),
+)
+@click.option(
+    "--max-pulls",
+    type=click.IntRange(min=1),
+    envvar=MAX_PULLS_ENV_VAR,
+    default=DEFAULT_MAX_PULLS,
+    show_default=True,
+    help=(
+        "How many images to pull at once. "
+        f"Runs respect ${MAX_PULLS_ENV_VAR} for the same purpose."
+    ),
+)
+def pull(connectables: Iterable[Connectable], max_pulls: int):
+    """
+    Pull the images of implementations ahead of running them.
+
+    Images are fetched even if some version of them is already present,
+    and implementations whose images can't be pulled are reported before
+    any time is spent running them.
+    """
+    return asyncio.run(_pull(connectables=connectables, max_pulls=max_pulls))
+
+
+async def _pull(connectables: Iterable[Connectable], max_pulls: int) -> int:
+    pulls = Pulls(maximum=max_pulls)
+    exit_code = 0
+
+    connectables = list(connectables)
+    progress = _progress(MofNCompleteColumn())
+    task = progress.add_task(description="Pulling", total=len(connectables))
+
+    async def pulled(connectable: Connectable):
+        nonlocal exit_code
+        try:
+            await connectable.pull(pulls=pulls)
+        except STARTUP_ERRORS as error:
+            exit_code |= EX.CONFIG
+            progress.console.print(error)
+        else:
+            progress.update(
+                task,
+                description=f"Pulled {connectable.to_terse()}",
+            )
+        progress.update(task, advance=1)
+
+    with progress:
+        await asyncio.gather(*(pulled(each) for each in connectables))
+    return exit_code
+
+
 def _info_links_table_for(metadata: dict[str, Any]):
     table = Table(
         Column(style="spring_green4"),
@@ -1951,68 +2381,135 @@ async def download_and_parse_reports_for(
     id: ConnectableId,
     versions: Set[str],
     dialects: Iterable[Dialect],
+    validate: bool = True,
 ) -> Iterable[tuple[str, Dialect, _report.Report]]:
     pretty_names_str = pretty_names_str_for(dialects)
 
     progress = _progress(MofNCompleteColumn())
 
-    if versions:
-        total_files = len(versions) * len(list(dialects))
-        actual_downloaded_files = 0
+    # Downloads happen concurrently, but validating each report is CPU-bound,
+    # so it happens in other processes rather than blocking them (which
+    # aren't worth starting if we aren't validating).
+    loop = asyncio.get_running_loop()
+    pool = ProcessPoolExecutor() if validate else None
 
-        task = progress.add_task(
-            description=(
-                "Preparing to download and parse versioned "
-                f"reports of {id} for {pretty_names_str}"
-            ),
-            total=total_files,
-        )
+    async def parse(serialized: str) -> _report.Report:
+        if pool is None:
+            lines = _report.deserialized(serialized, validate=False)
+        else:
+            lines = await loop.run_in_executor(
+                pool,
+                _report.deserialized,
+                serialized,
+                validate,
+            )
+        return _report.Report.from_input(lines, validate=False)
 
-        async with httpx.AsyncClient(timeout=10) as client:
+    with pool or nullcontext():
+        if versions:
+            total_files = len(versions) * len(list(dialects))
+            actual_downloaded_files = 0
 
-            async def download_and_parse_versioned_report_for(
-                version: str,
-                dialect: Dialect,
-            ):
-                try:
-                    url = (
-                        HOMEPAGE
-                        / "implementations"
-                        / id
-                        / f"v{version}"
-                        / f"{dialect.short_name}.json"
+            task = progress.add_task(
+                description=(
+                    "Preparing to download and parse versioned "
+                    f"reports of {id} for {pretty_names_str}"
+                ),
+                total=total_files,
+            )
+
+            async with httpx.AsyncClient(timeout=10) as client:
+
+                async def download_and_parse_versioned_report_for(
+                    version: str,
+                    dialect: Dialect,
+                ):
+                    try:
+                        url = (
+                            HOMEPAGE
+                            / "implementations"
+                            / id
+                            / f"v{version}"
+                            / f"{dialect.short_name}.json"
+                        )
+                        response = await client.get(str(url))
+                        response.raise_for_status()
+                        progress.update(
+                            task,
+                            description=(
+                                f"Downloading and Parsing: "
+                                f"v{version}/{dialect.short_name}.json"
+                            ),
+                        )
+                    except httpx.HTTPStatusError:
+                        report = _report.Report.empty(dialect=dialect)
+                        progress.update(task, advance=1)
+                        return version, dialect, report
+                    else:
+                        nonlocal actual_downloaded_files
+                        actual_downloaded_files += 1
+
+                        report = await parse(response.text)
+                        progress.update(task, advance=1)
+                        return version, dialect, report
+
+                with progress:
+                    responses = await asyncio.gather(
+                        *[
+                            download_and_parse_versioned_report_for(
+                                version,
+                                dialect,
+                            )
+                            for version in versions
+                            for dialect in dialects
+                        ],
                     )
-                    response = await client.get(str(url))
+
+                    progress.update(
+                        task,
+                        description=(
+                            "Successfully downloaded and parsed all versioned "
+                            f"reports of {id} for {pretty_names_str}!"
+                        ),
+                        completed=actual_downloaded_files,
+                        total=actual_downloaded_files,
+                    )
+                    return responses
+        else:
+            total_files = len(list(dialects))
+
+            task = progress.add_task(
+                description=(
+                    f"Preparing to download and parse latest "
+                    f"reports of {id} for {pretty_names_str}"
+                ),
+                total=total_files,
+            )
+
+            async def download_and_parse_latest_report_for(dialect: Dialect):
+                try:
+                    response = await dialect.latest_report()
                     response.raise_for_status()
                     progress.update(
                         task,
                         description=(
                             f"Downloading and Parsing: "
-                            f"v{version}/{dialect.short_name}.json"
+                            f"latest/{dialect.short_name}.json"
                         ),
                     )
                 except httpx.HTTPStatusError:
                     report = _report.Report.empty(dialect=dialect)
                     progress.update(task, advance=1)
-                    return version, dialect, report
+                    return "latest", dialect, report
                 else:
-                    nonlocal actual_downloaded_files
-                    actual_downloaded_files += 1
-
-                    report = _report.Report.from_serialized(
-                        response.iter_lines(),
-                    )
+                    report = await parse(response.text)
                     progress.update(task, advance=1)
-                    return version, dialect, report
+                    return "latest", dialect, report
 
             with progress:
                 responses = await asyncio.gather(
                     *[
-                        download_and_parse_versioned_report_for(
-                            version,
-                            dialect,
-                        )
-                        for version in versions
+                        download_and_parse_latest_report_for(dialect)
                         for dialect in dialects
                     ],
                 )
@@ -2020,68 +2517,22 @@ async def download_and_parse_reports_for(
                 progress.update(
                     task,
                     description=(
-                        "Successfully downloaded and parsed all versioned "
+                        f"Successfully downloaded and parsed all latest "
                         f"reports of {id} for {pretty_names_str}!"
                     ),
-                    completed=actual_downloaded_files,
-                    total=actual_downloaded_files,
+                    completed=total_files,
+                    total=total_files,
                 )
                 return responses
-    else:
-        total_files = len(list(dialects))
-
-        task = progress.add_task(
-            description=(
-                f"Preparing to download and parse latest "
-                f"reports of {id} for {pretty_names_str}"
-            ),
-            total=total_files,
-        )
-
-        async def download_and_parse_latest_report_for(dialect: Dialect):
-            try:
-                response = await dialect.latest_report()
-                response.raise_for_status()
-                progress.update(
-                    task,
-                    description=(
-                        f"Downloading and Parsing: "
-                        f"latest/{dialect.short_name}.json"
-                    ),
-                )
-            except httpx.HTTPStatusError:
-                report = _report.Report.empty(dialect=dialect)
-                progress.update(task, advance=1)
-                return "latest", dialect, report
-            else:
-                report = _report.Report.from_serialized(response.iter_lines())
-                progress.update(task, advance=1)
-                return "latest", dialect, report
-
-        with progress:
-            responses = await asyncio.gather(
-                *[
-                    download_and_parse_latest_report_for(dialect)
-                    for dialect in dialects
-                ],
-            )
-
-            progress.update(
-                task,
-                description=(
-                    f"Successfully downloaded and parsed all latest "
-                    f"reports of {id} for {pretty_names_str}!"
-                ),
-                completed=total_files,
-                total=total_files,
-            )
-            return responses
 
 
 def _trend_table_for(
     id: ConnectableId,
     versions: Set[str],
-    dialects_trend: dict[Dialect, _report.Report],
+    dialects_trend: dict[
+        Dialect,
+        _report.Report | _columnar.ColumnarReport | _columnar.Versions,
+    ],
 ) -> Table:
     main_table = Table(show_lines=True)
     main_table.add_column(
@@ -2134,7 +2585,10 @@ def _trend_table_for(
 def _trend_table_in_markdown_for(
     id: ConnectableId,
     versions: Set[str],
-    dialects_trend: dict[Dialect, _report.Report],
+    dialects_trend: dict[
+        Dialect,
+        _report.Report | _columnar.ColumnarReport | _columnar.Versions,
+    ],
 ) -> str:
     rows_data: list[list[str]] = []
 
@@ -2191,6 +2645,21 @@ def _trend_table_in_markdown_for(
     )
 
 
+def _versioned_report_from(
+    file: IO[bytes],
+    validate: bool,
+) -> _report.Report | _columnar.ColumnarReport:
+    """
+    Read a report from within a tar, which may be columnar or compressed.
+    """
+    if _columnar.is_columnar(file):
+        return _columnar.ColumnarReport.from_buffer(file.read())
+    return _report.Report.from_serialized(
+        TextIOWrapper(_compression.decompressed(file), encoding="utf-8"),
+        validate=validate,
+    )
+
+
 class _VersionedReportsTar(click.File):
     """
     Select a tar containing previously produced versioned Bowtie reports.
@@ -2204,13 +2673,19 @@ class _VersionedReportsTar(click.File):
         value: str | PathLike[str] | IO[Any],
         param: click.Parameter | None,
         ctx: click.Context,
-    ) -> tuple[frozenset[str], Iterable[tuple[str, Dialect, _report.Report]]]:
+    ) -> tuple[
+        frozenset[str],
+        Iterable[
+            tuple[str, Dialect, _report.Report | _columnar.ColumnarReport]
+        ],
+    ]:
         input = super().convert(value, param, ctx)
 
         id = cast(
             "_connectables.Connectable",
             ctx.params.get("connectable"),
         ).to_terse()
+        validate = _should_validate_reports()
 
         try:
             with tarfile.open(fileobj=input) as tar:
@@ -2276,7 +2751,11 @@ class _VersionedReportsTar(click.File):
 
                 actual_parsed_files = 0
                 versioned_reports: Iterable[
-                    tuple[str, Dialect, _report.Report]
+                    tuple[
+                        str,
+                        Dialect,
+                        _report.Report | _columnar.ColumnarReport,
+                    ]
                 ] = []
 
                 with progress:
@@ -2307,11 +2786,9 @@ class _VersionedReportsTar(click.File):
                                         (
                                             version,
                                             dialect,
-                                            _report.Report.from_serialized(
-                                                TextIOWrapper(
-                                                    report_content,
-                                                    encoding="utf-8",
-                                                ),
+                                            _versioned_report_from(
+                                                report_content,
+                                                validate=validate,
                                             ),
                                         ),
                                     )
@@ -2370,6 +2847,7 @@ class _VersionedReportsTar(click.File):
     type=_VersionedReportsTar(mode="rb"),
     required=False,
 )
+@VALIDATE_REPORT
 @format_option()
 def trend(
     connectable: Connectable,
@@ -2377,7 +2855,9 @@ def trend(
     versioned_reports_tar: (
         tuple[
             frozenset[str],
-            Iterable[tuple[str, Dialect, _report.Report]],
+            Iterable[
+                tuple[str, Dialect, _report.Report | _columnar.ColumnarReport]
+            ],
         ]
         | None
     ),
@@ -2400,6 +2880,7 @@ def trend(
                     id,
                     versions,
                     dialects,
+                    validate=_should_validate_reports(),
                 )
             )
             return versions, downloaded_versioned_reports
@@ -2417,15 +2898,17 @@ def trend(
         )
         return
 
+    dialects_trend: dict[
+        Dialect,
+        _report.Report | _columnar.ColumnarReport | _columnar.Versions,
+    ]
     if versions:
-        combine_versioned_reports_for = (
-            _report.Report.combine_versioned_reports_for
-        )
         dialects_trend = {
             dialect: combined_versions_report
             for dialect in sorted(dialects, reverse=True)
             if (
-                combined_versions_report := combine_versioned_reports_for(
+                combined_versions_report
+                := _columnar.combine_versioned_reports_for(
                     [report for _, _, report in versioned_reports],
                     dialect,
                 )
@@ -2640,6 +3123,9 @@ def _run_suite(
 @SET_SCHEMA
 @VALIDATE
 @JOBS
+@INSTANCES
+@WORK_STEALING
+@WRITE_INDEX
 @click.argument("input", type=_suite.ClickParam(), metavar="DIALECT")
 def suite(
     input: tuple[Iterable[TestCase], Dialect, dict[str, Any]],
@@ -2690,6 +3176,9 @@ def suite(
 @SET_SCHEMA
 @VALIDATE
 @JOBS
+@INSTANCES
+@WORK_STEALING
+@WRITE_INDEX
 @click.argument(
     "input",
     type=_suite.ClickParam(is_annotations=True),
@@ -2770,6 +3259,7 @@ def site() -> None:
         "unavailable are skipped."
     ),
 )
+@COMPRESS
 @click.pass_context
 def collect(
     context: click.Context,
@@ -2779,6 +3269,7 @@ def collect(
     output: Path,
     suite_source: str | None,
     versioned: bool,
+    compression: _compression.Compression | None,
 ) -> None:
     """
     Run the official test suite against a single implementation.
@@ -2850,6 +3341,7 @@ def collect(
                     maybe_set_schema=maybe_set_schema,
                     registry=registry,
                     output=output,
+                    compression=compression,
                 ),
             ),
         )
@@ -2864,6 +3356,7 @@ def collect(
                 maybe_set_schema=maybe_set_schema,
                 registry=registry,
                 output=output,
+                compression=compression,
             ),
         ),
     )
@@ -2876,6 +3369,7 @@ async def _collect_dialects(
     maybe_set_schema: Callable[[Dialect], CaseTransform],
     run_metadata: dict[str, Any],
     output: Path,
+    compression: _compression.Compression | None = None,
 ) -> tuple[int, bool]:
     """
     Write one report per supported dialect for a started implementation.
@@ -2899,16 +3393,17 @@ async def _collect_dialects(
             STDERR.print(error)
             continue
 
-        report = await _run_cases(
-            runner=runner,
+        collector = _report.ReportCollector(reporter=SILENT)
+        await _run_cases(
+            runners=[runner],
             dialect=dialect,
             cases=cases,
             implementations={implementation.report_id: implementation.info},
             maybe_set_schema=maybe_set_schema,
+            reporter=collector,
             run_metadata=run_metadata,
         )
-        if report is None:
-            continue
+        report = collector.report()
 
         ((_, _, unsuccessful),) = report.worst_to_best()
         if len(unsuccessful.errored) == report.total_tests:
@@ -2934,9 +3429,8 @@ async def _collect_dialects(
             continue
 
         output.mkdir(parents=True, exist_ok=True)  # noqa: ASYNC240
-        output.joinpath(f"{dialect.short_name}.json").write_text(
-            "\n".join(report.serialized()),
-        )
+        with _report_path(output, dialect, compression).open("wb") as file:
+            report.write(file, compression=compression)
         wrote += 1
     return wrote, all_errored
 
@@ -2948,6 +3442,7 @@ async def _collect(
     maybe_set_schema: Callable[[Dialect], CaseTransform],
     registry: ValidatorRegistry[Any],
     output: Path,
+    compression: _compression.Compression | None = None,
 ) -> int:
     """
     Collect one report per supported dialect for a single implementation.
@@ -2976,6 +3471,7 @@ async def _collect(
             maybe_set_schema=maybe_set_schema,
             run_metadata=run_metadata,
             output=output,
+            compression=compression,
         )
 
     if all_errored:
@@ -3008,6 +3504,7 @@ async def _collect_versions(
     maybe_set_schema: Callable[[Dialect], CaseTransform],
     registry: ValidatorRegistry[Any],
     output: Path,
+    compression: _compression.Compression | None = None,
 ) -> int:
     """
     Collect a per-version compliance trend for a single implementation.
@@ -3062,6 +3559,7 @@ async def _collect_versions(
                 maybe_set_schema=maybe_set_schema,
                 run_metadata=run_metadata,
                 output=output.joinpath(f"v{version}"),
+                compression=compression,
             )
             saw_all_errored |= all_errored
         if wrote:
@@ -3087,6 +3585,18 @@ async def _collect_versions(
     type=click.Path(path_type=Path, file_okay=False, dir_okay=True),
     help="A directory to write the combined site data into.",
 )
+@click.option(
+    "--update",
+    "update",
+    is_flag=True,
+    help=(
+        "Update previously combined site data in the output directory rather "
+        "than writing it afresh. The results of each implementation in the "
+        "collected reports replace any it previously had, and only the "
+        "dialect reports and badges it affects are rewritten."
+    ),
+)
+@COMPRESS
 @click.argument(
     "collected",
     nargs=-1,
@@ -3098,6 +3608,8 @@ def site_combine(
     context: click.Context,
     collected: tuple[Path, ...],
     output: Path,
+    update: bool,
+    compression: _compression.Compression | None,
 ) -> None:
     """
     Combine collected per-implementation reports into the site's data.
@@ -3110,41 +3622,65 @@ def site_combine(
     ``badges`` are written for each implementation, and the public API data
     under ``api/`` too. All of this is read from the reports themselves,
     without starting any implementation.
+
+    Collected reports may be compressed.
     """
-    context.exit(_combine(collected=collected, output=output))
+    combine = _update if update else _combine
+    context.exit(
+        combine(collected=collected, output=output, compression=compression),
+    )
 
 
-def _combine(collected: tuple[Path, ...], output: Path) -> int:
-    try:
-        output.mkdir(parents=True)
-    except FileExistsError:
-        error = DiagnosticError(
-            code="already-exists",
-            message="The output directory already exists.",
-            causes=[f"{output} is an existing directory."],
-            hint_stmt=(
-                "If you intended to replace its contents, "
-                "delete the directory first."
-            ),
-        )
-        STDERR.print(error)
-        return EX.CONFIG
+def _report_path(
+    directory: Path,
+    dialect: Dialect,
+    compression: _compression.Compression | None,
+) -> Path:
+    """
+    Where the report for the given dialect lives within a directory.
+    """
+    suffix = "" if compression is None else _compression.SUFFIXES[compression]
+    return directory / f"{dialect.short_name}.json{suffix}"
+
+
+def _existing_report_path(directory: Path, dialect: Dialect) -> Path | None:
+    """
+    Where a (possibly compressed) report for the given dialect lives, if any.
+    """
+    for compression in None, *_compression.SUFFIXES:
+        path = _report_path(directory, dialect, compression)
+        if path.is_file():
+            return path
+    return None
+
 
+def _collected_by_dialect(
+    collected: Iterable[Path],
+) -> dict[Dialect, list[_report.Report]]:
+    """
+    Read each (non-empty) collected report, grouped by dialect.
+    """
+    suffixes = (
+        ".json",
+        *(f".json{suffix}" for suffix in _compression.SUFFIXES.values()),
+    )
     paths: list[Path] = []
     for each in collected:
         if each.is_dir():
-            paths.extend(sorted(each.glob("*.json")))
+            paths.extend(
+                sorted(
+                    path
+                    for path in each.iterdir()
+                    if path.name.endswith(suffixes)
+                ),
+            )
         else:
             paths.append(each)
 
     by_dialect: dict[Dialect, list[_report.Report]] = {}
-    infos: dict[str, ImplementationInfo] = {}
-    for path in paths:
-        report = _report.Report.from_serialized(path.read_text().splitlines())
-        if report.is_empty:
-            continue
-        by_dialect.setdefault(report.metadata.dialect, []).append(report)
-        infos.update(report.metadata.implementations)
+    for report in _report.Report.from_each_serialized(paths):
+        if not report.is_empty:
+            by_dialect.setdefault(report.metadata.dialect, []).append(report)
 
     if not by_dialect:
         error = DiagnosticError(
@@ -3154,43 +3690,85 @@ def _combine(collected: tuple[Path, ...], output: Path) -> int:
             hint_stmt="Check that `bowtie site collect` produced output.",
         )
         STDERR.print(error)
-        return EX.DATAERR
+    return by_dialect
 
-    for dialect, reports in by_dialect.items():
-        try:
-            combined = _report.Report.combine(*reports)
-        except (
-            _report.DuplicateImplementation,
-            _report.InconsistentCases,
-        ) as err:
-            error = DiagnosticError(
-                code="cannot-combine",
-                message=f"Cannot combine the {dialect.short_name} reports.",
-                causes=[str(err)],
-                hint_stmt=(
-                    "Ensure each implementation is collected once, and that "
-                    "all reports for a dialect ran against the same suite."
-                ),
-            )
-            STDERR.print(error)
-            return EX.DATAERR
-        output.joinpath(f"{dialect.short_name}.json").write_text(
-            "\n".join(combined.serialized()),
+
+def _combined(
+    dialect: Dialect,
+    reports: Sequence[_report.Report],
+) -> _report.Report | None:
+    """
+    Combine the reports for a dialect, or explain why they cannot be.
+    """
+    try:
+        return _report.Report.combine(*reports)
+    except (
+        _report.DuplicateImplementation,
+        _report.InconsistentCases,
+    ) as err:
+        error = DiagnosticError(
+            code="cannot-combine",
+            message=f"Cannot combine the {dialect.short_name} reports.",
+            causes=[str(err)],
+            hint_stmt=(
+                "Ensure each implementation is collected once, and that "
+                "all reports for a dialect ran against the same suite."
+            ),
         )
-        # Badges live under both the report id -- how the site, reports and
-        # version trends refer to an implementation -- and the self-reported
-        # id, kept so pre-existing badge URLs (in harness READMEs) don't break.
-        for id, info, badge in combined.compliance_badges():
-            for badge_id in {id, info.id}:
-                compliance = output / "badges" / badge_id / "compliance"
-                compliance.mkdir(parents=True, exist_ok=True)
-                compliance.joinpath(f"{dialect.short_name}.json").write_text(
-                    json.dumps(badge),
-                )
+        STDERR.print(error)
+        return None
+
+
+def _badge_ids(id: ConnectableId, info: ImplementationInfo) -> set[str]:
+    """
+    Where an implementation's badges live.
 
-    for id, info in infos.items():
+    Badges live under both the report id -- how the site, reports and version
+    trends refer to an implementation -- and the self-reported id, kept so
+    pre-existing badge URLs (in harness READMEs) don't break.
+    """
+    return {id, info.id}
+
+
+def _write_combined(
+    output: Path,
+    combined: _report.Report,
+    compression: _compression.Compression | None,
+    ids: Container[ConnectableId] | None = None,
+) -> None:
+    """
+    Write a combined report, and compliance badges for its implementations.
+
+    Badges are written only for those with the given ids, if any are given.
+    """
+    dialect = combined.metadata.dialect
+    with _report_path(output, dialect, compression).open("wb") as file:
+        combined.write(file, compression=compression)
+    for id, info, badge in combined.compliance_badges():
+        if ids is not None and id not in ids:
+            continue
+        for badge_id in _badge_ids(id, info):
+            compliance = output / "badges" / badge_id / "compliance"
+            compliance.mkdir(parents=True, exist_ok=True)
+            compliance.joinpath(f"{dialect.short_name}.json").write_text(
+                json.dumps(badge),
+            )
+
+
+def _write_implementations(
+    output: Path,
+    infos: Mapping[ConnectableId, ImplementationInfo],
+    ids: Iterable[ConnectableId],
+) -> None:
+    """
+    Write data about all implementations, and some of their badges.
+
+    Supported version badges are written for those with the given ids.
+    """
+    for id in ids:
+        info = infos[id]
         badge = _report.supported_version_badge(dialects=info.dialects)
-        for badge_id in {id, info.id}:
+        for badge_id in _badge_ids(id, info):
             directory = output / "badges" / badge_id
             directory.mkdir(parents=True, exist_ok=True)
             directory.joinpath("supported_versions.json").write_text(
@@ -3209,6 +3787,41 @@ def _combine(collected: tuple[Path, ...], output: Path) -> int:
 
     _write_api(output=output, infos=infos)
 
+
+def _combine(
+    collected: tuple[Path, ...],
+    output: Path,
+    compression: _compression.Compression | None = None,
+) -> int:
+    try:
+        output.mkdir(parents=True)
+    except FileExistsError:
+        error = DiagnosticError(
+            code="already-exists",
+            message="The output directory already exists.",
+            causes=[f"{output} is an existing directory."],
+            hint_stmt=(
+                "If you intended to replace its contents, "
+                "delete the directory first (or use --update)."
+            ),
+        )
+        STDERR.print(error)
+        return EX.CONFIG
+
+    by_dialect = _collected_by_dialect(collected)
+    if not by_dialect:
+        return EX.DATAERR
+
+    infos: dict[ConnectableId, ImplementationInfo] = {}
+    for dialect, reports in by_dialect.items():
+        combined = _combined(dialect, reports)
+        if combined is None:
+            return EX.DATAERR
+        _write_combined(output, combined, compression=compression)
+        infos.update(combined.implementations)
+
+    _write_implementations(output=output, infos=infos, ids=infos)
+
     dialects = _inflect_engine.plural("dialect", len(by_dialect))  # type: ignore[reportArgumentType]
     STDERR.print(
         f"Combined [green]{len(infos)}[/] implementations across "
@@ -3217,7 +3830,102 @@ def _combine(collected: tuple[Path, ...], output: Path) -> int:
     return 0
 
 
-def _write_api(output: Path, infos: dict[str, ImplementationInfo]) -> None:
+def _update(
+    collected: tuple[Path, ...],
+    output: Path,
+    compression: _compression.Compression | None = None,
+) -> int:
+    """
+    Replace the results of some implementations within combined site data.
+
+    Cases are matched up just as `Report.combine` does, keeping the
+    previously combined report's seqs. Dialect reports and badges for any
+    implementation not being replaced are left untouched.
+    """
+    implementations = output / "implementations.json"
+    if not implementations.is_file():
+        error = DiagnosticError(
+            code="not-combined",
+            message="There is no previously combined site data to update.",
+            causes=[f"{output} has no implementations.json."],
+            hint_stmt="Run `bowtie site combine` without --update first.",
+        )
+        STDERR.print(error)
+        return EX.CONFIG
+
+    by_dialect = _collected_by_dialect(collected)
+    if not by_dialect:
+        return EX.DATAERR
+
+    infos = {
+        id: ImplementationInfo.from_dict(**info)
+        for id, info in json.loads(implementations.read_text()).items()
+    }
+    updated = {
+        id: info
+        for reports in by_dialect.values()
+        for report in reports
+        for id, info in report.implementations.items()
+    }
+
+    # An updated implementation may have dropped support for a dialect it
+    # previously had results for, which then need removing.
+    affected = set(by_dialect)
+    for id in updated.keys() & infos.keys():
+        affected.update(infos[id].dialects)
+
+    for dialect in sorted(affected, reverse=True):
+        reports = by_dialect.get(dialect, [])
+        dropped: dict[ConnectableId, ImplementationInfo] = {}
+        previous_path = _existing_report_path(output, dialect)
+        if previous_path is not None:
+            with previous_path.open("rb") as file:
+                previous = _report.Report.from_file(file)
+            replaced = updated.keys() & previous.implementations.keys()
+            if not replaced and not reports:
+                continue
+            dropped = {
+                id: previous.implementations[id]
+                for id in replaced.difference(
+                    id for report in reports for id in report.implementations
+                )
+            }
+            kept = previous.only(
+                id for id in previous.implementations if id not in updated
+            )
+            reports = [kept, *reports]
+
+        if not reports:
+            continue
+        combined = _combined(dialect, reports)
+        if combined is None:
+            return EX.DATAERR
+        if previous_path is not None:
+            previous_path.unlink()
+        if combined.implementations:
+            _write_combined(output, combined, compression, ids=updated)
+        for id, info in dropped.items():
+            for badge_id in _badge_ids(id, info):
+                compliance = output / "badges" / badge_id / "compliance"
+                compliance.joinpath(f"{dialect.short_name}.json").unlink(
+                    missing_ok=True,
+                )
+
+    infos.update(updated)
+    _write_implementations(output=output, infos=infos, ids=updated)
+
+    dialects = _inflect_engine.plural("dialect", len(affected))  # type: ignore[reportArgumentType]
+    STDERR.print(
+        f"Updated [green]{len(updated)}[/] implementations across "
+        f"[green]{len(affected)}[/] {dialects} in {output}.",
+    )
+    return 0
+
+
+def _write_api(
+    output: Path,
+    infos: Mapping[ConnectableId, ImplementationInfo],
+) -> None:
     """
     Write the public API data (consumed by json-schema.org).
 
@@ -3252,66 +3960,145 @@ def _write_api(output: Path, infos: dict[str, ImplementationInfo]) -> None:
     }
 
     api_dir = output / "api" / "v1" / "json-schema-org"
-    api_dir.mkdir(parents=True)
+    api_dir.mkdir(parents=True, exist_ok=True)
     api_dir.joinpath("implementations").write_text(json.dumps(api, indent=2))
 
 
 async def _run_cases(
-    runner: DialectRunner,
+    runners: Sequence[DialectRunner],
     dialect: Dialect,
     cases: Iterable[TestCase],
     implementations: Mapping[ConnectableId, ImplementationInfo],
     maybe_set_schema: Callable[[Dialect], CaseTransform],
+    reporter: _report.Reporter | _report.ReportCollector,
     run_metadata: dict[str, Any] = {},
-    reporter: _report.Reporter = SILENT,
     max_fail: int | None = None,
     max_error: int | None = None,
     time_output_file: Path | None = None,
     output: OutputFormat = "flag",
-) -> _report.Report | None:
+    recruit: (
+        Callable[[], Coroutine[Any, Any, DialectRunner | None]] | None
+    ) = None,
+) -> int:
     """
-    Run cases against an already-speaking runner, returning a Report.
+    Run cases against already-speaking runners, reporting as results arrive.
+
+    The runners should all be instances of the same implementation, each of
+    which takes the next case whenever it finishes its last. Cases are
+    numbered in the order given regardless of which runner ran them.
 
-    Returns `None` if there were no cases to run. When `time_output_file` is
-    set, the implementation's cumulative per-case wall time is appended to it
-    (used by `bowtie perf`).
+    If `recruit` is provided, it is called (one at a time) for additional
+    runners to join in for as long as cases remain, until it returns `None`.
+
+    Returns how many cases were run. When `time_output_file` is set, the
+    implementation's cumulative per-case wall time is appended to it (used
+    by `bowtie perf`).
     """
-    metadata = _report.RunMetadata(
-        implementations=implementations,
-        dialect=dialect,
-        metadata=run_metadata,
-    )
-    lines: list[dict[str, Any]] = [metadata.serializable()]
     count = 0
     should_stop = False
-    unsuccessful = Unsuccessful()
+    failed = errored = 0
     time_taken = 0
 
-    for count, case in enumerate(maybe_set_schema(dialect)(cases), 1):
-        seq_case = SeqCase(seq=count, case=case, output=output)
-        got_result = reporter.case_started(seq_case, dialect)
-        st_time = perf_counter_ns()
-        result = await seq_case.run(runner=runner)
-        time_taken += perf_counter_ns() - st_time
-        got_result(result=result)
-        lines.append(seq_case.serializable())
-        lines.append(result.serializable())
-        unsuccessful += result.unsuccessful()
-        if (max_fail and len(unsuccessful.failed) >= max_fail) or (
-            max_error and len(unsuccessful.errored) >= max_error
-        ):
-            should_stop = True
-            break
+    # Harnesses which pipeline may respond out of order, so we remember
+    # whom to tell about each result until it arrives.
+    got_results: dict[Seq, Callable[..., None]] = {}
+
+    exhausted = False
+
+    def seq_cases():
+        nonlocal count, exhausted
+        for count, case in enumerate(maybe_set_schema(dialect)(cases), 1):
+            seq_case = SeqCase(seq=count, case=case, output=output)
+            got_results[count] = reporter.case_started(seq_case, dialect)
+            yield seq_case
+        exhausted = True
+
+    shared = seq_cases()
+
+    async def run(runner: DialectRunner):
+        nonlocal should_stop, time_taken, failed, errored
+        async with aclosing(runner.validate_all(shared)) as results:
+            st_time = perf_counter_ns()
+            async for seq_case, result in results:
+                time_taken += perf_counter_ns() - st_time
+                got_results.pop(seq_case.seq)(result=result)
+                unsuccessful = result.unsuccessful()
+                failed += len(unsuccessful.failed)
+                errored += len(unsuccessful.errored)
+                if (max_fail and failed >= max_fail) or (
+                    max_error and errored >= max_error
+                ):
+                    should_stop = True
+                if should_stop:
+                    break
+                st_time = perf_counter_ns()
+
+    reporter.ready(
+        _report.RunMetadata(
+            implementations=implementations,
+            dialect=dialect,
+            metadata=run_metadata,
+        ),
+    )
 
-    lines.append({"did_fail_fast": should_stop})
+    used = list(runners)
+    running = {asyncio.create_task(run(runner)) for runner in runners}
+    recruiting: asyncio.Task[DialectRunner | None] | None = None
+    try:
+        while running:
+            if not (recruit is None or recruiting or exhausted or should_stop):
+                recruiting = asyncio.create_task(recruit())
+            done, _ = await asyncio.wait(
+                running if recruiting is None else {*running, recruiting},
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                if task is recruiting:
+                    recruiting, runner = None, task.result()
+                    if runner is None:
+                        recruit = None
+                    else:
+                        used.append(runner)
+                        running.add(asyncio.create_task(run(runner)))
+                else:
+                    running.remove(task)  # type: ignore[reportArgumentType]
+                    task.result()
+    finally:
+        for task in running:
+            task.cancel()
+        if recruiting is not None:
+            recruiting.cancel()
+
+    # How long restarts took, the harness took to prepare schemas registered
+    # with it, or which responses were slower than predicted, is only known
+    # once the run is over, so comes last.
+    implementation = next(iter(implementations))
+    finished_metadata: dict[str, Any] = {}
+    restarts = sum((runner.restarts for runner in used), Restarts())
+    if restarts:
+        finished_metadata["restarts"] = {
+            implementation: restarts.serializable(),
+        }
+    registrations = sum(
+        (runner.registrations for runner in used),
+        Registrations(),
+    )
+    if registrations:
+        finished_metadata["registrations"] = {
+            implementation: registrations.serializable(),
+        }
+    slow = sum((runner.slow_responses for runner in used), SlowResponses())
+    if slow:
+        finished_metadata["slow_responses"] = {
+            implementation: slow.serializable(),
+        }
+    reporter.finished(did_fail_fast=should_stop, metadata=finished_metadata)
 
     if time_output_file:
         with time_output_file.open("a") as file:
             file.write(f"{time_taken}\n")
 
-    if count == 0:
-        return None
-    return _report.Report.from_input(lines)
+    return count
 
 
 async def _run_one(
@@ -3323,34 +4110,76 @@ async def _run_one(
     max_error: int | None = None,
     run_metadata: dict[str, Any] = {},
     output: OutputFormat = "flag",
+    instances: int = 1,
+    spare: Callable[[], AbstractAsyncContextManager[None]] | None = None,
+    reporter: _report.Reporter = SILENT,
     **kwargs: Any,
-) -> tuple[int, _report.Report | None]:
-    """
-    Run a single implementation through all cases, returning a Report.
+) -> int:
     """
-    # Log warnings to stderr but don't write report lines anywhere.
-    reporter = SILENT
+    Run a single implementation through all cases, reporting its results.
 
-    async with _start(
-        connectables=[connectable],
-        reporter=reporter,
-        **kwargs,
-    ) as starting:
-        (started,) = starting
-        try:
-            _, implementation = await started
-        except STARTUP_ERRORS as error:
-            STDERR.print(error)
-            return EX.CONFIG, None
+    With multiple ``instances``, that many copies of the implementation are
+    started, and the cases shared between them. If ``spare`` is provided,
+    further instances are started whenever it yields a spare job slot.
+
+    Returns a non-zero exit code only if the implementation never ran, in
+    which case nothing was reported.
+    """
+    async with AsyncExitStack() as stack:
+        starting = await stack.enter_async_context(
+            _start(
+                connectables=[connectable] * instances,
+                reporter=reporter,
+                **kwargs,
+            ),
+        )
+        started: list[Implementation] = []
+        for each in starting:
+            try:
+                _, implementation = await each
+            except STARTUP_ERRORS as error:
+                STDERR.print(error)
+                return EX.CONFIG
+            started.append(implementation)
+        implementation = started[0]
+
+        run_metadata = {
+            **run_metadata,
+            "startup_sec": {
+                implementation.report_id: [
+                    round(each.startup_sec, 3) for each in started
+                ],
+            },
+        }
 
         try:
-            runner = await implementation.start_speaking(dialect)
+            runners = [await each.start_speaking(dialect) for each in started]
         except DialectError as error:
             STDERR.print(error)
-            return EX.CONFIG, None
+            return EX.CONFIG
         except UnsupportedDialect as error:
             STDERR.print(error)
-            return _SKIP, None
+            return _SKIP
+
+        async def recruit(
+            spare: Callable[[], AbstractAsyncContextManager[None]],
+        ):
+            await stack.enter_async_context(spare())
+            (starting,) = await stack.enter_async_context(
+                _start(
+                    connectables=[connectable],
+                    reporter=reporter,
+                    **kwargs,
+                ),
+            )
+            try:
+                _, another = await starting
+                return await another.start_speaking(dialect)
+            except (*STARTUP_ERRORS, DialectError, UnsupportedDialect):
+                return None
+
+        if not cases:
+            return EX.NOINPUT
 
         # Used by bowtie perf to measure implementation time.
         time_output_file = (
@@ -3359,8 +4188,9 @@ async def _run_one(
             else None
         )
 
-        report = await _run_cases(
-            runner=runner,
+        await _run_cases(
+            runners=runners,
+            recruit=None if spare is None else partial(recruit, spare),
             dialect=dialect,
             cases=cases,
             implementations={implementation.report_id: implementation.info},
@@ -3372,10 +4202,35 @@ async def _run_one(
             time_output_file=time_output_file,
             output=output,
         )
+    return 0
+
+
+@mutable
+class _JobSlots:
+    """
+    A limited number of concurrent jobs, shared out between implementations.
 
-    if report is None:
-        return EX.NOINPUT, None
-    return 0, report
+    Each implementation first gets a slot of its own. Only once every one of
+    them has had one are slots lent out as spares.
+    """
+
+    _semaphore: asyncio.Semaphore = field(alias="semaphore")
+    _unstarted: int = field(alias="unstarted")
+    _all_started: asyncio.Event = field(factory=asyncio.Event)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncGenerator[None]:
+        async with self._semaphore:
+            self._unstarted -= 1
+            if self._unstarted <= 0:
+                self._all_started.set()
+            yield
+
+    @asynccontextmanager
+    async def spare(self) -> AsyncGenerator[None]:
+        await self._all_started.wait()
+        async with self._semaphore:
+            yield
 
 
 async def _run_parallel(
@@ -3385,55 +4240,65 @@ async def _run_parallel(
     jobs: int,
     fail_fast: bool = False,
     output: OutputFormat = "flag",
+    work_stealing: bool = False,
+    write_index: TextIO | None = None,
     **kwargs: Any,
 ) -> int:
     """
-    Run each implementation individually, gated by a semaphore, then combine.
+    Run each implementation individually, gated by job slots, into one report.
+
+    Report lines are written as results arrive from any implementation.
+    When work stealing, slots freed by implementations which have finished
+    are used to start more instances of those still running.
+    An index of the report is also written if one is asked for.
     """
+    # Every run is of these same cases in this same order, which the writer
+    # relies on to write each case only once.
     materialized = list(cases)
-    semaphore = asyncio.Semaphore(jobs)
+    connectables = list(connectables)
+    slots = _JobSlots(
+        semaphore=asyncio.Semaphore(jobs),
+        unstarted=len(connectables),
+    )
+    indexer = None if write_index is None else _index.ReportIndexer()
+    writer = _report.ReportWriter(
+        write=click.echo,
+        expecting=len(connectables),
+        indexer=indexer,
+    )
 
     async def run_with_limit(connectable: Connectable):
-        async with semaphore:
-            return await _run_one(
+        async with slots.slot():
+            code = await _run_one(
                 connectable=connectable,
                 cases=materialized,
                 dialect=dialect,
                 output=output,
+                spare=slots.spare if work_stealing else None,
+                reporter=writer.reporter(),
                 **kwargs,
             )
+        if code:
+            writer.dropped()
+        return code
 
     tasks = [run_with_limit(c) for c in connectables]
     results = await asyncio.gather(*tasks)
 
     exit_code = 0
-    reports: list[_report.Report] = []
-    no_cases = False
-    for code, report in results:
-        if report is not None:
-            exit_code |= code
-            reports.append(report)
-        elif code == _SKIP:
-            pass
-        elif code == EX.NOINPUT:
-            exit_code |= code
-            no_cases = True
-        else:
+    for code in results:
+        if code != _SKIP:
             exit_code |= code
 
-    if not reports:
-        if no_cases:
+    if not writer.wrote_header:
+        if EX.NOINPUT in results:
             STDERR.print("[bold red]No test cases ran.[/]")
-        else:
-            STDERR.print(
-                "[bold red]No implementations started successfully![/]",
-            )
-            exit_code |= EX.CONFIG
-        return exit_code
+            return exit_code
+        STDERR.print("[bold red]No implementations started successfully![/]")
+        return exit_code | EX.CONFIG
 
-    combined = _report.Report.combine(*reports)
-    for line in combined.serialized():
-        click.echo(line)
+    if write_index is not None and indexer is not None:
+        write_index.write(indexer.index().serialized())
 
     if len(materialized) > 1:
         STDERR.print(f"Ran [green]{len(materialized)}[/] test cases.")
@@ -0,0 +1,633 @@
+"""
+A columnar (and memory-mappable) format for large Bowtie reports.
+
+Reports are normally JSON Lines, which must be parsed into an object per
+result before anything at all can be asked of them. This format instead
+keeps results in fixed-width columns -- one row per case result, and one
+entry per test within it -- so that a report can be memory-mapped and
+(for instance) its unsuccessful tests counted without creating objects for
+the vast majority of results, which are unremarkable.
+
+Anything the columns cannot represent (error contexts, skip messages,
+annotations, and the cases and their registries) lives in a side table of JSON
+blobs, so that conversion to and from JSON Lines is lossless.
+
+A file is laid out as:
+
+    * `MAGIC`
+    * the side table of JSON blobs, written as the report is read
+    * each column, aligned to 8 bytes
+    * a JSON header, describing the report and where each column is
+    * a trailer holding the header's offset and length
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Any, Literal
+import json
+import mmap
+import struct
+import sys
+
+from attrs import evolve, field, frozen
+
+from bowtie._commands import SeqResult, Unsuccessful
+from bowtie._core import sortable_version_key
+from bowtie._report import (
+    DuplicateCase,
+    EmptyReport,
+    InvalidReport,
+    MissingFooter,
+    Report,
+    validating,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+    from typing import IO, Self
+
+    from bowtie._commands import Seq
+    from bowtie._connectables import ConnectableId
+    from bowtie._core import Dialect, ImplementationInfo
+    from bowtie._report import RunMetadata
+
+
+#: How every columnar report begins.
+MAGIC = b"bowtie-columnar\n"
+
+_TRAILER = struct.Struct("<QQ")
+_ALIGNMENT = 8
+
+# How a whole case result turned out.
+_RAN, _ERRORED, _SKIPPED = range(3)
+
+# How each test turned out. The lowest bit is the validity of tests which ran.
+_INVALID, _VALID, _SKIPPED_TEST, _ERRORED_TEST = range(4)
+_ANNOTATED_INVALID, _ANNOTATED_VALID = range(4, 6)
+
+# What each test expected.
+_NO_EXPECTATION, _EXPECTED_INVALID, _EXPECTED_VALID, _ANNOTATIONS = range(4)
+_EXPECTATIONS: list[bool | None] = [None, False, True]
+
+#: Each column's (`array`) type, by name.
+_COLUMNS: dict[str, Literal["B", "I", "Q"]] = {
+    # one entry per case
+    "case_offset": "Q",
+    "case_length": "I",
+    "case_tests": "I",
+    "case_registry": "I",
+    # one entry per case result
+    "row_case": "I",
+    "row_implementation": "I",
+    "row_status": "B",
+    "row_first_result": "Q",
+    "row_results": "I",
+    "row_first_expected": "Q",
+    "row_expected": "I",
+    "row_extra_offset": "Q",
+    "row_extra_length": "I",
+    # one entry per test within a case result
+    "outcome": "B",
+    "expected": "B",
+}
+
+
+def is_columnar(file: IO[bytes]) -> bool:
+    """
+    Whether the given (peekable) file contains a columnar report.
+    """
+    peek = getattr(file, "peek", None)
+    if peek is None:
+        return False
+    return peek(len(MAGIC))[: len(MAGIC)] == MAGIC
+
+
+def write(
+    input: Iterable[Mapping[str, Any]],
+    file: IO[bytes],
+    validate: bool = True,
+) -> None:
+    """
+    Write report data (as `Report.from_input` takes) as a columnar report.
+
+    Only the (fixed-width) columns are held in memory whilst doing so.
+    """
+    validated = validating(validate)
+    iterator = iter(input)
+    header = next(iterator, None)
+    if header is None:
+        raise EmptyReport()
+    header = validated(header)
+
+    implementations = list(header["implementations"])
+    index_of = {id: i for i, id in enumerate(implementations)}
+    columns: dict[str, array[int]] = {
+        name: array(typecode) for name, typecode in _COLUMNS.items()
+    }
+
+    def append(name: str, value: int) -> None:
+        column = columns[name]
+        if not 0 <= value < 1 << 8 * column.itemsize:
+            raise InvalidReport(
+                f"{value} is too large for the {name} column of a "
+                "columnar report.",
+            )
+        column.append(value)
+
+    seqs: list[Seq] = []
+    cases: dict[Seq, int] = {}
+    registries: list[tuple[str, int, int]] = []
+    registry_index: dict[str, int] = {}
+
+    written = file.write(MAGIC)
+
+    def blob(data: Any) -> tuple[int, int]:
+        nonlocal written
+        encoded = json.dumps(data).encode()
+        offset = written
+        written += file.write(encoded)
+        return offset, len(encoded)
+
+    for data in iterator:
+        match validated(data):
+            case {"registry_id": id, "registry": registry}:
+                registry_index[id] = len(registries) + 1
+                registries.append((id, *blob(registry)))
+            case {"seq": seq, "case": case}:
+                if seq in cases:
+                    raise DuplicateCase(seq)
+                cases[seq] = len(seqs)
+                seqs.append(seq)
+                offset, length = blob(case)
+                append("case_offset", offset)
+                append("case_length", length)
+                append("case_tests", len(case["tests"]))
+                registry = 0
+                if "registry_id" in data:
+                    registry = registry_index.get(data["registry_id"])
+                    if registry is None:
+                        # A case sharing a registry we never saw.
+                        raise InvalidReport(data)
+                append("case_registry", registry)
+            case {"did_fail_fast": _}:
+                footer = data
+                break
+            case {
+                "seq": seq,
+                "implementation": implementation,
+                "expected": expected,
+                **result,
+            }:
+                status, outcomes, expectations, extra = _encoded(
+                    result=result,
+                    expected=expected,
+                )
+                if seq not in cases or implementation not in index_of:
+                    # A result for a case or implementation we never saw.
+                    raise InvalidReport(data)
+                offset, length = blob(extra) if extra else (0, 0)
+                append("row_case", cases[seq])
+                append("row_implementation", index_of[implementation])
+                append("row_status", status)
+                append("row_first_result", len(columns["outcome"]))
+                append("row_results", len(outcomes))
+                append("row_first_expected", len(columns["expected"]))
+                append("row_expected", len(expectations))
+                append("row_extra_offset", offset)
+                append("row_extra_length", length)
+                columns["outcome"].extend(outcomes)
+                columns["expected"].extend(expectations)
+            case _:
+                raise InvalidReport(data)
+    else:
+        raise MissingFooter()
+
+    locations: dict[str, tuple[int, int]] = {}
+    for name, column in columns.items():
+        written += file.write(b"\0" * (-written % _ALIGNMENT))
+        locations[name] = written, len(column)
+        written += file.write(column.tobytes())
+
+    described = json.dumps(
+        dict(
+            header=header,
+            footer=footer,
+            implementations=implementations,
+            seqs=seqs,
+            registries=registries,
+            byteorder=sys.byteorder,
+            columns=locations,
+        ),
+    ).encode()
+    file.write(described)
+    file.write(_TRAILER.pack(written, len(described)))
+
+
+def _encoded(
+    result: Mapping[str, Any],
+    expected: Sequence[Any],
+) -> tuple[int, list[int], list[int], dict[str, Any]]:
+    """
+    Split a serialized case result into what fits in columns and what doesn't.
+    """
+    extra: dict[str, Any] = {}
+
+    expectations: list[int] = []
+    for i, each in enumerate(expected):
+        if each is None:
+            expectations.append(_NO_EXPECTATION)
+        elif each is True or each is False:
+            expectations.append(_EXPECTED_VALID if each else _EXPECTED_INVALID)
+        else:
+            expectations.append(_ANNOTATIONS)
+            extra.setdefault("expected", {})[str(i)] = each
+
+    outcomes: list[int] = []
+    if "results" not in result:
+        if result.get("errored"):
+            status = _ERRORED
+        elif result.get("skipped"):
+            status = _SKIPPED
+        else:
+            raise InvalidReport(result)
+        extra["case"] = result
+        return status, outcomes, expectations, extra
+
+    for i, each in enumerate(result["results"]):
+        match each:
+            case {"valid": bool(valid)} if len(each) == 1:
+                outcomes.append(_VALID if valid else _INVALID)
+                continue
+            case {"valid": bool(valid), "annotations": _} if len(each) == 2:  # noqa: PLR2004
+                outcomes.append(
+                    _ANNOTATED_VALID if valid else _ANNOTATED_INVALID,
+                )
+            case {"skipped": True}:
+                outcomes.append(_SKIPPED_TEST)
+            case {"errored": True}:
+                outcomes.append(_ERRORED_TEST)
+            case _:
+                raise InvalidReport(each)
+        extra.setdefault("results", {})[str(i)] = each
+
+    rest = {k: v for k, v in result.items() if k != "results"}
+    if rest:
+        extra["case"] = rest
+    return _RAN, outcomes, expectations, extra
+
+
+@frozen
+class ColumnarReport:
+    """
+    A columnar report, queryable without parsing every result.
+
+    It answers the same questions `Report` does about how implementations
+    fared, and can be converted (losslessly) into one.
+    """
+
+    _buffer: memoryview = field(alias="buffer", repr=False)
+    _columns: Mapping[str, memoryview[int]] = field(
+        alias="columns",
+        repr=False,
+    )
+    _header: Mapping[str, Any] = field(alias="header", repr=False)
+    _footer: Mapping[str, Any] = field(alias="footer", repr=False)
+    _ids: Sequence[ConnectableId] = field(alias="ids", repr=False)
+    _seqs: Sequence[Seq] = field(alias="seqs", repr=False)
+    _registries: Sequence[tuple[str, int, int]] = field(
+        alias="registries",
+        repr=False,
+    )
+
+    metadata: RunMetadata
+    did_fail_fast: bool
+
+    _unsuccessful: dict[ConnectableId, Unsuccessful] = field(
+        init=False,
+        factory=dict["ConnectableId", Unsuccessful],
+        repr=False,
+    )
+
+    @classmethod
+    def from_buffer(cls, buffer: bytes | mmap.mmap) -> Self:
+        view = memoryview(buffer)
+        if view[: len(MAGIC)].tobytes() != MAGIC:
+            raise InvalidReport("Not a columnar report.")
+        offset, length = _TRAILER.unpack(view[-_TRAILER.size :])
+        described = json.loads(bytes(view[offset : offset + length]))
+        if described["byteorder"] != sys.byteorder:
+            raise InvalidReport(
+                "The report was written with another byteorder.",
+            )
+
+        columns: dict[str, memoryview[int]] = {}
+        for name, (start, count) in described["columns"].items():
+            typecode = _COLUMNS[name]
+            end = start + count * array(typecode).itemsize
+            columns[name] = view[start:end].cast(typecode)
+
+        header, footer = described["header"], described["footer"]
+        # The metadata (merged with any from the footer) is all there is to
+        # an otherwise empty report.
+        shell = Report.from_input([header, footer], validate=False)
+        return cls(
+            buffer=view,
+            columns=columns,
+            header=header,
+            footer=footer,
+            ids=described["implementations"],
+            seqs=described["seqs"],
+            registries=described["registries"],
+            metadata=shell.metadata,
+            did_fail_fast=shell.did_fail_fast,
+        )
+
+    @classmethod
+    def from_file(cls, file: IO[bytes]) -> Self:
+        """
+        Memory-map a columnar report from a file (or read it, if we can't).
+        """
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return cls.from_buffer(file.read())
+        return cls.from_buffer(mapped)
+
+    @property
+    def implementations(self) -> Mapping[ConnectableId, ImplementationInfo]:
+        return self.metadata.implementations
+
+    @property
+    def is_empty(self):
+        return not self._seqs
+
+    @property
+    def total_tests(self):
+        return sum(self._columns["case_tests"])
+
+    def only(self, implementations: Iterable[ConnectableId]) -> Self:
+        """
+        Restrict this report to the given implementations.
+        """
+        ids = set(implementations)
+        metadata = evolve(
+            self.metadata,
+            implementations={
+                id: info
+                for id, info in self.implementations.items()
+                if id in ids
+            },
+        )
+        return evolve(self, metadata=metadata)
+
+    def compliance_by_implementation(self):
+        """
+        Return the fraction of passing tests for each reported implementation.
+        """
+        return {
+            id: 1 - (unsuccessful.total / self.total_tests)
+            for id, _, unsuccessful in self.worst_to_best()
+        }
+
+    def unsuccessful(self, implementation: ConnectableId) -> Unsuccessful:
+        """
+        A count of the unsuccessful tests for the given implementation.
+        """
+        if not self._unsuccessful:
+            self._tally()
+        return self._unsuccessful[implementation]
+
+    def worst_to_best(self):
+        """
+        All implementations ordered by number of unsuccessful tests.
+
+        Ties are then broken alphabetically.
+        """
+        unsuccessful = [
+            (id, implementation, self.unsuccessful(id))
+            for id, implementation in self.implementations.items()
+        ]
+        unsuccessful.sort(key=lambda each: (each[2].total, each[1].name))
+        return unsuccessful
+
+    def latest_to_oldest(self):
+        """
+        Versioned implementations sorted by their latest to oldest versions.
+        """
+        unsuccessful = [
+            (implementation.version, self.unsuccessful(id))
+            for id, implementation in self.implementations.items()
+            if implementation.version is not None
+        ]
+        unsuccessful.sort(
+            key=lambda version_compliance: sortable_version_key(
+                version_compliance[0],
+            ),
+            reverse=True,
+        )
+        return unsuccessful
+
+    def cases_with_results(self):
+        report = self.to_report().only(self.implementations)
+        return report.cases_with_results()
+
+    def to_report(self) -> Report:
+        """
+        Convert this report into a (fully parsed) `Report`.
+        """
+        return Report.from_input(self.lines(), validate=False)
+
+    def serialized(self) -> Iterable[str]:
+        """
+        Serialize this report as JSON Lines.
+        """
+        return (json.dumps(line) for line in self.lines())
+
+    def lines(self) -> Iterable[Mapping[str, Any]]:
+        """
+        The (deserialized) lines of this report, as `Report.from_input` takes.
+        """
+        yield self._header
+        for id, offset, length in self._registries:
+            yield dict(registry_id=id, registry=self._blob(offset, length))
+        columns = self._columns
+        for seq, offset, length, registry in zip(
+            self._seqs,
+            columns["case_offset"],
+            columns["case_length"],
+            columns["case_registry"],
+        ):
+            line = dict(seq=seq, case=self._blob(offset, length))
+            if registry:
+                line["registry_id"] = self._registries[registry - 1][0]
+            yield line
+        for row in range(len(self._columns["row_case"])):
+            yield self._result_data(row)
+        yield self._footer
+
+    def _tally(self):
+        """
+        Find every implementation's unsuccessful tests in one pass.
+
+        Only case results with an unsuccessful test are actually parsed.
+        """
+        columns = self._columns
+        outcome, expected = columns["outcome"], columns["expected"]
+        unsuccessful: list[list[Unsuccessful]] = [[] for _ in self._ids]
+        for row, implementation in enumerate(columns["row_implementation"]):
+            if columns["row_status"][row] == _RAN:
+                first_result = columns["row_first_result"][row]
+                first_expected = columns["row_first_expected"][row]
+                count = min(
+                    columns["row_results"][row],
+                    columns["row_expected"][row],
+                )
+                if all(
+                    _successful(
+                        outcome[first_result + i],
+                        expected[first_expected + i],
+                    )
+                    for i in range(count)
+                ):
+                    continue
+            result = SeqResult.from_dict(**self._result_data(row))
+            unsuccessful[implementation].append(result.unsuccessful())
+
+        for id, each in zip(self._ids, unsuccessful):
+            self._unsuccessful[id] = Unsuccessful.of(each)
+
+    def _blob(self, offset: int, length: int) -> Any:
+        return json.loads(bytes(self._buffer[offset : offset + length]))
+
+    def _result_data(self, row: int) -> dict[str, Any]:
+        """
+        The serialized result in the given row.
+        """
+        columns = self._columns
+        length = columns["row_extra_length"][row]
+        extra: dict[str, Any] = (
+            self._blob(columns["row_extra_offset"][row], length)
+            if length
+            else {}
+        )
+
+        explicit: dict[str, Any] = extra.get("expected", {})
+        first = columns["row_first_expected"][row]
+        expected = [
+            explicit[str(i)] if code == _ANNOTATIONS else _EXPECTATIONS[code]
+            for i, code in enumerate(
+                columns["expected"][
+                    first : first + columns["row_expected"][row]
+                ],
+            )
+        ]
+        data: dict[str, Any] = dict(
+            seq=self._seqs[columns["row_case"][row]],
+            implementation=self._ids[columns["row_implementation"][row]],
+            expected=expected,
+        )
+
+        if columns["row_status"][row] == _RAN:
+            explicit: dict[str, Any] = extra.get("results", {})
+            first = columns["row_first_result"][row]
+            outcomes = columns["outcome"][
+                first : first + columns["row_results"][row]
+            ]
+            data["results"] = [
+                explicit[str(i)]
+                if str(i) in explicit
+                else {"valid": bool(code)}
+                for i, code in enumerate(outcomes)
+            ]
+        data.update(extra.get("case", {}))
+        return data
+
+
+def _successful(outcome: int, expected: int) -> bool:
+    """
+    Whether a test certainly succeeded, without needing to look closer.
+    """
+    if outcome in {_SKIPPED_TEST, _ERRORED_TEST} or expected == _ANNOTATIONS:
+        return False
+    return expected == _NO_EXPECTATION or (outcome & 1) == (
+        expected == _EXPECTED_VALID
+    )
+
+
+@frozen
+class Versions:
+    """
+    Reports for many versions of one implementation, without merging them.
+
+    It answers what a trend needs (like the report from
+    `Report.combine_versioned_reports_for`) whether each report is columnar
+    or not.
+    """
+
+    _reports: Sequence[Report | ColumnarReport] = field(alias="reports")
+
+    @property
+    def implementations(self) -> Mapping[ConnectableId, ImplementationInfo]:
+        return {
+            id: info
+            for report in self._reports
+            for id, info in report.implementations.items()
+        }
+
+    @property
+    def is_empty(self):
+        return False
+
+    @property
+    def total_tests(self):
+        return self._reports[0].total_tests
+
+    def unsuccessful(self, implementation: ConnectableId) -> Unsuccessful:
+        # Later reports win, as when combining them.
+        for report in reversed(self._reports):
+            if implementation in report.implementations:
+                return report.unsuccessful(implementation)
+        raise KeyError(implementation)
+
+    def latest_to_oldest(self):
+        """
+        Versioned implementations sorted by their latest to oldest versions.
+        """
+        unsuccessful = [
+            (implementation.version, self.unsuccessful(id))
+            for id, implementation in self.implementations.items()
+            if implementation.version is not None
+        ]
+        unsuccessful.sort(
+            key=lambda version_compliance: sortable_version_key(
+                version_compliance[0],
+            ),
+            reverse=True,
+        )
+        return unsuccessful
+
+
+def combine_versioned_reports_for(
+    versioned_reports: Iterable[Report | ColumnarReport],
+    dialect: Dialect,
+) -> Versions | Report:
+    """
+    Like `Report.combine_versioned_reports_for`, for columnar reports too.
+
+    Reports are only merged (as that method does) if none are columnar.
+    """
+    versioned_reports = list(versioned_reports)
+    reports = [each for each in versioned_reports if isinstance(each, Report)]
+    if len(reports) == len(versioned_reports):
+        return Report.combine_versioned_reports_for(reports, dialect)
+
+    versioned_reports = [
+        versioned_report
+        for versioned_report in versioned_reports
+        if versioned_report.metadata.dialect == dialect
+        and not versioned_report.is_empty
+    ]
+    if not versioned_reports:
+        return Report.empty(dialect=dialect)
+    return Versions(reports=versioned_reports)
@@ -4,11 +4,14 @@ Hand crafted classes which should undoubtedly be autogenerated from the schema.
 
 from __future__ import annotations
 
+from functools import cache
+from importlib.resources import files
 from typing import TYPE_CHECKING, Any, Literal, Protocol, dataclass_transform
+import json
 import re
 import urllib.parse
 
-from attrs import asdict, field, fields, filters, frozen
+from attrs import asdict, evolve, field, fields, filters, frozen
 from url import URL
 
 from bowtie import HOMEPAGE, exceptions
@@ -59,11 +62,26 @@ class Unsuccessful:
             skipped=self.skipped + other.skipped,
         )
 
+    @classmethod
+    def of(cls, each: Iterable[Unsuccessful]) -> Unsuccessful:
+        r"""
+        Combine any number of unsuccessful results in a single pass.
+
+        Unlike adding them together, which copies every list so far each
+        time, this takes linear time.
+        """
+        combined = cls()
+        for unsuccessful in each:
+            combined.failed.extend(unsuccessful.failed)
+            combined.errored.extend(unsuccessful.errored)
+            combined.skipped.extend(unsuccessful.skipped)
+        return combined
+
     def __bool__(self) -> bool:  # sigh, typing nonsense
         return bool(self.failed or self.errored or self.skipped)
 
     def counts(self):
-        return {k: len(v) for k, v in asdict(self).items()}
+        return {k: len(v) for k, v in asdict(self, recurse=False).items()}
 
     @property
     def total(self):
@@ -80,6 +98,13 @@ class SeqCase:
     output: OutputFormat = "flag"
 
     def run(self, runner: DialectRunner) -> Awaitable[SeqResult]:
+        run = self.to_run(runner=runner)
+        return runner.validate(run, case=self.case)
+
+    def to_run(self, runner: DialectRunner) -> Run:
+        """
+        The command which runs this case on the given runner's harness.
+        """
         try:
             schema_without_dialect = "$schema" not in self.case.schema
         except TypeError:  # we could either warn or not warn here seemingly...
@@ -88,14 +113,13 @@ class SeqCase:
         if schema_without_dialect:
             runner.schema_without_dialect(self.case.schema)
 
-        run = Run(
+        return Run(
             seq=self.seq,  # type: ignore[reportCallIssue]
             case=self.case.without_expected_results(),  # type: ignore[reportCallIssue]
             output=self.output,  # type: ignore[reportCallIssue]
         )
-        return runner.validate(run, expected=self.case.expected_results())
 
-    def serializable(self):
+    def serializable(self) -> Message:
         return dict(seq=self.seq, case=self.case.serializable())
 
     def matches_dialect(self, dialect: _Dialect):
@@ -113,12 +137,39 @@ class SeqCase:
         return metaschema_uri == dialect.uri
 
 
+@frozen
+class Capabilities:
+    """
+    Optional protocol extensions a harness has said it supports.
+    """
+
+    pipelining: bool = False
+    run_many: bool = False
+    schema_handles: bool = False
+
+    @classmethod
+    def from_dict(cls, **kwargs: Any) -> Self:
+        # Ignore extensions we don't (yet) know about.
+        names = {each.name for each in fields(cls)}
+        return cls(**{k: v for k, v in kwargs.items() if k in names})
+
+
+def _capabilities(value: Capabilities | Mapping[str, Any]) -> Capabilities:
+    if isinstance(value, Capabilities):
+        return value
+    return Capabilities.from_dict(**value)
+
+
 @frozen
 class Started:
     implementation: dict[str, Any]
     version: int = field(
         validator=lambda _, __, got: exceptions.VersionMismatch.check(got),
     )
+    capabilities: Capabilities = field(
+        factory=Capabilities,
+        converter=_capabilities,
+    )
 
 
 class Command[R](Protocol):
@@ -131,6 +182,19 @@ class Command[R](Protocol):
     ) -> R: ...
 
 
+class Codec[R](Protocol):
+    """
+    A fast path for a command's requests and responses.
+
+    Each direction may return ``None`` for any message it is not sure of, in
+    which case the message instead goes through full schema validation.
+    """
+
+    def encode(self, command: Any) -> Message | None: ...
+
+    def decode(self, response: Message) -> R | None: ...
+
+
 def validated(validator: Validator[Any], instance: Any):
     exception = validator.validate(instance)
     if exception is not None:
@@ -141,6 +205,7 @@ def validated(validator: Validator[Any], instance: Any):
 def command[R](
     Response: Callable[..., R],
     name: str = "",
+    codec: Callable[[], Codec[R]] | None = None,
 ) -> Callable[
     [type],
     type[Command[R]],
@@ -158,6 +223,10 @@ def command[R](
             self: Command[R],
             registry: ValidatorRegistry[Any],
         ) -> Message:
+            if codec is not None:
+                request = codec().encode(self)
+                if request is not None:
+                    return request
             request = {"cmd": name, **asdict(self)}
             return validated(registry.for_uri(uri), request)
 
@@ -166,6 +235,10 @@ def command[R](
             response: Message,
             registry: ValidatorRegistry[Any],
         ) -> R:
+            if codec is not None:
+                decoded = codec().decode(response)
+                if decoded is not None:
+                    return decoded
             validator = registry.for_schema(response_schema)
             return Response(**validated(validator, response))
 
@@ -693,12 +766,270 @@ class Empty:
         return Unsuccessful(errored=errored)
 
 
-@command(Response=_case_result)
+def _schema(path: str) -> dict[str, Any]:
+    return json.loads(files("bowtie.schemas").joinpath(path).read_text())
+
+
+@frozen
+class _Shape:
+    """
+    The properties an object (schema) requires and allows.
+    """
+
+    required: frozenset[str]
+    allowed: frozenset[str]
+
+    @classmethod
+    def of(cls, *schemas: Mapping[str, Any]) -> _Shape:
+        required: set[str] = set()
+        allowed: set[str] = set()
+        for schema in schemas:
+            required.update(schema.get("required", ()))
+            allowed.update(schema.get("properties", {}))
+        return cls(required=frozenset(required), allowed=frozenset(allowed))
+
+    def matches(self, instance: Mapping[str, Any]) -> bool:
+        return self.required <= instance.keys() <= self.allowed
+
+
+def _is_strings(instance: Mapping[str, Any], *keys: str) -> bool:
+    """
+    Whichever of the given keys are present have string values.
+    """
+    return all(isinstance(instance.get(key, ""), str) for key in keys)
+
+
+def _is_handle(value: Any) -> bool:
+    return type(value) is int and value >= 0
+
+
+@frozen
+class _RunCodec:
+    """
+    Structural checks and construction for run requests and responses.
+
+    The allowed and required properties come from the command's schemas,
+    while the type checks are written by hand. Only messages which are
+    certainly valid under the schemas are handled, leaving anything else
+    (including every invalid message) to the full schema validator.
+    """
+
+    outputs: frozenset[str]
+    cases: Sequence[_Shape]
+    test: _Shape
+
+    result: _Shape
+    skipped: _Shape
+    errored: _Shape
+
+    flag: _Shape
+    annotations: _Shape
+    annotation: _Shape
+    skipped_test: _Shape
+    errored_test: _Shape
+
+    @classmethod
+    def from_schemas(cls) -> _RunCodec:
+        run = _schema("io/commands/run.json")
+        response = run["$defs"]["openResponse"]
+        defs = response["$defs"]
+        annotations = _schema("output/annotations.json")
+        return cls(
+            outputs=frozenset(run["properties"]["output"]["enum"]),
+            cases=[
+                _Shape.of(_schema("io/v1.json")["$defs"]["case"]),
+                _Shape.of(
+                    _schema("io/commands/register-schema.json")["$defs"][
+                        "case"
+                    ],
+                ),
+            ],
+            test=_Shape.of(_schema("models/test.json")),
+            result=_Shape.of(response, defs["result"]),
+            skipped=_Shape.of(response, defs["skipped"]),
+            errored=_Shape.of(response, defs["errored"]),
+            flag=_Shape.of(_schema("output/flag.json")),
+            annotations=_Shape.of(annotations),
+            annotation=_Shape.of(
+                annotations["properties"]["annotations"]["items"],
+            ),
+            skipped_test=_Shape.of(defs["skipped"]),
+            errored_test=_Shape.of(defs["errored"]),
+        )
+
+    def encode(self, command: Run) -> Message | None:
+        case = command.case
+        if (
+            command.output not in self.outputs
+            or not any(shape.matches(case) for shape in self.cases)
+            or not _is_strings(case, "description", "comment")
+            or not isinstance(case.get("registry", {}), dict)
+            or not _is_handle(case.get("handle", 0))
+        ):
+            return None
+        tests = case["tests"]
+        if not isinstance(tests, list) or not tests:
+            return None
+        for test in tests:  # type: ignore[reportUnknownVariableType]
+            if (
+                not isinstance(test, dict)
+                or not self.test.matches(test)  # type: ignore[reportUnknownArgumentType]
+                or not _is_strings(test, "description", "comment")  # type: ignore[reportUnknownArgumentType]
+            ):
+                return None
+        return {
+            "cmd": "run",
+            "seq": command.seq,
+            "case": case,
+            "output": command.output,
+        }
+
+    def decode(
+        self,
+        response: Message,
+    ) -> tuple[Seq, int, AnyCaseResult] | None:
+        match response:
+            case {"results": list()} if self.result.matches(response):
+                results: list[Any] = response["results"]
+                decoded = [self._test_result(each) for each in results]
+                if any(each is None for each in decoded):
+                    return None
+                result = CaseResult(results=decoded)  # type: ignore[reportArgumentType]
+                return response["seq"], len(decoded), result
+            case {"skipped": _} if _is_skip(self.skipped, response):
+                skipped = CaseSkipped(
+                    message=response.get("message"),
+                    issue_url=response.get("issue_url"),
+                )
+                return response["seq"], 0, skipped
+            case {"errored": _, "context": context} if _is_error(
+                self.errored,
+                response,
+            ):
+                return response["seq"], 0, CaseErrored(context=context)
+            case _:
+                return None
+
+    def _test_result(self, data: Any) -> AnyTestResult | None:
+        match data:
+            case {"valid": bool(valid), "annotations": list()} if (
+                self.annotations.matches(data)
+                and all(
+                    self._is_annotation(each) for each in data["annotations"]
+                )
+            ):
+                annotations: list[Any] = data["annotations"]
+                return AnnotationsTestResult(
+                    valid=valid,
+                    annotations=[Annotation(**each) for each in annotations],
+                )
+            case {"valid": bool(valid)} if self.flag.matches(data):
+                return FlagTestResult(valid=valid)
+            case {"skipped": _} if _is_skip(self.skipped_test, data):
+                return SkippedTest(
+                    message=data.get("message"),
+                    issue_url=data.get("issue_url"),
+                )
+            case {"errored": _} if _is_error(self.errored_test, data):
+                return ErroredTest(context=data.get("context", {}))
+            case _:
+                return None
+
+    def _is_annotation(self, data: Any) -> bool:
+        return (
+            isinstance(data, dict)
+            and self.annotation.matches(data)  # type: ignore[reportUnknownArgumentType]
+            and _is_strings(
+                data,  # type: ignore[reportUnknownArgumentType]
+                "keyword",
+                "instanceLocation",
+                "keywordLocation",
+            )
+        )
+
+
+def _is_skip(shape: _Shape, data: Mapping[str, Any]) -> bool:
+    return (
+        shape.matches(data)
+        and data["skipped"] is True
+        and _is_strings(data, "message", "issue_url")
+    )
+
+
+def _is_error(shape: _Shape, data: Mapping[str, Any]) -> bool:
+    context = data.get("context", {})
+    return (
+        shape.matches(data)
+        and data["errored"] is True
+        and isinstance(context, dict)
+        and _is_strings(context, "message", "traceback", "stderr")  # type: ignore[reportUnknownArgumentType]
+    )
+
+
+@cache
+def _run_codec() -> _RunCodec:
+    """
+    The run codec, built from its schemas only once it's first needed.
+    """
+    return _RunCodec.from_schemas()
+
+
+@command(Response=_case_result, codec=_run_codec)
 class Run:
     seq: Seq
     case: dict[str, Any]
     output: OutputFormat = "flag"
 
+    def by_handle(self, handle: int) -> Run:
+        """
+        The same run, but referring to its registered schema by handle.
+        """
+        case = {
+            k: v
+            for k, v in self.case.items()
+            if k not in {"schema", "registry"}
+        }
+        return evolve(self, case={**case, "handle": handle})  # type: ignore[reportArgumentType]
+
+
+def _case_results(
+    responses: list[Message],
+) -> list[tuple[Seq, int, AnyCaseResult]]:
+    return [_case_result(**response) for response in responses]
+
+
+@command(Response=_case_results)
+class RunMany:
+    runs: Sequence[Run]
+
+
+@frozen
+class Registered:
+    """
+    A harness has prepared (or failed to prepare) a schema for later runs.
+    """
+
+    handle: int | None = None
+    errored: bool = False
+    context: dict[str, Any] = field(factory=dict[str, Any])
+
+
+@command(Response=Registered)
+class RegisterSchema:
+    handle: int
+    schema: Any
+    registry: Mapping[str, Any] = field(factory=dict[str, Any])
+
+
+@frozen
+class Released:
+    ok: bool
+
+
+@command(Response=Released)
+class Release:
+    handle: int
+
 
 @command(Response=Empty)
 class Stop:
@@ -0,0 +1,119 @@
+"""
+Compressed reports.
+
+Reports, being JSON Lines full of repeated keys, compress extremely well.
+They may be compressed with gzip or Zstandard, and are decompressed as they
+are read rather than all at once.
+
+Zstandard support comes from the standard library on Python 3.14 and newer,
+and otherwise from the ``zstandard`` package, installed by Bowtie's ``zstd``
+extra.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Literal, cast
+import gzip
+import importlib
+import io
+import sys
+
+if sys.version_info >= (3, 14):
+    from compression import zstd
+else:  # pragma: no cover
+    # Imported by name, as it's an optional dependency pyright may not see.
+    try:
+        zstandard = importlib.import_module("zstandard")
+    except ModuleNotFoundError:
+        zstandard = None
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Mapping
+    from typing import IO
+
+type Compression = Literal["gzip", "zstd"]
+
+#: The suffix given to files compressed with each kind of compression.
+SUFFIXES: Mapping[Compression, str] = {"gzip": ".gz", "zstd": ".zst"}
+
+_MAGIC: Mapping[bytes, Compression] = {
+    b"\x1f\x8b": "gzip",
+    b"\x28\xb5\x2f\xfd": "zstd",
+}
+
+
+class ZstdUnavailable(Exception):
+    """
+    Zstandard compression needs Python 3.14, or Bowtie's ``zstd`` extra.
+    """
+
+    def __str__(self) -> str:
+        return (
+            "Zstandard (de)compression needs Python 3.14 or newer, or "
+            "Bowtie's zstd extra to be installed, e.g. via "
+            "'uv tool install bowtie-json-schema[zstd]'."
+        )
+
+
+def compression_of(file: IO[bytes]) -> Compression | None:
+    """
+    How the given (peekable) file is compressed, if it is.
+    """
+    peek = getattr(file, "peek", None)
+    if peek is None:
+        return None
+    start = peek(4)
+    for magic, compression in _MAGIC.items():
+        if start.startswith(magic):
+            return compression
+    return None
+
+
+def decompressed(file: IO[bytes]) -> IO[bytes]:
+    """
+    The given file, decompressed as it is read, should it be compressed.
+    """
+    if not hasattr(file, "peek"):
+        file = cast("IO[bytes]", io.BufferedReader(file))  # type: ignore[reportArgumentType]
+    match compression_of(file):
+        case "gzip":
+            return cast("IO[bytes]", gzip.GzipFile(fileobj=file, mode="rb"))
+        case "zstd":
+            if sys.version_info >= (3, 14):
+                return cast("IO[bytes]", zstd.ZstdFile(file, mode="rb"))
+            if zstandard is None:
+                raise ZstdUnavailable()
+            reader = zstandard.ZstdDecompressor().stream_reader(file)
+            return cast("IO[bytes]", io.BufferedReader(reader))
+        case None:
+            return file
+
+
+@contextmanager
+def compressing(
+    file: IO[bytes],
+    compression: Compression | None,
+) -> Generator[IO[bytes]]:
+    """
+    Compress whatever is written (within the block) to the given file.
+
+    The file itself is left open.
+    """
+    match compression:
+        case "gzip":
+            # A fixed mtime keeps the output reproducible.
+            with gzip.GzipFile(fileobj=file, mode="wb", mtime=0) as gz:
+                yield cast("IO[bytes]", gz)
+        case "zstd":
+            if sys.version_info >= (3, 14):
+                with zstd.ZstdFile(file, mode="wb") as zst:
+                    yield cast("IO[bytes]", zst)
+            else:
+                if zstandard is None:
+                    raise ZstdUnavailable()
+                compressor = zstandard.ZstdCompressor()
+                with compressor.stream_writer(file, closefd=False) as zst:
+                    yield cast("IO[bytes]", zst)
+        case None:
+            yield file
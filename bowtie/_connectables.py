@@ -32,6 +32,7 @@ class UnknownConnector(Exception):
 
 class Connector(Protocol):
     kind: str
+    execution_params: frozenset[str]
 
     def connect(self) -> AbstractAsyncContextManager[Connection]: ...
 
@@ -139,6 +140,17 @@ class Connectable:
     def kind(self):
         return self._connector.kind
 
+    async def pull(self, pulls: _containers.Pulls | None = None) -> bool:
+        """
+        Fetch this connectable's image ahead of connecting to it.
+
+        Returns whether there was an image to fetch at all.
+        """
+        if not isinstance(self._connector, _containers.ConnectableImage):
+            return False
+        await self._connector.pull(pulls=pulls)
+        return True
+
     @asynccontextmanager
     async def connect(self, **kwargs: Any) -> AsyncGenerator[Implementation]:
         async with (
@@ -158,13 +170,25 @@ class Connectable:
 
         A report should say *which* implementation it describes, not how we
         happened to reach it, so the connector (``image:``, ``direct:``, ...)
-        and image registry -- both of which are transport -- are dropped.
+        and image registry -- both of which are transport -- are dropped,
+        as are parameters which only change how cases are run (timeouts,
+        executors, ...).
         The same implementation reached different ways therefore shares one
         report id, and reports never leak the transport used to run them.
         """
-        return self._id.removeprefix(f"{self.kind}:").removeprefix(
+        id = self._id.removeprefix(f"{self.kind}:").removeprefix(
             f"{_containers.IMAGE_REPOSITORY}/",
         )
+        rest, sep, raw_params = id.rpartition(":")
+        if not sep:
+            return id
+        execution_params = self._connector.execution_params
+        params = [
+            each
+            for each in raw_params.split(",")
+            if each.partition("=")[0] not in execution_params
+        ]
+        return f"{rest}:{','.join(params)}" if params else rest
 
     def to_terse(self) -> ConnectableId:
         """
@@ -10,12 +10,22 @@ writes to standard error.
 
 from __future__ import annotations
 
-from contextlib import AsyncExitStack, asynccontextmanager
+from bisect import bisect_left, insort
+from collections import deque
+from contextlib import (
+    AsyncExitStack,
+    asynccontextmanager,
+    contextmanager,
+    suppress,
+)
 from os import environ
-from typing import TYPE_CHECKING
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Literal, Protocol
+from weakref import WeakKeyDictionary
+import asyncio
 import json
 
-from attrs import field, frozen, mutable
+from attrs import Factory, field, frozen, mutable
 from imaged import (
     Engine,
     EngineError,
@@ -27,8 +37,10 @@ from imaged import (
     Unsupported,
 )
 import anyio
+import structlog
 
-from bowtie._core import InvalidResponse, Restarted
+from bowtie._core import InvalidResponse, Restarted, SlowResponses
+from bowtie._pool import chosen_pool, lease
 from bowtie.exceptions import (
     CannotConnect,
     GotStderr,
@@ -37,9 +49,15 @@ from bowtie.exceptions import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator, Awaitable, Callable
+    from collections.abc import (
+        AsyncGenerator,
+        Callable,
+        Generator,
+        Sequence,
+    )
+    from contextlib import AbstractAsyncContextManager
 
-    from bowtie._commands import Message
+    from bowtie._commands import Message, Seq
 
 
 IMAGE_REPOSITORY = "ghcr.io/bowtie-json-schema"
@@ -60,6 +78,213 @@ def _not_running(engine: str) -> str:
     )
 
 
+class ReadTimeout(Protocol):
+    """
+    How long to wait for a harness to respond before giving up on it.
+    """
+
+    def budget(self, attempt: int) -> float | None:
+        """
+        Seconds to wait on the given (0-indexed) attempt, or `None` forever.
+        """
+        ...
+
+    def observe(self, seconds: float) -> None:
+        """
+        Take note of how long a response actually took.
+        """
+        ...
+
+    @property
+    def slow_responses(self) -> SlowResponses:
+        """
+        Responses which took longer than predicted.
+        """
+        ...
+
+
+@frozen
+class FixedTimeout:
+    """
+    The same timeout for every response, no matter how long they take.
+    """
+
+    seconds: float | None
+
+    def budget(self, attempt: int) -> float | None:
+        return self.seconds
+
+    def observe(self, seconds: float) -> None:
+        pass
+
+    @property
+    def slow_responses(self) -> SlowResponses:
+        # Any slower than our timeout and we never got them at all.
+        return SlowResponses()
+
+
+@mutable
+class AdaptiveTimeout:
+    """
+    A timeout predicted from how long recent responses have taken.
+
+    Until a harness has responded enough times for its latency to be
+    meaningful, we wait as we would by default. After that, each response
+    is budgeted some multiple of the 99th percentile of recent ones, within
+    a (small) floor and a ceiling, and each retry gets that same budget.
+    A fast harness which hangs is therefore noticed well before it would
+    be by default, whilst a legitimately slow one is waited on for longer.
+    """
+
+    _name: str = field(alias="name")
+
+    ceiling: float = 60.0
+    factor: float = 4.0
+
+    _initial: float = field(default=2.0, alias="initial")
+    _warmup: int = field(default=20, alias="warmup")
+
+    floor: float = 0.5
+
+    #: Responses which took longer than predicted, for the report.
+    slow_responses: SlowResponses = field(factory=SlowResponses)
+
+    _recent: deque[float] = field(factory=lambda: deque(maxlen=256))
+    _sorted: list[float] = field(factory=list[float])
+
+    _log: structlog.stdlib.BoundLogger = field(
+        factory=structlog.stdlib.get_logger,
+    )
+
+    def budget(self, attempt: int) -> float:
+        if len(self._recent) < self._warmup:
+            predicted = self._initial
+        else:
+            p99 = self._sorted[(len(self._sorted) - 1) * 99 // 100]
+            predicted = max(self.floor, p99 * self.factor)
+        return min(predicted, self.ceiling)
+
+    def observe(self, seconds: float) -> None:
+        budget = self.budget(attempt=0)
+        if seconds > budget:
+            self._log.warning(
+                "Response took longer than predicted.",
+                seconds=round(seconds, 3),
+                budget=round(budget, 3),
+                logger_name=self._name,
+            )
+            self.slow_responses.took(seconds=seconds, budget=budget)
+
+        if len(self._recent) == self._recent.maxlen:
+            del self._sorted[bisect_left(self._sorted, self._recent[0])]
+        self._recent.append(seconds)
+        insort(self._sorted, seconds)
+
+
+def _seqs(message: Message) -> list[Seq | None]:
+    """
+    The seqs of whichever runs a request or response is for.
+    """
+    match message:
+        case {"runs": [*runs]}:
+            each: list[Any] = runs
+        case {"responses": [*responses]}:
+            each = responses
+        case _:
+            each = [message]
+    return [_seq(one) for one in each]
+
+
+def _seq(message: Any) -> Seq | None:
+    match message:
+        case {"seq": int(seq) | str(seq)}:
+            return seq
+        case _:
+            return None
+
+
+@mutable
+class _HeldSession:
+    """
+    A session kept open by a task of its own until it's no longer needed.
+
+    Holding each session in its own task means one can be started in the
+    background and later handed over to whoever needs it, whilst still
+    being closed by the same task which opened it.
+    """
+
+    _task: asyncio.Task[None] = field(alias="task")
+    _ready: asyncio.Future[Session] = field(alias="ready")
+    _release: asyncio.Event = field(alias="release")
+
+    @classmethod
+    def start(
+        cls,
+        new_session: Callable[[], AbstractAsyncContextManager[Session]],
+        replay: Sequence[Message] = (),
+        wait_sec: float | None = None,
+    ) -> _HeldSession:
+        """
+        Open a session in the background, sending it the given messages.
+        """
+        ready = asyncio.get_running_loop().create_future()
+        release = asyncio.Event()
+        task = asyncio.create_task(
+            cls._hold(new_session, replay, wait_sec, ready, release),
+        )
+        return cls(task=task, ready=ready, release=release)
+
+    @staticmethod
+    async def _hold(
+        new_session: Callable[[], AbstractAsyncContextManager[Session]],
+        replay: Sequence[Message],
+        wait_sec: float | None,
+        ready: asyncio.Future[Session],
+        release: asyncio.Event,
+    ) -> None:
+        try:
+            async with new_session() as session:
+                for message in replay:
+                    with anyio.fail_after(wait_sec):
+                        await session.send(json.dumps(message))
+                        await session.receive()
+                ready.set_result(session)
+                await release.wait()
+        except Exception as err:  # noqa: BLE001
+            # Whoever is waiting for the session finds out why it failed.
+            # Once it's been handed over, we've nobody left to tell.
+            if not ready.done():
+                ready.set_exception(err)
+        finally:
+            if not ready.done():
+                ready.cancel()
+
+    async def session(self) -> Session:
+        """
+        Wait for the session to be ready.
+        """
+        return await asyncio.shield(self._ready)
+
+    @property
+    def dead(self) -> bool:
+        """
+        Has the session failed to start, or since gone away?
+        """
+        if self._task.done():
+            return True
+        if not self._ready.done():
+            return False
+        return self._ready.exception() is not None or not (
+            self._ready.result().alive
+        )
+
+    async def close(self) -> None:
+        self._release.set()
+        if not self._ready.done():
+            self._task.cancel()
+        await asyncio.wait([self._task])
+
+
 @mutable
 class Connection:
     """
@@ -69,18 +294,16 @@ class Connection:
     serialization handled here.
     """
 
-    _new_session: Callable[[], Awaitable[Session]] = field(
+    _new_session: Callable[[], AbstractAsyncContextManager[Session]] = field(
         repr=False,
         alias="new_session",
     )
 
-    #: An explicit timeout to wait for the harness to respond to each
-    #: request, or `None` to wait forever -- though note that this does
-    #: mean ... forever!
-    _read_timeout_sec: float | None = field(
-        default=2.0,
+    #: How long to wait for the harness to respond to each request.
+    _read_timeout: ReadTimeout = field(
+        default=FixedTimeout(seconds=2.0),
         repr=False,
-        alias="read_timeout_sec",
+        alias="read_timeout",
     )
 
     # Maybe second versions of these will be useful also at the
@@ -91,33 +314,210 @@ class Connection:
     #: A per-request number of retries, before giving up
     _retry: int = field(default=3, repr=False)
 
+    #: How many requests may be outstanding at once, should the harness
+    #: support pipelining them.
+    window: int = field(default=1, repr=False)
+
+    #: Whether to keep a second harness warm, ready to take over should
+    #: the current one die.
+    _keep_standby: bool = field(default=False, repr=False, alias="standby")
+
+    _held: _HeldSession | None = field(default=None, init=False, repr=False)
     _connected_to: Session | None = None
 
+    _spare: _HeldSession | None = field(default=None, init=False, repr=False)
+    _replay: Sequence[Message] = field(default=(), init=False, repr=False)
+
+    #: What the standby harness has been sent, which may lag `_replay`.
+    _spare_sent: Sequence[Message] = field(
+        default=(),
+        init=False,
+        repr=False,
+    )
+
+    #: When each request we've yet to hear back about was sent, by seq.
+    _sent_at: dict[Seq | None, float] = field(
+        factory=dict["Seq | None", float],
+        init=False,
+        repr=False,
+    )
+
+    #: Seqs of requests we've stopped waiting on but which may yet arrive.
+    _abandoned: set[Seq] = field(
+        factory=set["Seq"],
+        init=False,
+        repr=False,
+    )
+
     @property
     async def _session(self) -> Session:
         if self._connected_to is None:
-            self._connected_to = await self._new_session()
+            self._held = _HeldSession.start(self._new_session)
+            self._connected_to = await self._held.session()
         return self._connected_to
 
+    @property
+    def alive(self) -> bool:
+        """
+        Is whatever we're speaking to still there to respond?
+        """
+        return self._connected_to is not None and self._connected_to.alive
+
+    @property
+    def slow_responses(self) -> SlowResponses:
+        """
+        Responses which took the harness longer than predicted.
+        """
+        return self._read_timeout.slow_responses
+
+    async def standby(self, replay: Sequence[Message]) -> None:
+        """
+        Keep a harness ready which has already been sent the given messages.
+
+        Does nothing unless we've been asked to keep one.
+        An existing standby harness is kept unless it's died, as whatever
+        it has yet to be sent is sent to it only should it take over.
+        """
+        if not self._keep_standby:
+            return
+        self._replay = replay
+        spare, sent = self._spare, list(self._spare_sent)
+        if spare is not None:
+            if not spare.dead and list(replay[: len(sent)]) == sent:
+                return
+            await spare.close()
+        self._warm_standby()
+
+    def _warm_standby(self) -> None:
+        if not self._keep_standby:
+            return
+        self._spare_sent = self._replay
+        self._spare = _HeldSession.start(
+            self._new_session,
+            replay=self._replay,
+            wait_sec=self._read_timeout.budget(attempt=self._retry),
+        )
+
+    async def _restart(self) -> Restarted:
+        """
+        Replace the current harness, preferring the standby one if we have it.
+        """
+        started = perf_counter()
+
+        # Nothing sent to the old harness will be answered by the new one.
+        self._sent_at.clear()
+        self._abandoned.clear()
+
+        held, self._held, self._connected_to = self._held, None, None
+        if held is not None:
+            await held.close()
+
+        standby, self._spare = self._spare, None
+        if standby is not None:
+            missed = self._replay[len(self._spare_sent) :]
+            session: Session | None
+            try:
+                session = await standby.session()
+                await self._catch_up(session, missed)
+            except (SessionClosed, TimeoutError, InvalidResponse):
+                session = None
+            if session is not None and session.alive:
+                self._held, self._connected_to = standby, session
+                self._warm_standby()
+                return Restarted(
+                    restart_sec=perf_counter() - started,
+                    caught_up=True,
+                )
+            await standby.close()
+
+        await self._session
+        self._warm_standby()
+        return Restarted(restart_sec=perf_counter() - started)
+
+    async def _catch_up(self, session: Session, missed: Sequence[Message]):
+        """
+        Send a standby harness whatever it missed whilst waiting to take over.
+        """
+        for message in missed:
+            with anyio.fail_after(self._read_timeout.budget(self._retry)):
+                await session.send(json.dumps(message))
+                await session.receive()
+
+    async def close(self) -> None:
+        """
+        Stop speaking to any harness, including a standby one.
+        """
+        for held in self._spare, self._held:
+            if held is not None:
+                await held.close()
+        self._spare = self._held = self._connected_to = None
+
     async def request(self, message: Message) -> Message | None:
+        await self.send(message)
+        response = None
+        try:
+            response = await self.receive()
+        finally:
+            if response is None:
+                seqs = _seqs(message)
+                for seq in seqs:
+                    self._sent_at.pop(seq, None)
+                if self.alive:
+                    # Should it answer after all, its answer is for nobody.
+                    self._abandoned.update(
+                        seq for seq in seqs if seq is not None
+                    )
+        return response
+
+    async def send(self, message: Message) -> None:
+        """
+        Send a request without waiting for its response.
+        """
         session = await self._session
 
+        sent_at = perf_counter()
+        for seq in _seqs(message):
+            self._sent_at[seq] = sent_at
+
         try:
             await session.send(json.dumps(message))
         except SessionClosed:
             self._restarts -= 1
-            self._connected_to = None
-            raise Restarted() from None
+            raise await self._restart() from None
+
+    async def receive(self) -> Message | None:
+        """
+        Receive the next response from the harness.
+
+        Late responses to requests we've already given up on are discarded.
+        """
+        while True:
+            response = await self._receive()
+            if response is None:
+                return response
+            seqs = _seqs(response)
+            if (
+                not seqs
+                or None in seqs
+                or not self._abandoned.issuperset(seqs)
+            ):
+                return response
+            self._abandoned.difference_update(seqs)
+
+    async def _receive(self) -> Message | None:
+        session = await self._session
+        started = perf_counter()
 
-        for _ in range(self._retry):
+        for attempt in range(self._retry):
             try:
-                with anyio.fail_after(self._read_timeout_sec):
+                with anyio.fail_after(self._read_timeout.budget(attempt)):
                     response = await session.receive()
             except TimeoutError:
                 # A harness which has said something on standard error
                 # and then gone quiet is telling us why it won't answer.
                 stderr = session.stderr()
                 if stderr:
+                    self._give_up_on_oldest()
                     raise GotStderr(stderr)
                 continue
             except SessionClosed as err:
@@ -125,11 +525,42 @@ class Connection:
                     raise GotStderr(err.stderr)
                 return
 
+            received = perf_counter()
             try:
-                return json.loads(response)
+                message = json.loads(response)
             except json.JSONDecodeError as err:
+                self._give_up_on_oldest()
                 raise InvalidResponse(contents=response) from err
 
+            # Responses took as long as they've been outstanding, not just
+            # as long as we've been waiting on them (which differs for
+            # pipelined ones).
+            sent_at = [
+                self._sent_at.pop(seq)
+                for seq in _seqs(message)
+                if seq in self._sent_at
+            ]
+            self._read_timeout.observe(
+                received - min(sent_at, default=started),
+            )
+            return message
+
+        self._give_up_on_oldest()
+
+    def _give_up_on_oldest(self) -> None:
+        """
+        Forget when the request we've been waiting on longest was sent.
+
+        Whoever is waiting on responses attributes a missing or unintelligible
+        one to that request (see `HarnessClient.pipeline`), so it is no longer
+        outstanding.
+        """
+        oldest = next(iter(self._sent_at.values()), None)
+        for seq, sent_at in list(self._sent_at.items()):
+            if sent_at != oldest:
+                break
+            del self._sent_at[seq]
+
 
 def _float_or_none(value: str | float | None) -> float | None:
     """
@@ -143,6 +574,116 @@ def _float_or_none(value: str | float | None) -> float | None:
     return None
 
 
+def _bool(value: str | bool) -> bool:
+    """
+    Coerce strings like "0" or "false" (from connectable parameters).
+    """
+    if isinstance(value, str):
+        return value.lower() not in {"", "0", "false", "no", "off"}
+    return value
+
+
+def _read_timeout_sec(
+    value: str | float | None,
+) -> float | Literal["adaptive"] | None:
+    """
+    Allow asking for an adaptive timeout, otherwise as `_float_or_none`.
+    """
+    if value == "adaptive":
+        return value
+    return _float_or_none(value)
+
+
+def _read_timeout(
+    name: str,
+    seconds: float | Literal["adaptive"] | None,
+) -> ReadTimeout:
+    if seconds == "adaptive":
+        return AdaptiveTimeout(name=name)
+    return FixedTimeout(seconds=seconds)
+
+
+#: The environment variable limiting how many images are pulled at once.
+MAX_PULLS_ENV_VAR = "BOWTIE_MAX_PULLS"
+
+#: How many images are pulled at once, unless told otherwise.
+DEFAULT_MAX_PULLS = 4
+
+
+def _max_pulls() -> int:
+    return int(environ.get(MAX_PULLS_ENV_VAR) or DEFAULT_MAX_PULLS)
+
+
+@mutable
+class Pulls:
+    """
+    Image pulls, no more than so many at once.
+
+    Pulling every image a run needs all at once saturates bandwidth and
+    disk, slowing every pull down (along with starting implementations
+    whose images we already have). Pulls instead wait their turn, and an
+    image wanted by more than one connection is pulled only once.
+    """
+
+    maximum: int = field(factory=_max_pulls)
+
+    _limit: asyncio.Semaphore = field(
+        default=Factory(
+            lambda self: asyncio.Semaphore(self.maximum),
+            takes_self=True,
+        ),
+        init=False,
+    )
+    _pulling: dict[str, asyncio.Task[None]] = field(
+        factory=dict[str, asyncio.Task[None]],
+        init=False,
+    )
+
+    async def pull(self, engine: Engine, image: str) -> None:
+        """
+        Fetch the given image once it's our turn.
+        """
+        pulling = self._pulling.get(image)
+        if pulling is None:
+            pulling = self._pulling[image] = asyncio.create_task(
+                self._pull(engine, image),
+            )
+            pulling.add_done_callback(lambda _: self._pulling.pop(image))
+        # Whoever else is waiting on the same image still wants it, even
+        # if we no longer do.
+        await asyncio.shield(pulling)
+
+    async def _pull(self, engine: Engine, image: str) -> None:
+        async with self._limit:
+            await engine.pull(image)
+
+    async def create(self, engine: Engine, image: str) -> str:
+        """
+        Create a container, pulling its image (in turn) if we lack it.
+        """
+        try:
+            return await engine.create(image, network=False)
+        except NoSuchImage:
+            await self.pull(engine, image)
+            return await engine.create(image, network=False)
+
+
+_PULLS: WeakKeyDictionary[asyncio.AbstractEventLoop, Pulls] = (
+    WeakKeyDictionary()
+)
+
+
+def _pulls() -> Pulls:
+    """
+    The pulls shared by every connection made on the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    pulls = _PULLS.get(loop)
+    if pulls is None:
+        pulls = _PULLS[loop] = Pulls()
+    return pulls
+
+
 def chosen_engine() -> Engine:
     """
     The container engine to speak to.
@@ -177,54 +718,106 @@ class ConnectableImage:
     #: An explicit timeout to wait for each implementation to respond
     #: to *each* instance being validated. Set this to 0 if you wish
     #: to wait forever, though note that this means you may end up waiting
-    #: ... forever!
-    _read_timeout_sec: float | None = field(
+    #: ... forever! Set it to "adaptive" to instead predict a timeout from
+    #: how long the implementation has taken to respond so far.
+    _read_timeout_sec: float | Literal["adaptive"] | None = field(
         default=2.0,
-        converter=_float_or_none,
+        converter=_read_timeout_sec,
         repr=False,
         alias="read_timeout_sec",
     )
 
+    #: How many cases to send ahead of the responses to earlier ones, for
+    #: harnesses which support pipelining. 1 waits for each response
+    #: before sending the next case.
+    _pipeline: int = field(
+        default=1,
+        converter=int,
+        repr=False,
+        alias="pipeline",
+    )
+
+    #: Whether to keep a second container started and already sent the
+    #: same commands as the current one, so that should the current one
+    #: crash, it can be replaced without waiting on a new one.
+    _standby: bool = field(
+        default=False,
+        converter=_bool,
+        repr=False,
+        alias="standby",
+    )
+
     kind = "image"
 
+    #: Parameters which change only how cases are run, not what runs them.
+    execution_params = frozenset({"read_timeout_sec", "pipeline", "standby"})
+
+    @contextmanager
+    def _failures(self, engine: Engine) -> Generator[None]:
+        """
+        Explain whatever went wrong getting the image or its container.
+        """
+        try:
+            yield
+        except NoSuchImage as err:
+            raise NoSuchImplementation(self._id) from err
+        except EngineNotRunning as err:
+            raise CannotConnect(
+                kind=self.kind,
+                id=self._id,
+                hint=_not_running(engine.name),
+            ) from err
+        except EngineError as err:
+            # Anything else the engine couldn't manage is still a
+            # failure to start, which Bowtie knows how to show.
+            raise StartupFailed(id=self._id, data=str(err)) from err
+
+    async def pull(self, pulls: Pulls | None = None) -> None:
+        """
+        Fetch the image, even if we already have some version of it.
+        """
+        engine = _engine(kind=self.kind, id=self._id)
+        with self._failures(engine):
+            await (pulls or _pulls()).pull(engine, self._id)
+
     @asynccontextmanager
     async def connect(self) -> AsyncGenerator[Connection]:
         engine = _engine(kind=self.kind, id=self._id)
 
-        async with AsyncExitStack() as stack:
-            # Whatever we're speaking to right now, closed and replaced
-            # on each restart so that dead containers don't pile up for
-            # the lifetime of the connection.
-            current = await stack.enter_async_context(AsyncExitStack())
-
-            async def new_session():
-                await current.aclose()
-
-                try:
-                    id = await engine.create_pulling_if_needed(
-                        self._id,
-                        network=False,
-                    )
-                except NoSuchImage as err:
-                    raise NoSuchImplementation(self._id) from err
-                except EngineNotRunning as err:
-                    raise CannotConnect(
-                        kind=self.kind,
-                        id=self._id,
-                        hint=_not_running(engine.name),
-                    ) from err
-                except EngineError as err:
-                    # Anything else the engine couldn't manage is still a
-                    # failure to start, which Bowtie knows how to show.
-                    raise StartupFailed(id=self._id, data=str(err)) from err
-
-                current.push_async_callback(engine.remove, id)
-                return await current.enter_async_context(engine.start(id))
-
-            yield Connection(
-                new_session=new_session,
-                read_timeout_sec=self._read_timeout_sec,
-            )
+        @asynccontextmanager
+        async def new_session() -> AsyncGenerator[Session]:
+            async with AsyncExitStack() as stack:
+                session: Session | None = None
+                pool = chosen_pool()
+                if pool is not None and engine.attaches:
+                    leased = await lease(pool, self._id)
+                    if leased is not None:
+                        stack.push_async_callback(engine.remove, leased)
+                        # Should it have gone away already, start our own.
+                        with suppress(EngineError):
+                            session = await stack.enter_async_context(
+                                engine.attach(leased),
+                            )
+                        if session is not None:
+                            yield session
+                            return
+
+                with self._failures(engine):
+                    id = await _pulls().create(engine, self._id)
+
+                stack.push_async_callback(engine.remove, id)
+                yield await stack.enter_async_context(engine.start(id))
+
+        connection = Connection(
+            new_session=new_session,
+            read_timeout=_read_timeout(self._id, self._read_timeout_sec),
+            window=self._pipeline,
+            standby=self._standby,
+        )
+        try:
+            yield connection
+        finally:
+            await connection.close()
 
 
 @frozen(kw_only=True)
@@ -234,16 +827,30 @@ class ConnectableContainer:
     #: An explicit timeout to wait for each implementation to respond
     #: to *each* instance being validated. Set this to 0 if you wish
     #: to wait forever, though note that this means you may end up waiting
-    #: ... forever!
-    _read_timeout_sec: float | None = field(
+    #: ... forever! Set it to "adaptive" to instead predict a timeout from
+    #: how long the implementation has taken to respond so far.
+    _read_timeout_sec: float | Literal["adaptive"] | None = field(
         default=2.0,
-        converter=_float_or_none,
+        converter=_read_timeout_sec,
         repr=False,
         alias="read_timeout_sec",
     )
 
+    #: How many cases to send ahead of the responses to earlier ones, for
+    #: harnesses which support pipelining. 1 waits for each response
+    #: before sending the next case.
+    _pipeline: int = field(
+        default=1,
+        converter=int,
+        repr=False,
+        alias="pipeline",
+    )
+
     kind = "container"
 
+    #: Parameters which change only how cases are run, not what runs them.
+    execution_params = frozenset({"read_timeout_sec", "pipeline"})
+
     @asynccontextmanager
     async def connect(self) -> AsyncGenerator[Connection]:
         engine = _engine(kind=self.kind, id=self._id)
@@ -272,18 +879,12 @@ class ConnectableContainer:
         if not exists:
             raise CannotConnect(kind=self.kind, id=self._id)
 
-        async with AsyncExitStack() as stack:
-            # As above -- detach from the previous session before we go
-            # making another one.
-            current = await stack.enter_async_context(AsyncExitStack())
-
-            async def new_session():
-                await current.aclose()
-                return await current.enter_async_context(
-                    engine.attach(self._id),
-                )
-
-            yield Connection(
-                new_session=new_session,
-                read_timeout_sec=self._read_timeout_sec,
-            )
+        connection = Connection(
+            new_session=lambda: engine.attach(self._id),
+            read_timeout=_read_timeout(self._id, self._read_timeout_sec),
+            window=self._pipeline,
+        )
+        try:
+            yield connection
+        finally:
+            await connection.close()
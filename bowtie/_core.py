@@ -1,28 +1,38 @@
 from __future__ import annotations
 
-from contextlib import asynccontextmanager
+from contextlib import aclosing, asynccontextmanager, suppress
 from datetime import date
-from functools import cache, total_ordering
+from functools import cache, cached_property, total_ordering
 from importlib.resources import files
+from itertools import batched
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Protocol, cast
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Protocol, cast, runtime_checkable
 from uuid import uuid4
+import hashlib
 import json
+import weakref
 
 from attrs import Factory, asdict, evolve, field, frozen, mutable
+from referencing import Registry
 from referencing.jsonschema import EMPTY_REGISTRY, specification_with
 from rpds import HashTrieMap, HashTrieSet
 from url import URL
 import httpx
 import referencing_loaders
+import structlog
 
 from bowtie import HOMEPAGE
 from bowtie._commands import (
     START_V1,
+    Capabilities,
     CaseErrored,
     Dialect as DialectCommand,
     ExpectedAnnotations,
     ExpectedValidity,
+    RegisterSchema,
+    Release,
+    RunMany,
     SeqCase,
     SeqResult,
     StartedDialect,
@@ -251,11 +261,96 @@ class Dialect:
         )
 
 
+@frozen
 class Restarted(Exception):
     """
     A connection was restarted, so we may need to replay some messages.
     """
 
+    #: How long it took to get a new harness going.
+    restart_sec: float = 0.0
+
+    #: Whether the new harness was already sent whatever we'd replay to it.
+    caught_up: bool = False
+
+
+@mutable
+class Restarts:
+    """
+    How long it took to recover each time a harness had to be restarted.
+    """
+
+    restart_sec: list[float] = field(factory=list[float])
+    replay_sec: list[float] = field(factory=list[float])
+
+    def __bool__(self) -> bool:
+        return bool(self.restart_sec)
+
+    def __add__(self, other: Restarts) -> Restarts:
+        return Restarts(
+            restart_sec=self.restart_sec + other.restart_sec,
+            replay_sec=self.replay_sec + other.replay_sec,
+        )
+
+    def serializable(self) -> Message:
+        return {
+            "restart_sec": [round(each, 3) for each in self.restart_sec],
+            "replay_sec": [round(each, 3) for each in self.replay_sec],
+        }
+
+
+@mutable
+class Registrations:
+    """
+    How long harnesses took to prepare the schemas registered with them.
+    """
+
+    compile_sec: list[float] = field(factory=list[float])
+
+    def __bool__(self) -> bool:
+        return bool(self.compile_sec)
+
+    def __add__(self, other: Registrations) -> Registrations:
+        return Registrations(compile_sec=self.compile_sec + other.compile_sec)
+
+    def serializable(self) -> Message:
+        return {
+            "registered": len(self.compile_sec),
+            "compile_sec": round(sum(self.compile_sec), 3),
+        }
+
+
+@mutable
+class SlowResponses:
+    """
+    Responses which took longer than a harness was predicted to take.
+    """
+
+    seconds: list[float] = field(factory=list[float])
+    budget_sec: list[float] = field(factory=list[float])
+
+    def __bool__(self) -> bool:
+        return bool(self.seconds)
+
+    def __add__(self, other: SlowResponses) -> SlowResponses:
+        return SlowResponses(
+            seconds=self.seconds + other.seconds,
+            budget_sec=self.budget_sec + other.budget_sec,
+        )
+
+    def took(self, seconds: float, budget: float) -> None:
+        """
+        Note a response which took longer than it was budgeted.
+        """
+        self.seconds.append(seconds)
+        self.budget_sec.append(budget)
+
+    def serializable(self) -> Message:
+        return {
+            "seconds": [round(each, 3) for each in self.seconds],
+            "budget_sec": [round(each, 3) for each in self.budget_sec],
+        }
+
 
 @frozen
 class Link:
@@ -359,6 +454,203 @@ class Connection(Protocol):
         ...
 
 
+@runtime_checkable
+class StandbyConnection(Connection, Protocol):
+    """
+    A connection which can keep another harness ready to take over.
+    """
+
+    async def standby(self, replay: Sequence[Message]) -> None:
+        """
+        Prepare a harness which has already been sent the given messages.
+
+        Should the current harness die, it is replaced by the standby one,
+        and no messages need replaying to it.
+        """
+        ...
+
+
+@runtime_checkable
+class PipelinedConnection(Connection, Protocol):
+    """
+    A connection which can send requests ahead of receiving responses.
+    """
+
+    #: How many requests may be outstanding at once.
+    window: int
+
+    @property
+    def alive(self) -> bool:
+        """
+        Is the harness still there to respond to outstanding requests?
+        """
+        ...
+
+    async def send(self, message: Message) -> None:
+        """
+        Send a request to the harness without waiting for its response.
+        """
+        ...
+
+    async def receive(self) -> Message | None:
+        """
+        Receive the next response from the harness, whichever it is for.
+        """
+        ...
+
+
+@runtime_checkable
+class TimedConnection(Connection, Protocol):
+    """
+    A connection which predicts how long its harness will take to respond.
+    """
+
+    @property
+    def slow_responses(self) -> SlowResponses:
+        """
+        Responses which took longer than predicted (but did arrive).
+        """
+        ...
+
+
+#: How many cases to send in each run-many command, when harnesses support it.
+RUN_MANY_BATCH_SIZE = 100
+
+#: How many schemas to keep registered with a harness at once, when
+#: harnesses support it.
+MAX_SCHEMA_HANDLES = 128
+
+
+#: Encodes JSON the same way regardless of key order.
+_CANONICAL = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+#: Identifiers of registries we've seen, by the registry's id().
+_REGISTRY_IDS: dict[int, str] = {}
+
+#: The contents of registries we've seen, by the registry's id().
+_REGISTRY_CONTENTS: dict[int, Mapping[str, Schema]] = {}
+
+
+def _digest_of(data: Any) -> str:
+    # Registries can be large, so avoid building one big string of them.
+    digest = hashlib.blake2b(digest_size=16)
+    for chunk in _CANONICAL.iterencode(data):
+        digest.update(chunk.encode())
+    return digest.hexdigest()
+
+
+def populated_registry(
+    contents: Mapping[str, Schema],
+    dialect: Dialect,
+) -> SchemaRegistry:
+    """
+    A registry of the given schemas, which default to the given dialect.
+    """
+    return EMPTY_REGISTRY.with_contents(
+        contents.items(),
+        default_specification=dialect.specification(),
+    )
+
+
+def registry_id(registry: SchemaRegistry) -> str:
+    """
+    An identifier for the contents of a registry.
+
+    It is computed once for each registry (rather than for each test case
+    sharing it), and is the same for any registries with the same contents.
+    """
+    key = id(registry)
+    known = _REGISTRY_IDS.get(key)
+    if known is None:
+        known = _REGISTRY_IDS[key] = _digest_of(registry_contents(registry))
+        weakref.finalize(registry, _REGISTRY_IDS.pop, key, None)
+    return known
+
+
+def registry_contents(registry: SchemaRegistry) -> Mapping[str, Schema]:
+    """
+    The schemas in a registry, by URI.
+
+    The same mapping is returned for a registry each time, so that whoever
+    receives it (e.g. in a serialized test case) may recognize it by its
+    identity. It must not be mutated.
+    """
+    key = id(registry)
+    known = _REGISTRY_CONTENTS.get(key)
+    if known is None:
+        # FIXME: Via python-jsonschema/referencing#16
+        contents = {k: v.contents for k, v in registry.items()}
+        known = _REGISTRY_CONTENTS[key] = contents
+        weakref.finalize(registry, _REGISTRY_CONTENTS.pop, key, None)
+    return known
+
+
+def _remember(keys: dict[str, None], key: str, maximum: int) -> None:
+    """
+    Add a key, forgetting the oldest one should there now be too many.
+    """
+    keys[key] = None
+    if len(keys) > maximum:
+        del keys[next(iter(keys))]
+
+
+@mutable
+class SchemaHandles:
+    """
+    Schemas registered with a harness, so that runs may refer to them.
+
+    A schema is only registered once we see it for a second time, as one
+    used by a single case is cheaper to send along with it.
+    """
+
+    maximum: int = MAX_SCHEMA_HANDLES
+
+    #: Handles of registered schemas by their schema id, along with the
+    #: command which registered them, least recently used first.
+    registered: dict[str, tuple[int, RegisterSchema]] = field(
+        factory=dict[str, tuple[int, RegisterSchema]],
+    )
+
+    #: Ids of schemas we've seen once, or which failed to register, oldest
+    #: first and forgetting any beyond `remembered` of each.
+    _seen: dict[str, None] = field(factory=dict[str, None])
+    _failed: dict[str, None] = field(factory=dict[str, None])
+    remembered: int = 8 * MAX_SCHEMA_HANDLES
+
+    _next: int = 0
+
+    def handle_for(self, key: str) -> int | None:
+        """
+        The handle of an already registered schema, if it is one.
+        """
+        registered = self.registered.pop(key, None)
+        if registered is None:
+            return None
+        self.registered[key] = registered
+        handle, _ = registered
+        return handle
+
+    def worth_registering(self, key: str) -> bool:
+        if key in self._failed:
+            return False
+        if key in self._seen:
+            del self._seen[key]  # it's about to be registered (or fail to)
+            return True
+        _remember(self._seen, key, self.remembered)
+        return False
+
+    def to_register(self, case: TestCase) -> tuple[int, RegisterSchema]:
+        handle, self._next = self._next, self._next + 1
+        return handle, RegisterSchema(
+            handle=handle,  # type: ignore[reportCallIssue]
+            schema=case.schema,  # type: ignore[reportCallIssue]
+            registry=registry_contents(case.registry),  # type: ignore[reportCallIssue]
+        )
+
+    def failed(self, key: str) -> None:
+        _remember(self._failed, key, self.remembered)
+
+
 @frozen
 class HarnessClient:
     """
@@ -369,17 +661,51 @@ class HarnessClient:
 
     _registry: ValidatorRegistry[Any] = field(alias="registry")
 
+    #: Which protocol extensions the harness has told us it supports.
+    _capabilities: Capabilities = field(
+        default=Capabilities(),
+        alias="capabilities",
+    )
+
     # FIXME: Remove this somehow by making the state machine even more explicit
     #: A sequence of commands to replay if we end up restarting the connection.
     _if_replaying: Sequence[Command[Any]] = ()
 
-    async def _get_back_up_to_date(self):
-        for each in self._if_replaying:
-            await self.request(each)  # TODO: response assert?
+    #: How long recovering from any restarts of the harness has taken.
+    restarts: Restarts = field(factory=Restarts, repr=False)
+
+    #: Schemas registered with the harness, if it supports registering them.
+    _handles: SchemaHandles = field(factory=SchemaHandles, repr=False)
+
+    #: How long the harness has taken to prepare the schemas registered.
+    registrations: Registrations = field(factory=Registrations, repr=False)
+
+    _log: structlog.stdlib.BoundLogger = field(
+        factory=structlog.stdlib.get_logger,
+        repr=False,
+    )
+
+    async def _get_back_up_to_date(self, restarted: Restarted):
+        started = perf_counter()
+        if not restarted.caught_up:
+            for each in self._if_replaying:
+                await self.request(each)  # TODO: response assert?
+        # Even a standby harness has only been sent what we'd replay.
+        for _, register in list(self._handles.registered.values()):
+            await self.request(register)
+        self.restarts.restart_sec.append(restarted.restart_sec)
+        self.restarts.replay_sec.append(perf_counter() - started)
 
     async def transition[R](self, cmd: Command[R]) -> tuple[Self, R | None]:
         response = await self.request(cmd)
         harness = evolve(self, if_replaying=[*self._if_replaying, cmd])
+        if isinstance(self._connection, StandbyConnection):
+            await self._connection.standby(
+                [
+                    each.to_request(registry=self._registry)
+                    for each in harness._if_replaying
+                ],
+            )
         return harness, response
 
     async def request[R](self, cmd: Command[R]) -> R | None:
@@ -389,13 +715,203 @@ class HarnessClient:
         request = cmd.to_request(registry=self._registry)
         try:
             response = await self._connection.request(request)
-        except Restarted:
-            await self._get_back_up_to_date()
+        except Restarted as restarted:
+            await self._get_back_up_to_date(restarted)
             # FIXME: Probably handle infinitely restarting harnesses
             response = await self._connection.request(request)
         if response is not None:
             return cmd.from_response(response, registry=self._registry)
 
+    async def by_handle(self, run: Run, case: TestCase) -> Run:
+        """
+        Refer to the run's schema by handle, if it's worth registering.
+
+        The run is one of the given case, whose schema is the one registered.
+        Harnesses which don't support registering schemas are always sent
+        them in full, as are those whose registration fails.
+        """
+        if not self._capabilities.schema_handles:
+            return run
+
+        key = case.schema_id
+        handle = self._handles.handle_for(key)
+        if handle is None:
+            if not self._handles.worth_registering(key):
+                return run
+            handle = await self._register(key, case)
+            if handle is None:
+                return run
+        return run.by_handle(handle)  # type: ignore[reportUnknownMemberType]
+
+    async def _register(self, key: str, case: TestCase) -> int | None:
+        """
+        Register the case's schema, making room for it if need be.
+
+        Failing to release an evicted schema doesn't stop us registering the
+        new one, as the harness is at worst holding on to one extra schema.
+        """
+        registered = self._handles.registered
+        if len(registered) >= self._handles.maximum:
+            oldest, _ = registered.pop(next(iter(registered)))
+            try:
+                await self.request(Release(handle=oldest))  # type: ignore[reportCallIssue]
+            except (GotStderr, InvalidResponse, ProtocolError) as error:
+                self._log.warning(
+                    "Failed to release a schema handle",
+                    handle=oldest,
+                    error=error,
+                )
+
+        handle, register = self._handles.to_register(case)
+        started = perf_counter()
+        try:
+            response = await self.request(register)
+        except (GotStderr, InvalidResponse, ProtocolError):
+            response = None
+        self.registrations.compile_sec.append(perf_counter() - started)
+
+        if response is None or response.handle != handle:
+            self._handles.failed(key)
+            return None
+        registered[key] = handle, register
+        return handle
+
+    @property
+    def slow_responses(self) -> SlowResponses:
+        """
+        Responses which took the harness longer than predicted.
+        """
+        if isinstance(self._connection, TimedConnection):
+            return self._connection.slow_responses
+        return SlowResponses()
+
+    @property
+    def batch_size(self) -> int:
+        """
+        How many runs we may send to the harness in each message.
+        """
+        return RUN_MANY_BATCH_SIZE if self._capabilities.run_many else 1
+
+    @property
+    def window(self) -> int:
+        """
+        How many run requests we may have outstanding at once.
+        """
+        if not self._capabilities.pipelining or not isinstance(
+            self._connection,
+            PipelinedConnection,
+        ):
+            return 1
+        return max(self._connection.window, 1)
+
+    async def pipeline(
+        self,
+        runs: Iterable[Run],
+    ) -> AsyncGenerator[tuple[Run, Any]]:
+        """
+        Send runs ahead of their responses, up to our window at a time.
+
+        Responses are matched back to their requests by seq, and yielded
+        as they arrive (so not necessarily in request order).
+        Each is either the decoded response, ``None`` if the harness never
+        responded, or whichever exception receiving it raised.
+
+        A response we cannot match to an outstanding request is attributed
+        to the oldest one, leaving it to be reported as a mismatched seq
+        just as it would be were we waiting on each response in turn.
+
+        Requests we give up on while the harness is still running may yet be
+        answered late, so we remember them and discard their responses
+        rather than attributing them to whichever requests are outstanding.
+        """
+        connection = cast("PipelinedConnection", self._connection)
+        window = self.window
+        outstanding: dict[Seq, Run] = {}
+        abandoned: set[Seq] = set()
+
+        async def send(run: Run):
+            try:
+                await connection.send(run.to_request(registry=self._registry))
+            except Restarted as restarted:
+                # Whatever we had sent went down along with the harness.
+                abandoned.clear()
+                await self._get_back_up_to_date(restarted)
+                for each in outstanding.values():
+                    await connection.send(
+                        each.to_request(registry=self._registry),
+                    )
+                await connection.send(run.to_request(registry=self._registry))
+
+        def give_up_on_oldest() -> Run:
+            run = outstanding.pop(next(iter(outstanding)))
+            if connection.alive:
+                abandoned.add(run.seq)  # type: ignore[reportUnknownMemberType]
+            return run
+
+        def late(response: Message) -> bool:
+            try:
+                abandoned.remove(response["seq"])
+            except (KeyError, TypeError):
+                return False
+            return True
+
+        pending = iter(runs)
+        try:
+            while True:
+                while len(outstanding) < window:
+                    run = next(pending, None)
+                    if run is None:
+                        break
+                    await send(run)
+                    outstanding[run.seq] = run  # type: ignore[reportUnknownMemberType]
+
+                if not outstanding:
+                    return
+
+                try:
+                    response = await connection.receive()
+                except (GotStderr, InvalidResponse) as error:
+                    yield give_up_on_oldest(), error
+                    continue
+
+                if response is None:
+                    yield give_up_on_oldest(), None
+                    if not connection.alive:
+                        abandoned.clear()
+                        if outstanding:
+                            # The rest will never be answered, so send them
+                            # again (restarting the harness as we do so).
+                            unanswered = list(outstanding.values())
+                            outstanding.clear()
+                            for run in unanswered:
+                                await send(run)
+                                outstanding[run.seq] = run  # type: ignore[reportUnknownMemberType]
+                    continue
+
+                if late(response):
+                    continue
+
+                try:
+                    run = outstanding.pop(response["seq"])
+                except (KeyError, TypeError):
+                    run = give_up_on_oldest()
+                yield run, run.from_response(response, registry=self._registry)
+        finally:
+            # Don't leave responses lying around for whoever speaks next.
+            while (outstanding or abandoned) and connection.alive:
+                with suppress(GotStderr, InvalidResponse):
+                    response = await connection.receive()
+                    if response is None:
+                        break
+                    if late(response):
+                        continue
+                    try:
+                        del outstanding[response["seq"]]
+                    except (KeyError, TypeError):
+                        if not outstanding:
+                            break
+                        outstanding.popitem()
+
 
 @frozen
 class DialectRunner:
@@ -447,37 +963,150 @@ class DialectRunner:
             schema_without_dialect=schema_without_dialect,
         )
 
+    @property
+    def restarts(self) -> Restarts:
+        """
+        How long recovering from any restarts of the harness has taken.
+        """
+        return self._harness.restarts
+
+    @property
+    def registrations(self) -> Registrations:
+        """
+        How long the harness has taken to prepare schemas registered with it.
+        """
+        return self._harness.registrations
+
+    @property
+    def slow_responses(self) -> SlowResponses:
+        """
+        Responses which took the harness longer than predicted.
+        """
+        return self._harness.slow_responses
+
     async def validate(
         self,
         run: Run,
-        expected: Sequence[Expectation],
+        case: TestCase,
     ) -> SeqResult:
+        expected = case.expected_results()
         try:
+            sent = await self._harness.by_handle(run, case=case)
             response: (
                 tuple[Seq, int, AnyCaseResult] | None
-            ) = await self._harness.request(run)
-            if response is None:
-                result = CaseErrored.uncaught()
+            ) = await self._harness.request(sent)
+        except (GotStderr, InvalidResponse) as error:
+            return self._result_for(run, expected=expected, response=error)
+        return self._result_for(run, expected=expected, response=response)
+
+    async def validate_all(
+        self,
+        seq_cases: Iterable[SeqCase],
+    ) -> AsyncGenerator[tuple[SeqCase, SeqResult]]:
+        """
+        Run each of the given cases, yielding results as they arrive.
+
+        Cases are batched or pipelined to harnesses which support it, in
+        which case results may arrive out of order.
+        """
+        if self._harness.batch_size > 1:
+            for batch in batched(
+                seq_cases,
+                self._harness.batch_size,
+                strict=False,
+            ):
+                for each in await self._validate_batch(batch):
+                    yield each
+            return
+
+        if self._harness.window == 1:
+            for seq_case in seq_cases:
+                yield seq_case, await seq_case.run(runner=self)
+            return
+
+        sent: dict[Seq, SeqCase] = {}
+
+        def runs():
+            for seq_case in seq_cases:
+                sent[seq_case.seq] = seq_case
+                yield seq_case.to_run(runner=self)
+
+        async with aclosing(self._harness.pipeline(runs())) as responses:
+            async for run, response in responses:
+                seq_case = sent.pop(run.seq)  # type: ignore[reportUnknownMemberType]
+                expected = seq_case.case.expected_results()
+                yield seq_case, self._result_for(run, expected, response)
+
+    async def _validate_batch(
+        self,
+        batch: Sequence[SeqCase],
+    ) -> list[tuple[SeqCase, SeqResult]]:
+        runs = [
+            await self._harness.by_handle(
+                seq_case.to_run(runner=self),
+                case=seq_case.case,
+            )
+            for seq_case in batch
+        ]
+        responses: Sequence[
+            tuple[Seq, int, AnyCaseResult] | GotStderr | InvalidResponse | None
+        ]
+        try:
+            got = await self._harness.request(RunMany(runs=runs))  # type: ignore[reportCallIssue]
+        except (GotStderr, InvalidResponse) as error:
+            responses = [error] * len(runs)
+        else:
+            if got is None:
+                responses = [None] * len(runs)
             else:
-                seq, length, result = response
-                if seq != run.seq:  # type: ignore[reportUnknownMemberType]
-                    result = CaseErrored.uncaught(
-                        message="mismatched seq",
-                        expected=run.seq,  # type: ignore[reportUnknownMemberType]
-                        got=seq,
-                        response=result,
-                    )
-                elif length and length != len(expected):
-                    result = CaseErrored.uncaught(
-                        message="wrong number of responses",
-                        expected=len(expected),
-                        got=length,
-                        response=result,
-                    )
-        except GotStderr as error:
-            result = CaseErrored.uncaught(stderr=error.stderr.decode("utf-8"))
-        except InvalidResponse as error:
-            result = CaseErrored.uncaught(response=error.contents)
+                # Runs we got no response for have errored, regardless of
+                # whatever other responses (for seqs we never sent) we got.
+                by_seq = {response[0]: response for response in got}
+                responses = [by_seq.get(run.seq) for run in runs]  # type: ignore[reportUnknownMemberType]
+        results: list[tuple[SeqCase, SeqResult]] = []
+        for seq_case, run, response in zip(
+            batch,
+            runs,
+            responses,
+            strict=True,
+        ):
+            expected = seq_case.case.expected_results()
+            results.append(
+                (seq_case, self._result_for(run, expected, response)),
+            )
+        return results
+
+    def _result_for(
+        self,
+        run: Run,
+        expected: Sequence[Expectation],
+        response: (
+            tuple[Seq, int, AnyCaseResult] | GotStderr | InvalidResponse | None
+        ),
+    ) -> SeqResult:
+        match response:
+            case None:
+                result = CaseErrored.uncaught()
+            case GotStderr(stderr=stderr):
+                result = CaseErrored.uncaught(stderr=stderr.decode("utf-8"))
+            case InvalidResponse(contents=contents):
+                result = CaseErrored.uncaught(response=contents)
+            case (seq, _, result) if seq != run.seq:  # type: ignore[reportUnknownMemberType]
+                result = CaseErrored.uncaught(
+                    message="mismatched seq",
+                    expected=run.seq,  # type: ignore[reportUnknownMemberType]
+                    got=seq,
+                    response=result,
+                )
+            case (_, length, result) if length and length != len(expected):
+                result = CaseErrored.uncaught(
+                    message="wrong number of responses",
+                    expected=len(expected),
+                    got=length,
+                    response=result,
+                )
+            case (_, _, result):
+                pass
         return SeqResult(
             seq=run.seq,  # type: ignore[reportUnknownMemberType]
             implementation=self.implementation,
@@ -497,6 +1126,10 @@ class Implementation:
     _harness: HarnessClient = field(repr=False, alias="harness")
     _reporter: Reporter = field(alias="reporter")
 
+    #: How long the implementation took to start (including anything it
+    #: took to get its harness running at all, e.g. pulling its image).
+    startup_sec: float = field(default=0.0, repr=False)
+
     @classmethod
     def known(cls) -> Set[ConnectableId]:
         data = files("bowtie") / "data"
@@ -519,6 +1152,7 @@ class Implementation:
     ) -> AsyncGenerator[Self]:
         _harness = HarnessClient(**kwargs)
 
+        starting = perf_counter()
         try:
             harness, started = await _harness.transition(START_V1)
         except ProtocolError as err:
@@ -535,10 +1169,11 @@ class Implementation:
         info = ImplementationInfo.from_dict(**started.implementation)
 
         yield cls(
-            harness=harness,
+            harness=evolve(harness, capabilities=started.capabilities),
             report_id=report_id,
             info=info,
             reporter=reporter,
+            startup_sec=perf_counter() - starting,
         )
 
     def supports(self, *dialects: Dialect) -> bool:
@@ -729,16 +1364,20 @@ class TestCase:
         cls,
         dialect: Dialect,
         tests: Iterable[dict[str, Any]],
-        registry: Mapping[str, Schema] = {},
+        registry: Mapping[str, Schema] | SchemaRegistry = {},
         **kwargs: Any,
     ):
-        populated = EMPTY_REGISTRY.with_contents(
-            registry.items(),
-            default_specification=dialect.specification(),
-        )
+        """
+        Load a test case, whose registry may already be populated.
+
+        Passing the same populated registry for many cases shares it between
+        them, rather than each getting a (large) registry of its own.
+        """
+        if not isinstance(registry, Registry):
+            registry = populated_registry(registry, dialect=dialect)
         return cls(
             tests=[Example.from_dict(**test) for test in tests],
-            registry=populated,
+            registry=registry,
             **kwargs,
         )
 
@@ -763,10 +1402,7 @@ class TestCase:
             ),
         )
         if self.registry:
-            # FIXME: Via python-jsonschema/referencing#16
-            as_dict["registry"] = {
-                k: v.contents for k, v in self.registry.items()
-            }
+            as_dict["registry"] = registry_contents(self.registry)
         return as_dict
 
     def syntax(self, dialect: Dialect) -> RenderableType:
@@ -784,11 +1420,28 @@ class TestCase:
         """
         An internally used unique identifier when we want unique cases.
 
-        Really this is just the JSON-serialized, normalized case.
+        Really this is just a digest of the JSON-serialized, normalized case,
+        computed once per case.
 
         But that can change.
         """
-        return json.dumps(self.serializable(), sort_keys=True)
+        return self._digest
+
+    @cached_property
+    def schema_id(self) -> str:
+        """
+        An identifier for this case's schema, along with its registry.
+
+        Cases with the same schema (and registry) share the same id.
+        """
+        return f"{_digest_of(self.schema)}-{registry_id(self.registry)}"
+
+    @cached_property
+    def _digest(self) -> str:
+        serializable = self.serializable()
+        if self.registry:
+            serializable["registry"] = registry_id(self.registry)
+        return _digest_of(serializable)
 
     def expected_results(self) -> Sequence[Expectation]:
         return [each.expected() for each in self.tests]
@@ -4,18 +4,24 @@ Direct connectables do not really connect anywhere and just operate in-memory.
 
 from __future__ import annotations
 
-from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager, nullcontext
+from functools import cache, partial
 from importlib import metadata
-from typing import TYPE_CHECKING, Any, Never
+from typing import TYPE_CHECKING, Any, Literal, Never
+import asyncio
 import pkgutil
 import platform
 
-from attrs import asdict, field, frozen, mutable
+from attrs import asdict, evolve, field, frozen, mutable
+from attrs.converters import optional
+from attrs.validators import in_, optional as optionally
 from referencing.jsonschema import EMPTY_REGISTRY
 from url import URL
 
 from bowtie import DOCS, HOMEPAGE, REPO
 from bowtie._commands import (
+    Capabilities,
     CaseErrored,
     CaseResult,
     FlagTestResult,
@@ -24,11 +30,21 @@ from bowtie._commands import (
     StartedDialect,
 )
 from bowtie._core import Dialect, ImplementationInfo, registry
-from bowtie._registry import Invalid, SchemaCompiler, ValidatorRegistry
+from bowtie._registry import (
+    DEFAULT_CACHE_SIZE,
+    Compiled,
+    Invalid,
+    LRUCache,
+    SchemaCompiler,
+    ValidatorRegistry,
+    canonical,
+    validity,
+)
 from bowtie.exceptions import CannotConnect
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import AsyncGenerator, Callable, Mapping
+    from concurrent.futures import Executor
     from contextlib import AbstractAsyncContextManager
 
     from jsonschema import ValidationError
@@ -37,6 +53,10 @@ if TYPE_CHECKING:
 
     from bowtie._commands import Message
     from bowtie._connectables import ConnectableId
+    from bowtie._registry import CacheInfo, Validate
+
+#: How worker processes import a direct connectable again for themselves.
+type Reimport = tuple[ConnectableId, tuple[tuple[str, Any], ...]]
 
 
 def not_yet_connected(schema: Schema, registry: SchemaRegistry):
@@ -62,29 +82,103 @@ class Unconnection[E: Exception]:
     _current_dialect: Dialect = Dialect.latest()
     _compile: SchemaCompiler[E] = not_yet_connected
 
-    async def request(self, message: Message) -> Message:
+    _cache_size: int = field(
+        default=DEFAULT_CACHE_SIZE,
+        alias="cache_size",
+        repr=False,
+    )
+
+    #: Compiled schemas, keyed by dialect, schema and registry contents.
+    #: Test suites (and perf runs) send the same schemas over and over.
+    _compiled: LRUCache[Validate[E]] = field(
+        init=False,
+        repr=False,
+        eq=False,
+    )
+
+    #: Registries we've seen, by their id(), alongside a key for their
+    #: contents. Cases which share a registry send the very same mapping,
+    #: so we needn't serialize it again for each run. Holding on to each
+    #: mapping keeps its id() from being reused while it's cached.
+    _registry_keys: LRUCache[tuple[Mapping[str, Any], str]] = field(
+        init=False,
+        repr=False,
+        eq=False,
+    )
+
+    #: Where runs happen, if not on the event loop itself.
+    _executor: Executor | None = field(
+        default=None,
+        repr=False,
+        alias="executor",
+    )
+
+    #: How to import this implementation in worker processes, when the
+    #: executor has any. Threads instead share this connection.
+    _reimport: Reimport | None = field(
+        default=None,
+        repr=False,
+        alias="reimport",
+    )
+
+    @_compiled.default  # type: ignore[reportAttributeAccessIssue]
+    def _empty_cache(self) -> LRUCache[Validate[E]]:
+        return LRUCache(maxsize=self._cache_size)
+
+    @_registry_keys.default  # type: ignore[reportAttributeAccessIssue]
+    def _empty_registry_keys(self) -> LRUCache[tuple[Mapping[str, Any], str]]:
+        return LRUCache(maxsize=self._cache_size)
+
+    def cache_info(self) -> CacheInfo:
         """
-        Unpack the request and call our implementation.
+        Statistics about the schemas this connection has compiled.
+        """
+        return self._compiled.info()
 
-        Call us, we always respond (so we never return ``None``).
+    def _compiled_for(
+        self,
+        case: Mapping[str, Any],
+    ) -> Validate[E]:
+        schema = case["schema"]
+        contents = case.get("registry", {})
+        dialect = self._current_dialect
+
+        def compile():
+            registry = EMPTY_REGISTRY.with_contents(
+                contents.items(),
+                default_specification=dialect.specification(),
+            )
+            return self._compile(schema, registry)
+
+        key = (str(dialect.uri), canonical(schema), self._key_for(contents))
+        return self._compiled.get(key, compile)
+
+    def _key_for(self, contents: Mapping[str, Any]) -> str:
+        if not contents:
+            return ""
+        _, key = self._registry_keys.get(
+            id(contents),
+            lambda: (contents, canonical(contents)),
+        )
+        return key
+
+    def speak(self, dialect: Dialect) -> None:
         """
-        match message:  # FIXME: Should request take Commands?
-            case {"cmd": "start", "version": 1}:
-                started = Started(
-                    implementation=self._info.serializable(),  # FIXME
-                    version=1,
-                )
-                return asdict(started)
-            case {"cmd": "dialect", "dialect": uri}:
-                self._current_dialect = Dialect.from_str(uri)
-                self._compile = self.compiler_for(self._current_dialect)
-                return asdict(self._implicit_dialect_response)
-            case {
-                "cmd": "run",
-                "seq": seq,
-                "case": case,
-                "output": "annotations",
-            }:
+        Compile schemas in the given dialect from now on.
+        """
+        if (
+            self._compile is not_yet_connected
+            or dialect != self._current_dialect
+        ):
+            self._current_dialect = dialect
+            self._compile = self.compiler_for(dialect)
+
+    def run(self, run: Message) -> Message:
+        """
+        Run a single test case, responding just as a harness would.
+        """
+        match run:
+            case {"seq": seq, "case": case, "output": "annotations"}:
                 skipped = SkippedTest(
                     message=(
                         "Direct connectables do not support "
@@ -96,18 +190,11 @@ class Unconnection[E: Exception]:
                     "seq": seq,
                     **CaseResult(results=results).serializable(),
                 }
-            case {"cmd": "run", "seq": seq, "case": case}:
+            case {"seq": seq, "case": case}:
                 try:
-                    schema = case["schema"]
-                    registry = EMPTY_REGISTRY.with_contents(
-                        case.get("registry", {}).items(),
-                        default_specification=self._current_dialect.specification(),
-                    )
-                    validate = self._compile(schema, registry)
+                    is_valid = validity(self._compiled_for(case))
                     results = [
-                        FlagTestResult(
-                            valid=validate(test["instance"]) is None,
-                        )
+                        FlagTestResult(valid=is_valid(test["instance"]))
                         for test in case["tests"]
                     ]
                 except Exception as err:  # noqa: BLE001
@@ -121,12 +208,74 @@ class Unconnection[E: Exception]:
                     "seq": seq,
                     **CaseResult(results=results).serializable(),
                 }
+            case _:
+                raise RuntimeError(f"Unknown run: {run!r}")
+
+    async def _run_elsewhere(self, run: Message) -> Message:
+        """
+        Run a test case in our executor, should we have one.
+        """
+        if self._executor is None:
+            return self.run(run)
+        if self._reimport is None:
+            task = partial(self.run, run)
+        else:
+            dialect = str(self._current_dialect.uri)
+            task = partial(_run_in_worker, self._reimport, dialect, run)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, task)
+
+    async def request(self, message: Message) -> Message:
+        """
+        Unpack the request and call our implementation.
+
+        Call us, we always respond (so we never return ``None``).
+        """
+        match message:  # FIXME: Should request take Commands?
+            case {"cmd": "start", "version": 1}:
+                started = Started(
+                    implementation=self._info.serializable(),  # FIXME
+                    version=1,
+                    # Batches are only worth it when we can run them
+                    # concurrently, which needs an executor.
+                    capabilities=Capabilities(
+                        run_many=self._executor is not None,
+                    ),
+                )
+                return asdict(started)
+            case {"cmd": "dialect", "dialect": uri}:
+                self.speak(Dialect.from_str(uri))
+                return asdict(self._implicit_dialect_response)
+            case {"cmd": "run", **run}:
+                return await self._run_elsewhere(run)
+            case {"cmd": "run-many", "runs": runs}:
+                responses = await asyncio.gather(
+                    *(self._run_elsewhere(run) for run in runs),
+                )
+                return {"responses": responses}
             case {"cmd": "stop"}:
                 return {}
             case _:
                 raise RuntimeError(f"Unknown message: {message!r}")
 
 
+@cache
+def _reimported(
+    id: ConnectableId,
+    params: tuple[tuple[str, Any], ...],
+) -> Unconnection[Any]:
+    """
+    A connection to the given direct connectable, kept warm in each worker.
+    """
+    return Direct.from_id(id, **dict(params)).unconnected()
+
+
+def _run_in_worker(reimport: Reimport, dialect: str, run: Message) -> Message:
+    connection = _reimported(*reimport)
+    connection.speak(Dialect.from_str(dialect))
+    return connection.run(run)
+
+
 @frozen
 class DirectImplementation[E: Exception]:
     _compiler_for: Callable[[Dialect], SchemaCompiler[E]]
@@ -216,7 +365,7 @@ def jsonschema(dialect: Dialect) -> SchemaCompiler[ValidationError]:
     def compile(
         schema: Schema,
         registry: SchemaRegistry,
-    ) -> Callable[[Any], Invalid[ValidationError] | None]:
+    ) -> Compiled[ValidationError]:
         DialectValidator: type[Validator] = validator_for(
             schema,
             default=validator_for({"$schema": str(dialect.uri)}),
@@ -229,7 +378,7 @@ def jsonschema(dialect: Dialect) -> SchemaCompiler[ValidationError]:
             if exceptions:
                 return Invalid("Not valid.", exceptions)
 
-        return validate
+        return Compiled(validate=validate, is_valid=validator.is_valid)
 
     return compile
 
@@ -278,16 +427,67 @@ class Direct[E: Exception]:
 
     _wraps: Callable[[], Unconnection[E]] = field(alias="wraps")
 
+    #: Run cases in a pool of threads or of (warm) worker processes rather
+    #: than on the event loop, so that other implementations (and Bowtie
+    #: itself) carry on while cases are validated, and so that batches of
+    #: cases are validated concurrently.
+    _executor: Literal["thread", "process"] | None = field(
+        default=None,
+        validator=optionally(in_(["thread", "process"])),
+        repr=False,
+        alias="executor",
+    )
+
+    #: How many threads or processes to use, by default however many the
+    #: executor itself picks.
+    _workers: int | None = field(
+        default=None,
+        converter=optional(int),
+        repr=False,
+        alias="workers",
+    )
+
+    #: How worker processes import this connectable again. Direct
+    #: connectables not created from an ID use threads instead.
+    _reimport: Reimport | None = field(
+        default=None,
+        repr=False,
+        eq=False,
+        alias="reimport",
+    )
+
     kind = "direct"
 
+    #: Parameters which change only how cases are run, not what runs them.
+    execution_params = frozenset({"executor", "workers"})
+
+    @classmethod
+    def from_id(
+        cls,
+        id: ConnectableId,
+        executor: Literal["thread", "process"] | None = None,
+        workers: int | str | None = None,
+        **params: Any,
+    ) -> Direct[Any]:
+        return cls(
+            wraps=cls._wrapper_for(id, **params),
+            executor=executor,
+            workers=workers,
+            reimport=(id, tuple(params.items())),
+        )
+
     @classmethod
-    def from_id(cls, id: ConnectableId, **params: Any) -> Direct[Any]:
+    def _wrapper_for(
+        cls,
+        id: ConnectableId,
+        **params: Any,
+    ) -> Callable[[], Unconnection[Any]]:
         if id == "null":
-            return cls.null()
+            return NULL
 
         wrapper = IMPLEMENTATIONS.get(id)
         if wrapper is not None:
-            return cls(wraps=wrapper(**params))
+            return wrapper(**params)
 
         try:
             wrapper = pkgutil.resolve_name(id)
@@ -312,7 +512,7 @@ class Direct[E: Exception]:
                         f"You may mean to use {corrected!r}."
                     ),
                 )
-        return cls(wraps=wrapper(**params))
+        return wrapper(**params)
 
     @classmethod
     def null(cls):
@@ -324,11 +524,31 @@ class Direct[E: Exception]:
         """
         return cls(wraps=NULL)  # type: ignore[reportArgumentType]
 
+    def unconnected(self) -> Unconnection[E]:
+        """
+        A fresh connection to this implementation, run on the event loop.
+        """
+        return self._wraps()
+
     def connect(
         self,
         **kwargs: Any,
     ) -> AbstractAsyncContextManager[Unconnection[E]]:
-        return nullcontext(self._wraps())
+        if self._executor is None:
+            return nullcontext(self.unconnected())
+        return self._pooled()
+
+    @asynccontextmanager
+    async def _pooled(self) -> AsyncGenerator[Unconnection[E]]:
+        executor: Executor
+        if self._executor == "process" and self._reimport is not None:
+            executor = ProcessPoolExecutor(max_workers=self._workers)
+            reimport = self._reimport
+        else:
+            executor = ThreadPoolExecutor(max_workers=self._workers)
+            reimport = None
+        with executor:
+            yield evolve(self._wraps(), executor=executor, reimport=reimport)
 
     def registry(self, **kwargs: Any) -> ValidatorRegistry[E]:
         if "registry" not in kwargs:
@@ -0,0 +1,399 @@
+"""
+Sidecar indices, for reading only the parts of a report which are needed.
+
+An index records where in a (JSON Lines) report each line lives -- each
+case by its `Seq`, and each result by its implementation and `Seq` -- so
+that, for instance, the unsuccessful tests of one implementation can be
+counted by reading only that implementation's results.
+
+Indices live alongside the report they index, with an ``.index`` suffix,
+and record a digest of the report so that they are ignored should it change.
+"""
+
+from __future__ import annotations
+
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+import hashlib
+import json
+import mmap
+
+from attrs import evolve, field, frozen, mutable
+
+from bowtie._commands import SeqResult, Unsuccessful
+from bowtie._core import sortable_version_key
+from bowtie._report import InvalidReport, MissingFooter, Report, validating
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping, Sequence
+    from typing import IO, Self
+
+    from bowtie._commands import Seq
+    from bowtie._connectables import ConnectableId
+    from bowtie._core import ImplementationInfo
+    from bowtie._report import RunMetadata
+
+#: Where a line is, and how long it is.
+type _Span = tuple[int, int]
+
+#: The suffix given to an index alongside its report.
+SUFFIX = ".index"
+
+
+class StaleIndex(InvalidReport):
+    """
+    A report has changed since it was indexed.
+    """
+
+
+def path_for(report: Path) -> Path:
+    """
+    Where the index of the given report lives.
+    """
+    return report.with_name(f"{report.name}{SUFFIX}")
+
+
+def _digester() -> hashlib.blake2b:
+    return hashlib.blake2b(digest_size=16)
+
+
+@frozen
+class ReportIndex:
+    """
+    Where each line of a report is.
+    """
+
+    size: int
+    digest: str
+    header: _Span
+    footer: _Span
+    registries: Mapping[str, _Span]
+
+    #: Each case's seq, where it is, and how many tests it has.
+    cases: Sequence[tuple[Seq, int, int, int]]
+
+    results: Mapping[ConnectableId, Sequence[tuple[Seq, int, int]]]
+
+    @classmethod
+    def of(cls, file: IO[bytes]) -> Self:
+        """
+        Index a report by reading through it.
+        """
+        indexer = ReportIndexer()
+        for line in file:
+            indexer.line(json.loads(line), serialized=line)
+        return indexer.index(cls)
+
+    @classmethod
+    def from_serialized(cls, serialized: str | bytes) -> Self:
+        data = json.loads(serialized)
+        return cls(
+            size=data["size"],
+            digest=data["digest"],
+            header=tuple(data["header"]),
+            footer=tuple(data["footer"]),
+            registries={k: tuple(v) for k, v in data["registries"].items()},
+            cases=[tuple(each) for each in data["cases"]],
+            results={
+                id: [tuple(each) for each in spans]
+                for id, spans in data["results"].items()
+            },
+        )
+
+    def serialized(self) -> str:
+        return json.dumps(
+            dict(
+                size=self.size,
+                digest=self.digest,
+                header=self.header,
+                footer=self.footer,
+                registries=self.registries,
+                cases=self.cases,
+                results=self.results,
+            ),
+        )
+
+
+@mutable
+class ReportIndexer:
+    """
+    Build an index of a report as each of its lines is written (or read).
+    """
+
+    _offset: int = 0
+    _digest: hashlib.blake2b = field(factory=_digester)
+    _header: _Span | None = None
+    _footer: _Span | None = None
+    _registries: dict[str, _Span] = field(factory=dict[str, "_Span"])
+    _cases: list[tuple[Seq, int, int, int]] = field(
+        factory=list[tuple["Seq", int, int, int]],
+    )
+    _results: dict[ConnectableId, list[tuple[Seq, int, int]]] = field(
+        factory=dict["ConnectableId", list[tuple["Seq", int, int]]],
+    )
+
+    def line(self, line: Mapping[str, Any], serialized: bytes) -> None:
+        """
+        Index a line, given as it was serialized, including its newline.
+        """
+        length = len(serialized)
+        self._digest.update(serialized)
+        span = self._offset, length
+        match line:
+            case {"implementations": implementations}:
+                self._header = span
+                for id in implementations:
+                    self._results.setdefault(id, [])
+            case {"did_fail_fast": _}:
+                self._footer = span
+            case {"registry_id": id, "registry": _}:
+                self._registries[id] = span
+            case {"seq": seq, "case": case}:
+                self._cases.append((seq, *span, len(case["tests"])))
+            case {"seq": seq, "implementation": id}:
+                self._results.setdefault(id, []).append((seq, *span))
+            case _:
+                raise InvalidReport(line)
+        self._offset += length
+
+    def index[I: ReportIndex](self, cls: type[I] = ReportIndex) -> I:
+        if self._header is None or self._footer is None:
+            raise MissingFooter()
+        return cls(
+            size=self._offset,
+            digest=self._digest.hexdigest(),
+            header=self._header,
+            footer=self._footer,
+            registries=self._registries,
+            cases=self._cases,
+            results=self._results,
+        )
+
+
+@frozen
+class IndexedReport:
+    """
+    A report whose lines are read from its file only once they are needed.
+
+    It answers the same questions `Report` does about how implementations
+    fared, and can be converted into one.
+    """
+
+    _buffer: memoryview = field(alias="buffer", repr=False)
+    _index: ReportIndex = field(alias="index", repr=False)
+    _validated: Callable[[Mapping[str, Any]], Mapping[str, Any]] = field(
+        alias="validated",
+        repr=False,
+    )
+
+    metadata: RunMetadata
+    did_fail_fast: bool
+
+    _unsuccessful: dict[ConnectableId, Unsuccessful] = field(
+        init=False,
+        factory=dict["ConnectableId", Unsuccessful],
+        repr=False,
+    )
+
+    @classmethod
+    def from_buffer(
+        cls,
+        buffer: bytes | mmap.mmap,
+        index: ReportIndex,
+        validate: bool = True,
+    ) -> Self:
+        view = memoryview(buffer)
+        if len(view) != index.size or _digest_of(view) != index.digest:
+            raise StaleIndex("The report has changed since being indexed.")
+        validated = validating(validate)
+        header, footer = (
+            validated(json.loads(bytes(view[start : start + length])))
+            for start, length in [index.header, index.footer]
+        )
+        # The metadata (merged with any from the footer) is all there is to
+        # an otherwise empty report.
+        shell = Report.from_input([header, footer], validate=False)
+        return cls(
+            buffer=view,
+            index=index,
+            validated=validated,
+            metadata=shell.metadata,
+            did_fail_fast=shell.did_fail_fast,
+        )
+
+    @classmethod
+    def from_file(
+        cls,
+        file: IO[bytes],
+        index: ReportIndex,
+        validate: bool = True,
+    ) -> Self:
+        """
+        Memory-map an indexed report from a file (or read it, if we can't).
+        """
+        try:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            buffer = file.read()
+        return cls.from_buffer(buffer, index=index, validate=validate)
+
+    @property
+    def implementations(self) -> Mapping[ConnectableId, ImplementationInfo]:
+        return self.metadata.implementations
+
+    @property
+    def is_empty(self):
+        return not self._index.cases
+
+    @property
+    def total_tests(self):
+        return sum(tests for *_, tests in self._index.cases)
+
+    def only(self, implementations: Iterable[ConnectableId]) -> Self:
+        """
+        Restrict this report to the given implementations.
+        """
+        ids = set(implementations)
+        metadata = evolve(
+            self.metadata,
+            implementations={
+                id: info
+                for id, info in self.implementations.items()
+                if id in ids
+            },
+        )
+        return evolve(self, metadata=metadata)
+
+    def compliance_by_implementation(self):
+        """
+        Return the fraction of passing tests for each reported implementation.
+        """
+        return {
+            id: 1 - (unsuccessful.total / self.total_tests)
+            for id, _, unsuccessful in self.worst_to_best()
+        }
+
+    def unsuccessful(self, implementation: ConnectableId) -> Unsuccessful:
+        """
+        A count of the unsuccessful tests for the given implementation.
+
+        Only the implementation's own results are read to count them.
+        """
+        unsuccessful = self._unsuccessful.get(implementation)
+        if unsuccessful is None:
+            spans = self._index.results[implementation]
+            results = (
+                SeqResult.from_dict(**self._line(offset, length))
+                for _, offset, length in spans
+            )
+            unsuccessful = Unsuccessful.of(
+                each.unsuccessful() for each in results
+            )
+            self._unsuccessful[implementation] = unsuccessful
+        return unsuccessful
+
+    def worst_to_best(self):
+        """
+        All implementations ordered by number of unsuccessful tests.
+
+        Ties are then broken alphabetically.
+        """
+        unsuccessful = [
+            (id, implementation, self.unsuccessful(id))
+            for id, implementation in self.implementations.items()
+        ]
+        unsuccessful.sort(key=lambda each: (each[2].total, each[1].name))
+        return unsuccessful
+
+    def latest_to_oldest(self):
+        """
+        Versioned implementations sorted by their latest to oldest versions.
+        """
+        unsuccessful = [
+            (implementation.version, self.unsuccessful(id))
+            for id, implementation in self.implementations.items()
+            if implementation.version is not None
+        ]
+        unsuccessful.sort(
+            key=lambda version_compliance: sortable_version_key(
+                version_compliance[0],
+            ),
+            reverse=True,
+        )
+        return unsuccessful
+
+    def cases_with_results(self):
+        return self.to_report().cases_with_results()
+
+    def to_report(self) -> Report:
+        """
+        Load the parts of this report which are needed as a `Report`.
+        """
+        return Report.from_input(self.lines(), validate=False)
+
+    def lines(self) -> Iterable[Mapping[str, Any]]:
+        """
+        The (deserialized) lines of this report, as `Report.from_input` takes.
+
+        Only results of implementations this report is restricted to are
+        included.
+        """
+        header = dict(self._line(*self._index.header))
+        header["implementations"] = {
+            id: info
+            for id, info in header["implementations"].items()
+            if id in self.implementations
+        }
+        yield header
+        for span in self._index.registries.values():
+            yield self._line(*span)
+        for _, offset, length, _ in self._index.cases:
+            yield self._line(offset, length)
+        for id in self.implementations:
+            for _, offset, length in self._index.results[id]:
+                yield self._line(offset, length)
+        yield self._line(*self._index.footer)
+
+    def _line(self, offset: int, length: int) -> Mapping[str, Any]:
+        return self._validated(
+            json.loads(bytes(self._buffer[offset : offset + length])),
+        )
+
+
+def _digest_of(buffer: memoryview) -> str:
+    digest = _digester()
+    digest.update(buffer)
+    return digest.hexdigest()
+
+
+def indexed(
+    file: IO[bytes],
+    validate: bool = True,
+) -> IndexedReport | None:
+    """
+    The report in the given file, read via its index, if it has a usable one.
+
+    A corrupt index is rebuilt (by reading through the report), whereas one
+    for a report which has since changed is ignored.
+    """
+    name = getattr(file, "name", None)
+    if not isinstance(name, str):
+        return None
+    report = Path(name)
+    sidecar = path_for(report)
+    try:
+        index = ReportIndex.from_serialized(sidecar.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+        index = ReportIndex.of(file)
+        file.seek(0)
+        with suppress(OSError):
+            sidecar.write_text(index.serialized())
+    if report.stat().st_size != index.size:  # it's changed since indexing
+        return None
+    try:
+        return IndexedReport.from_file(file, index=index, validate=validate)
+    except StaleIndex:
+        return None
@@ -0,0 +1,229 @@
+"""
+A pool of already running harness containers, kept warm between runs.
+
+Starting a container is often the slowest part of a small Bowtie run.
+The pool is a long-lived process which starts containers ahead of time
+and hands them out over a Unix socket, so that a run need only attach to
+one rather than waiting for it to start.
+
+Each container is leased exactly once -- whoever leases it owns it, and
+removes it when done -- and the pool starts a replacement in the
+background whenever one is leased.
+Containers nobody leases within a while are removed.
+"""
+
+from __future__ import annotations
+
+from contextlib import suppress
+from os import environ
+from typing import TYPE_CHECKING
+import asyncio
+import json
+
+from attrs import field, frozen, mutable
+from imaged import EngineError
+import structlog
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from imaged import Engine
+
+
+#: The environment variable naming the socket of a running pool, which
+#: opts in to leasing containers from it.
+POOL_ENV_VAR = "BOWTIE_POOL"
+
+
+def chosen_pool() -> str | None:
+    """
+    The socket of the pool we've been asked to lease containers from, if any.
+    """
+    return environ.get(POOL_ENV_VAR) or None
+
+
+async def lease(socket: str, image: str) -> str | None:
+    """
+    Lease a running container for the given image from a pool.
+
+    Returns `None` if the pool could not provide one, in which case the
+    caller should start a container itself.
+    """
+    try:
+        reader, writer = await asyncio.open_unix_connection(socket)
+    except OSError:
+        return None
+
+    try:
+        writer.write(json.dumps({"lease": image}).encode() + b"\n")
+        await writer.drain()
+        response = json.loads(await reader.readline() or "{}")
+    except (OSError, json.JSONDecodeError):
+        return None
+    finally:
+        writer.close()
+        with suppress(OSError):
+            await writer.wait_closed()
+
+    match response:
+        case {"container": str(container)}:
+            return container
+        case _:
+            return None
+
+
+@frozen
+class _Warm:
+    """
+    A started container waiting to be leased.
+    """
+
+    id: str
+    since: float
+
+
+@mutable
+class Pool:
+    """
+    Warm containers, by image, for anyone who asks.
+    """
+
+    _engine: Engine = field(alias="engine")
+
+    #: How many containers to keep started for each image once leased.
+    _warm: int = field(default=1, alias="warm")
+
+    #: How long a started container may wait for a lease before removal.
+    _ttl_sec: float = field(default=600, alias="ttl_sec")
+
+    _idle: dict[str, list[_Warm]] = field(factory=dict[str, list[_Warm]])
+    _pending: dict[str, int] = field(factory=dict[str, int])
+    _starting: set[asyncio.Task[None]] = field(
+        factory=set[asyncio.Task[None]],
+    )
+
+    _log: structlog.stdlib.BoundLogger = field(
+        factory=structlog.stdlib.get_logger,
+    )
+
+    async def serve(self, socket: Path) -> None:
+        """
+        Hand out containers to clients connecting to the given socket.
+        """
+        server = await asyncio.start_unix_server(self._client, path=socket)
+        self._log.info("Pool ready", socket=str(socket), logger_name="pool")
+        try:
+            async with server:
+                while True:
+                    await asyncio.sleep(self._ttl_sec / 10)
+                    await self._evict()
+        finally:
+            for task in self._starting:
+                task.cancel()
+            await self._remove_all()
+
+    async def lease(self, image: str) -> str:
+        """
+        Hand out a running container for the given image.
+
+        The first lease for an image has to wait for a container to start,
+        but leaves others warming up for whoever asks next.
+        """
+        idle = self._idle.setdefault(image, [])
+        leased = idle.pop(0).id if idle else None
+        self._refill(image)
+        if leased is None:
+            leased = await self._started(image)
+        return leased
+
+    async def _client(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        try:
+            request = json.loads(await reader.readline())
+        except json.JSONDecodeError:
+            request = None
+
+        match request:
+            case {"lease": str(image)}:
+                try:
+                    id = await self.lease(image)
+                except EngineError as error:
+                    self._log.error(
+                        "Could not start a container",
+                        error=str(error),
+                        logger_name=image,
+                    )
+                    response = {"error": str(error)}
+                else:
+                    self._log.debug("Leased", container=id, logger_name=image)
+                    response = {"container": id}
+            case _:
+                response = {"error": "invalid request"}
+
+        writer.write(json.dumps(response).encode() + b"\n")
+        with suppress(OSError):
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+
+    async def _started(self, image: str) -> str:
+        id = await self._engine.create_pulling_if_needed(image, network=False)
+        try:
+            await self._engine.start_detached(id)
+        except EngineError:
+            await self._engine.remove(id)
+            raise
+        return id
+
+    def _refill(self, image: str) -> None:
+        """
+        Start however many containers it takes to have enough warm again.
+        """
+        pending = self._pending.get(image, 0)
+        for _ in range(self._warm - len(self._idle[image]) - pending):
+            self._pending[image] = self._pending.get(image, 0) + 1
+            task = asyncio.create_task(self._warm_up(image))
+            self._starting.add(task)
+            task.add_done_callback(self._starting.discard)
+
+    async def _warm_up(self, image: str) -> None:
+        try:
+            id = await self._started(image)
+        except EngineError as error:
+            self._log.error(
+                "Could not start a container",
+                error=str(error),
+                logger_name=image,
+            )
+            return
+        finally:
+            self._pending[image] -= 1
+        now = asyncio.get_running_loop().time()
+        self._idle[image].append(_Warm(id=id, since=now))
+
+    async def _evict(self) -> None:
+        """
+        Remove any container which has waited too long to be leased.
+        """
+        now = asyncio.get_running_loop().time()
+        for image, idle in list(self._idle.items()):
+            stale = [each for each in idle if now - each.since > self._ttl_sec]
+            for each in stale:
+                idle.remove(each)
+                self._log.debug(
+                    "Evicting",
+                    container=each.id,
+                    logger_name=image,
+                )
+                with suppress(EngineError):
+                    await self._engine.remove(each.id)
+
+    async def _remove_all(self) -> None:
+        for idle in self._idle.values():
+            for each in idle:
+                with suppress(EngineError):
+                    await self._engine.remove(each.id)
+        self._idle.clear()
@@ -4,10 +4,13 @@ Validator registries, likely for eventual upstreaming into referencing.
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from threading import Lock
 from typing import TYPE_CHECKING, Any
+import json
 
-from attrs import evolve, field, frozen
+from attrs import evolve, field, frozen, mutable
 from referencing.jsonschema import EMPTY_REGISTRY, Schema, SchemaRegistry
 
 if TYPE_CHECKING:
@@ -22,6 +25,35 @@ type SchemaCompiler[E: Exception] = Callable[
 ]
 
 
+@frozen
+class Compiled[E: Exception]:
+    """
+    A compiled schema which can also cheaply decide validity on its own.
+
+    Collecting (and grouping) every error can be much more expensive than
+    finding the first one, which is all it takes to know an instance is
+    invalid. Compilers may return one of these rather than a bare
+    `Validate` callable to say so.
+    """
+
+    _validate: Validate[E] = field(alias="validate")
+
+    #: Whether an instance is valid, stopping at its first error.
+    is_valid: Callable[[Any], bool]
+
+    def __call__(self, instance: Any) -> ExceptionGroup[E] | None:
+        return self._validate(instance)
+
+
+def validity[E: Exception](validate: Validate[E]) -> Callable[[Any], bool]:
+    """
+    A validity check for the given compiled schema, as cheap as it offers.
+    """
+    if isinstance(validate, Compiled):
+        return validate.is_valid
+    return lambda instance: validate(instance) is None
+
+
 class Invalid[E: Exception](ExceptionGroup[E]):
     """
     An instance is not valid under a schema.
@@ -38,6 +70,78 @@ class UnexpectedlyValid(Exception):
     """
 
 
+#: How many compiled validators a registry keeps by default.
+DEFAULT_CACHE_SIZE = 128
+
+_CANONICAL = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+
+def canonical(schema: Schema) -> str:
+    """
+    A canonical serialization of a schema, identifying it by its contents.
+    """
+    return _CANONICAL.encode(schema)
+
+
+@frozen
+class CacheInfo:
+    """
+    Statistics about a cache, in the spirit of `functools.lru_cache`'s.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+@mutable
+class LRUCache[V]:
+    """
+    A bounded cache, evicting whatever was least recently used.
+    """
+
+    maxsize: int = DEFAULT_CACHE_SIZE
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _contents: OrderedDict[Hashable, V] = field(
+        init=False,
+        factory=OrderedDict[Hashable, V],
+        repr=False,
+    )
+    _lock: Lock = field(init=False, factory=Lock, repr=False, eq=False)
+
+    def get(self, key: Hashable, create: Callable[[], V]) -> V:
+        """
+        Get the value for the given key, creating (and caching) it if needed.
+
+        Values are created outside of the cache's lock, so threads sharing
+        a cache may (rarely) each create the same value.
+        """
+        with self._lock:
+            value = self._contents.get(key)
+            if value is not None:
+                self.hits += 1
+                self._contents.move_to_end(key)
+                return value
+            self.misses += 1
+
+        value = create()
+        with self._lock:
+            self._contents[key] = value
+            if len(self._contents) > self.maxsize:
+                self._contents.popitem(last=False)
+        return value
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            maxsize=self.maxsize,
+            currsize=len(self._contents),
+        )
+
+
 @frozen
 class Validator[E: Exception]:
     """
@@ -53,8 +157,8 @@ class Validator[E: Exception]:
     ) -> Validator[E]:
         return evolve(self, registry=resources @ self._registry)
 
-    def is_valid(self, instance: Any):
-        return self.validate(instance) is None
+    def is_valid(self, instance: Any) -> bool:
+        return validity(self.validate)(instance)
 
     def validated(self, instance: Any):
         exception = self.validate(instance)
@@ -70,8 +174,28 @@ class Validator[E: Exception]:
 
 @frozen
 class ValidatorRegistry[E: Exception]:
+    """
+    Schemas, along with how to compile them into validators.
+
+    Compiled validators are cached (by the contents of their schema), as
+    compiling the same schema over and over is expensive.
+    """
+
     _compile: SchemaCompiler[E] = field(alias="compile")
     _registry: SchemaRegistry = field(default=EMPTY_REGISTRY, alias="registry")
+    _cache_size: int = field(
+        default=DEFAULT_CACHE_SIZE,
+        alias="cache_size",
+        repr=False,
+    )
+
+    # Registries with different schemas (e.g. ones produced by `evolve`)
+    # get their own cache, as their compiled validators may differ.
+    _cache: LRUCache[Validator[E]] = field(init=False, repr=False, eq=False)
+
+    @_cache.default  # type: ignore[reportAttributeAccessIssue]
+    def _empty_cache(self) -> LRUCache[Validator[E]]:
+        return LRUCache(maxsize=self._cache_size)
 
     def __rmatmul__(
         self,
@@ -89,11 +213,25 @@ class ValidatorRegistry[E: Exception]:
         """
         Return a `Validator` using the schema at the given URI.
         """
-        return self.for_schema(self.schema(uri))
+        return self._cache.get(
+            ("uri", str(uri)),
+            lambda: self.for_schema(self.schema(uri)),
+        )
 
     def for_schema(self, schema: Schema) -> Validator[E]:
         """
         Return a `Validator` using the given schema.
         """
-        validate: Validate[E] = self._compile(schema, self._registry)
-        return Validator(validate=validate, registry=self)
+        return self._cache.get(
+            canonical(schema),
+            lambda: Validator(
+                validate=self._compile(schema, self._registry),
+                registry=self,
+            ),
+        )
+
+    def cache_info(self) -> CacheInfo:
+        """
+        How well the cache of compiled validators is doing.
+        """
+        return self._cache.info()
@@ -1,28 +1,51 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, TypedDict
+from functools import cache, partial
+from tempfile import TemporaryFile
+from typing import TYPE_CHECKING, Any, TypedDict
 import importlib.metadata
 import json
 import sys
 
-from attrs import asdict, field, frozen
+from attrs import asdict, evolve, field, frozen, mutable
 from attrs.filters import exclude
 from rpds import HashTrieMap
 from url import URL
 import structlog.stdlib
 
 from bowtie._commands import Seq, SeqCase, SeqResult, Unsuccessful
-from bowtie._core import Dialect, TestCase, sortable_version_key
+from bowtie._compression import compressing, decompressed
+from bowtie._core import (
+    Dialect,
+    TestCase,
+    populated_registry,
+    registry_id,
+    sortable_version_key,
+)
 from bowtie._direct_connectable import Direct
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Mapping
-    from typing import Any, Literal, Self, TextIO
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+    from typing import IO, Literal, Self, TextIO
+
+    from referencing.jsonschema import SchemaRegistry
 
     from bowtie._commands import AnyTestResult
+    from bowtie._compression import Compression
     from bowtie._connectables import ConnectableId
     from bowtie._core import Example, ImplementationInfo, Test
+    from bowtie._index import ReportIndexer
+
+
+#: The version of the report format we write.
+#:
+#: It changes whenever earlier readers would no longer understand reports,
+#: as when cases started referring to registries on lines of their own (2).
+REPORT_VERSION = 2
 
 
 class InvalidReport(Exception):
@@ -70,10 +93,100 @@ class InconsistentCases(InvalidReport):
     """
 
 
+class UnsupportedReportVersion(InvalidReport):
+    """
+    A report is in a newer format than this version of Bowtie understands.
+    """
+
+
 def writer(file: TextIO = sys.stdout) -> Callable[..., Any]:
     return lambda **result: file.write(f"{json.dumps(result)}\n")  # type: ignore[reportUnknownArgumentType]
 
 
+def validating(
+    validate: bool = True,
+) -> Callable[[Mapping[str, Any]], Mapping[str, Any]]:
+    """
+    Something which validates each line of a report (or which doesn't).
+    """
+    if not validate:
+        return _trusted
+    return _report_validator().validated
+
+
+@cache
+def _report_validator():
+    return (
+        Direct.from_id("python-jsonschema")
+        .registry()
+        .for_uri(URL.parse("tag:bowtie.report,2024:report"))
+    )
+
+
+def _trusted(data: Mapping[str, Any]) -> Mapping[str, Any]:
+    return data
+
+
+def deserialized(
+    serialized: str | Path,
+    validate: bool = True,
+) -> list[Mapping[str, Any]]:
+    """
+    The (validated) lines of a serialized report, or of one at a given path.
+
+    Validating is by far the slowest part of reading a report, and this takes
+    and returns only plain data, so it can happen in another process -- which
+    a `Report` itself can't be sent back from, as its registries can't be
+    pickled.
+    """
+    validated = validating(validate)
+    if isinstance(serialized, str):
+        lines = serialized.splitlines()
+        return [validated(json.loads(line)) for line in lines]
+    with serialized.open("rb") as file:
+        return [validated(json.loads(line)) for line in decompressed(file)]
+
+
+def _case_lines(
+    seq_case: SeqCase,
+    registries: set[str],
+) -> Iterable[dict[str, Any]]:
+    """
+    The report lines for a case.
+
+    A case's registry is written on a line of its own the first time it is
+    seen, and then referred to by ID, as cases often share large registries.
+    """
+    line = seq_case.serializable()
+    registry = seq_case.case.registry
+    if registry:
+        id = registry_id(registry)
+        contents = line["case"].pop("registry")
+        if id not in registries:
+            registries.add(id)
+            yield dict(registry_id=id, registry=contents)
+        line["registry_id"] = id
+    yield line
+
+
+def _merged(ours: Mapping[str, Any], theirs: Mapping[str, Any]):
+    """
+    Merge run metadata, combining (rather than replacing) nested mappings.
+
+    Per-implementation metadata (like how long restarts took) is keyed by
+    implementation, so merging keeps each implementation's entry, whilst
+    anything else is taken from ``ours``.
+    """
+    merged = dict(ours)
+    for key, value in theirs.items():
+        existing = merged.get(key)
+        if isinstance(existing, Mapping) and isinstance(value, Mapping):
+            merged[key] = {**existing, **value}
+        else:
+            merged.setdefault(key, value)
+    return merged
+
+
 @frozen
 class Reporter:
     _write: Callable[..., Any] = field(default=writer(), alias="write")
@@ -81,6 +194,9 @@ class Reporter:
         factory=structlog.stdlib.get_logger,
     )
 
+    #: The IDs of registries which have been written in the current report.
+    _registries: set[str] = field(init=False, factory=set[str])
+
     def schema_without_dialect(
         self,
         implementation: str,
@@ -101,13 +217,23 @@ class Reporter:
 
     def ready(self, run_metadata: RunMetadata):
         self._log.debug("Will speak", dialect=run_metadata.dialect)
+        # A new report, which must contain whichever registries it uses.
+        self._registries.clear()
         self._write(**run_metadata.serializable())
 
-    def finished(self, did_fail_fast: bool):
-        self._write(did_fail_fast=did_fail_fast)
+    def finished(
+        self,
+        did_fail_fast: bool,
+        metadata: Mapping[str, Any] = {},
+    ):
+        if metadata:
+            self._write(did_fail_fast=did_fail_fast, metadata=metadata)
+        else:
+            self._write(did_fail_fast=did_fail_fast)
 
     def case_started(self, seq_case: SeqCase, dialect: Dialect):
-        self._write(**seq_case.serializable())
+        for line in _case_lines(seq_case, registries=self._registries):
+            self._write(**line)
         log = self._log.bind(
             case=seq_case.case.description,
             schema=seq_case.case.schema,
@@ -127,6 +253,222 @@ class Reporter:
         return got_result
 
 
+@mutable
+class ReportWriter:
+    """
+    Write a single report for implementations which are run separately.
+
+    Each implementation's run reports to its own `Reporter` (see
+    `ReportWriter.reporter`), and lines are written as soon as they arrive
+    rather than once every run has finished, so memory use grows with the
+    number of implementations rather than the number of results.
+
+    A report's header names every implementation in it (along with what
+    each said about itself on starting), so lines are held back until each
+    expected implementation has either started running or been `dropped
+    <ReportWriter.dropped>`. Held lines are spooled to a temporary file
+    rather than kept in memory.
+
+    Cases are written once, however many implementations run them. Which
+    ones we've written is known only from the highest seq we've written,
+    so every run must be of the same cases numbered in the same order (as
+    runs of the same materialized cases are).
+    """
+
+    _write: Callable[[str], Any] = field(alias="write")
+
+    #: How many implementations have yet to send their header.
+    _expecting: int = field(alias="expecting")
+
+    #: Something to also index each line as it is written.
+    _indexer: ReportIndexer | None = field(default=None, alias="indexer")
+
+    #: How many implementations have yet to send their footer.
+    _running: int = field(init=False, default=0)
+
+    _header: dict[str, Any] | None = field(init=False, default=None)
+    _wrote_header: bool = field(init=False, default=False)
+    _held: IO[str] | None = field(init=False, default=None)
+    _last_seq: int = field(init=False, default=0)
+    _registries: set[str] = field(init=False, factory=set[str])
+
+    _did_fail_fast: bool = field(init=False, default=False)
+    _metadata: Mapping[str, Any] = field(
+        init=False,
+        factory=dict[str, Any],
+    )
+
+    def reporter(self) -> Reporter:
+        """
+        A reporter for one implementation's run.
+        """
+        return Reporter(write=self._line)
+
+    def dropped(self) -> None:
+        """
+        An expected implementation will not be running after all.
+        """
+        self._expecting -= 1
+        self._flush()
+
+    @property
+    def wrote_header(self) -> bool:
+        return self._wrote_header
+
+    def _line(self, **line: Any) -> None:
+        match line:
+            case {"implementations": implementations, **header}:
+                self._got_header(implementations=implementations, **header)
+                self._flush()
+            case {"did_fail_fast": did_fail_fast, **footer}:
+                self._running -= 1
+                self._did_fail_fast = self._did_fail_fast or did_fail_fast
+                self._metadata = _merged(
+                    self._metadata,
+                    footer.get("metadata", {}),
+                )
+                self._flush()
+            case {"registry_id": id, "registry": _}:
+                if id not in self._registries:
+                    self._registries.add(id)
+                    self._emit(line)
+            case {"seq": seq, "case": _}:
+                # Any lower seq is a case another run already told us of.
+                if seq > self._last_seq:
+                    self._last_seq = seq
+                    self._emit(line)
+            case _:
+                self._emit(line)
+
+    def _got_header(self, implementations: Mapping[str, Any], **header: Any):
+        self._expecting -= 1
+        self._running += 1
+        if self._header is None:
+            self._header = {**header, "implementations": {}, "metadata": {}}
+        self._header["implementations"].update(implementations)
+        self._header["metadata"] = _merged(
+            self._header["metadata"],
+            header.get("metadata", {}),
+        )
+
+    def _emit(self, line: Mapping[str, Any]) -> None:
+        if self._wrote_header:
+            self._write_line(line)
+            return
+        if self._held is None:
+            self._held = TemporaryFile("w+", encoding="utf-8")  # noqa: SIM115
+        self._held.write(json.dumps(line))
+        self._held.write("\n")
+
+    def _write_line(self, line: Mapping[str, Any]) -> None:
+        serialized = json.dumps(line)
+        self._write(serialized)
+        self._index(line, serialized)
+
+    def _index(self, line: Mapping[str, Any], serialized: str) -> None:
+        if self._indexer is not None:
+            # The written line is followed by a newline.
+            self._indexer.line(line, serialized=f"{serialized}\n".encode())
+
+    def _flush(self) -> None:
+        if self._expecting or self._header is None:
+            return
+        if not self._wrote_header:
+            self._wrote_header = True
+            self._write_line(self._header)
+            if self._held is not None:
+                with self._held as held:
+                    held.seek(0)
+                    for serialized in held:
+                        serialized = serialized.removesuffix("\n")
+                        self._write(serialized)
+                        if self._indexer is not None:
+                            self._index(json.loads(serialized), serialized)
+                self._held = None
+        if not self._running:
+            footer: dict[str, Any] = {"did_fail_fast": self._did_fail_fast}
+            if self._metadata:
+                footer["metadata"] = self._metadata
+            self._write_line(footer)
+
+
+@mutable
+class ReportCollector:
+    """
+    Collect a run straight into a `Report`, without serializing it.
+
+    It takes the place of a `Reporter` (to which it passes everything along,
+    e.g. to log results) for runs whose report is needed in-process.
+    """
+
+    _reporter: Reporter = field(
+        factory=lambda: Reporter(write=lambda **_: None),  # type: ignore[reportUnknownArgumentType]
+        alias="reporter",
+    )
+
+    _metadata: RunMetadata | None = field(init=False, default=None)
+    _cases: HashTrieMap[Seq, TestCase] = field(
+        init=False,
+        default=HashTrieMap(),
+    )
+    _results: HashTrieMap[
+        ConnectableId,
+        HashTrieMap[Seq, SeqResult],
+    ] = field(init=False, default=HashTrieMap())
+    _did_fail_fast: bool | None = field(init=False, default=None)
+
+    def ready(self, run_metadata: RunMetadata):
+        self._reporter.ready(run_metadata)
+        self._metadata = run_metadata
+
+    def finished(
+        self,
+        did_fail_fast: bool,
+        metadata: Mapping[str, Any] = {},
+    ):
+        self._reporter.finished(did_fail_fast=did_fail_fast, metadata=metadata)
+        self._did_fail_fast = did_fail_fast
+        if metadata and self._metadata is not None:
+            self._metadata = evolve(
+                self._metadata,
+                metadata=_merged(self._metadata.metadata, metadata),
+            )
+
+    def case_started(self, seq_case: SeqCase, dialect: Dialect):
+        got_result = self._reporter.case_started(seq_case, dialect)
+        self._cases = self._cases.insert(seq_case.seq, seq_case.case)
+
+        def collect(result: SeqResult):
+            got_result(result=result)
+            current = self._results.get(result.implementation, HashTrieMap())
+            self._results = self._results.insert(
+                result.implementation,
+                current.insert(result.seq, result),
+            )
+
+        return collect
+
+    def report(self) -> Report:
+        """
+        The report for the (finished) run.
+        """
+        if self._metadata is None:
+            raise EmptyReport()
+        if self._did_fail_fast is None:
+            raise MissingFooter()
+
+        results = self._results
+        for id in self._metadata.implementations:
+            if id not in results:
+                results = results.insert(id, HashTrieMap())
+        return Report(
+            cases=self._cases,
+            results=results,
+            metadata=self._metadata,
+            did_fail_fast=self._did_fail_fast,
+        )
+
+
 @frozen
 class RunMetadata:
     dialect: Dialect
@@ -154,10 +496,13 @@ class RunMetadata:
         dialect: str,
         implementations: dict[str, dict[str, Any]],
         started: str | None = None,
+        report_version: int = 1,
         **kwargs: Any,
     ) -> RunMetadata:
         from bowtie._core import ImplementationInfo  # noqa: PLC0415
 
+        if report_version > REPORT_VERSION:
+            raise UnsupportedReportVersion(report_version)
         if started is not None:
             kwargs["started"] = datetime.fromisoformat(started)
         return cls(
@@ -176,6 +521,7 @@ class RunMetadata:
             recurse=False,
         )
         as_dict.update(
+            report_version=REPORT_VERSION,
             dialect=self.dialect.serializable(),
             started=as_dict.pop("started").isoformat(),
             # FIXME: This transformation is to support the UI parsing
@@ -211,6 +557,13 @@ class Report:  # noqa: PLW1641
     metadata: RunMetadata
     did_fail_fast: bool
 
+    # Computed (once) on demand, as implementations may have many failures.
+    _unsuccessful: dict[ConnectableId, Unsuccessful] = field(
+        init=False,
+        factory=dict["ConnectableId", Unsuccessful],
+        repr=False,
+    )
+
     def __eq__(self, other: object):
         if type(other) is not Report:
             return NotImplemented
@@ -221,7 +574,10 @@ class Report:  # noqa: PLW1641
         ):
             return False
 
-        this, that = asdict(self, recurse=False), asdict(other, recurse=False)
+        this, that = (
+            asdict(each, recurse=False, filter=exclude("_unsuccessful"))
+            for each in (self, other)
+        )
 
         cases = [v for _, v in sorted(this.pop("_cases").items())]
         if cases != [v for _, v in sorted(that.pop("_cases").items())]:
@@ -235,21 +591,24 @@ class Report:  # noqa: PLW1641
         return this == that
 
     @classmethod
-    def from_input(cls, input: Iterable[Mapping[str, Any]]) -> Self:
-        # TODO: Support some interface for enabling/disabling validation.
-        validator = (
-            Direct.from_id("python-jsonschema")
-            .registry()
-            .for_uri(
-                URL.parse("tag:bowtie.report,2024:report"),
-            )
-        )
+    def from_input(
+        cls,
+        input: Iterable[Mapping[str, Any]],
+        validate: bool = True,
+    ) -> Self:
+        """
+        Replay report data, one (deserialized) line at a time.
 
+        Each line is validated against Bowtie's report schema unless
+        ``validate`` is false, which is much faster and is safe for reports
+        produced by Bowtie itself.
+        """
+        validated = validating(validate)
         iterator = iter(input)
         header = next(iterator, None)
         if header is None:
             raise EmptyReport()
-        metadata = RunMetadata.from_dict(**validator.validated(header))
+        metadata = RunMetadata.from_dict(**validated(header))
 
         results: HashTrieMap[  # type: ignore[reportUnknownVariableType] # pyright cannot infer the type returned by HashTrieMap.fromkeys
             ConnectableId,
@@ -259,16 +618,38 @@ class Report:  # noqa: PLW1641
             HashTrieMap(),
         )
         cases: HashTrieMap[Seq, TestCase] = HashTrieMap()
+        registries: dict[str, SchemaRegistry] = {}
 
         for data in iterator:
-            match validator.validated(data):
+            match validated(data):
+                case {"registry_id": id, "registry": contents}:
+                    registries[id] = populated_registry(
+                        contents,
+                        dialect=metadata.dialect,
+                    )
+                    continue
                 case {"seq": seq, "case": case}:
                     if seq in cases:
                         raise DuplicateCase(seq)
+                    if "registry_id" in data:
+                        registry = registries.get(data["registry_id"])
+                        if registry is None:
+                            # A case sharing a registry we never saw.
+                            raise InvalidReport(data)
+                        case = dict(case, registry=registry)
                     case = TestCase.from_dict(dialect=metadata.dialect, **case)
                     cases = cases.insert(seq, case)
                     continue
-                case {"did_fail_fast": did_fail_fast}:
+                case {"did_fail_fast": did_fail_fast, **footer}:
+                    # Metadata only known once a run has finished comes last.
+                    if "metadata" in footer:
+                        metadata = evolve(
+                            metadata,
+                            metadata=_merged(
+                                metadata.metadata,
+                                footer["metadata"],
+                            ),
+                        )
                     return cls(
                         results=results,
                         cases=cases,
@@ -287,8 +668,40 @@ class Report:  # noqa: PLW1641
         raise MissingFooter()
 
     @classmethod
-    def from_serialized(cls, serialized: Iterable[str]) -> Self:
-        return cls.from_input(json.loads(line) for line in serialized)
+    def from_serialized(
+        cls,
+        serialized: Iterable[str | bytes],
+        validate: bool = True,
+    ) -> Self:
+        return cls.from_input(
+            (json.loads(line) for line in serialized),
+            validate=validate,
+        )
+
+    @classmethod
+    def from_file(cls, file: IO[bytes], validate: bool = True) -> Self:
+        """
+        Parse a report from a file, which may be compressed.
+        """
+        return cls.from_serialized(decompressed(file), validate=validate)
+
+    @classmethod
+    def from_each_serialized(
+        cls,
+        serialized: Iterable[str | Path],
+        validate: bool = True,
+    ) -> list[Self]:
+        """
+        Parse many serialized reports (or ones at paths), in parallel.
+        """
+        contents = list(serialized)
+        if not validate or len(contents) <= 1:
+            each = (deserialized(each, validate) for each in contents)
+            return [cls.from_input(lines, validate=False) for lines in each]
+
+        with ProcessPoolExecutor() as pool:
+            each = pool.map(partial(deserialized, validate=validate), contents)
+            return [cls.from_input(lines, validate=False) for lines in each]
 
     @classmethod
     def empty(
@@ -371,6 +784,8 @@ class Report:  # noqa: PLW1641
         did_fail_fast = first.did_fail_fast
         started = first.metadata.started
 
+        run_metadata = dict(first.metadata.metadata)
+
         for report in rest:
             if report.metadata.dialect != dialect:
                 raise InconsistentDialects(
@@ -385,6 +800,8 @@ class Report:  # noqa: PLW1641
             did_fail_fast = did_fail_fast or report.did_fail_fast
             started = min(started, report.metadata.started)
 
+            run_metadata = _merged(run_metadata, report.metadata.metadata)
+
             # Map this report's seqs to the canonical ones.
             report_uniqs = {case.uniq() for case in report._cases.values()}
             if report_uniqs != case_to_seq.keys():
@@ -421,6 +838,7 @@ class Report:  # noqa: PLW1641
                 implementations=implementations,
                 dialect=dialect,
                 started=started,
+                metadata=run_metadata,
             ),
             did_fail_fast=did_fail_fast,
         )
@@ -430,16 +848,29 @@ class Report:  # noqa: PLW1641
         Serialize this report for consumption by `Report.from_serialized`.
         """
         yield json.dumps(self.metadata.serializable())
+        registries: set[str] = set()
         for seq, case in sorted(self._cases.items()):
-            yield json.dumps(
-                SeqCase(seq=seq, case=case).serializable(),
-            )
+            seq_case = SeqCase(seq=seq, case=case)
+            for line in _case_lines(seq_case, registries=registries):
+                yield json.dumps(line)
         for impl_id in sorted(self._results):
             impl_results = self._results[impl_id]
             for seq in sorted(impl_results):
                 yield json.dumps(impl_results[seq].serializable())
         yield json.dumps({"did_fail_fast": self.did_fail_fast})
 
+    def write(
+        self,
+        file: IO[bytes],
+        compression: Compression | None = None,
+    ) -> None:
+        """
+        Write this report to a file, compressing it if asked.
+        """
+        with compressing(file, compression) as output:
+            for line in self.serialized():
+                output.write(f"{line}\n".encode())
+
     @property
     def implementations(self) -> Mapping[ConnectableId, ImplementationInfo]:
         return self.metadata.implementations
@@ -452,6 +883,24 @@ class Report:  # noqa: PLW1641
     def total_tests(self):
         return sum(len(case.tests) for case in self._cases.values())
 
+    def only(self, implementations: Iterable[ConnectableId]) -> Report:
+        """
+        Restrict this report to the given implementations.
+        """
+        ids = set(implementations)
+        metadata = evolve(
+            self.metadata,
+            implementations={
+                id: info
+                for id, info in self.implementations.items()
+                if id in ids
+            },
+        )
+        results = HashTrieMap(
+            (id, results) for id, results in self._results.items() if id in ids
+        )
+        return evolve(self, metadata=metadata, results=results)
+
     def compliance_by_implementation(self):
         """
         Return the fraction of passing tests for each reported implementation.
@@ -465,8 +914,14 @@ class Report:  # noqa: PLW1641
         """
         A count of the unsuccessful tests for the given implementation.
         """
-        results = self._results[implementation].values()
-        return sum((each.unsuccessful() for each in results), Unsuccessful())
+        unsuccessful = self._unsuccessful.get(implementation)
+        if unsuccessful is None:
+            results = self._results[implementation].values()
+            unsuccessful = Unsuccessful.of(
+                each.unsuccessful() for each in results
+            )
+            self._unsuccessful[implementation] = unsuccessful
+        return unsuccessful
 
     def worst_to_best(self):
         """
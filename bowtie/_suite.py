@@ -20,12 +20,14 @@ import click
 import rich
 
 from bowtie import GITHUB, _github
-from bowtie._core import Dialect, TestCase
+from bowtie._core import Dialect, TestCase, populated_registry
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
     from typing import Any
 
+    from referencing.jsonschema import SchemaRegistry
+
 
 TEST_SUITE_URL = GITHUB / "json-schema-org/JSON-Schema-Test-Suite"
 TESTS_DIR_URL = TEST_SUITE_URL / "tree/main/tests"
@@ -188,14 +190,23 @@ def remotes_in(path: Path, dialect: Dialect) -> dict[str, Any]:
     return {str(k): v for k, v in _remotes_in(path=path, dialect=dialect)}
 
 
+@cache
+def registry_in(path: Path, dialect: Dialect) -> SchemaRegistry:
+    """
+    A registry of the remotes in the given path, shared by all cases using it.
+    """
+    return populated_registry(remotes_in(path, dialect=dialect), dialect)
+
+
 def cases_from(
     paths: Iterable[_P],
     remotes: Path,
     dialect: Dialect,
 ) -> Iterable[TestCase]:
     for path in paths:
+        registry: SchemaRegistry | dict[str, Any]
         if path.stem in {"refRemote", "dynamicRef", "vocabulary"}:
-            registry = remotes_in(remotes, dialect=dialect)
+            registry = registry_in(remotes, dialect=dialect)
         else:
             registry = {}
 
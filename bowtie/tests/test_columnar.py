@@ -0,0 +1,203 @@
+from io import BufferedReader, BytesIO
+import json
+
+from hypothesis import HealthCheck, given, settings
+import pytest
+
+from bowtie import _columnar
+from bowtie._commands import CaseErrored, CaseResult, CaseSkipped, TestResult
+from bowtie._core import Example, TestCase
+from bowtie._report import EmptyReport, InvalidReport, MissingFooter, Report
+from bowtie.hypothesis import reports
+from bowtie.tests.test_report import (
+    BAZ_V1,
+    BAZ_V2,
+    CASE1,
+    CASE2,
+    FOO,
+    REMOTE1,
+    REMOTE2,
+    _report_data,
+)
+
+
+def columnar(report):
+    file = BytesIO()
+    _columnar.write(map(json.loads, report.serialized()), file)
+    return _columnar.ColumnarReport.from_buffer(file.getvalue())
+
+
+@given(report=reports())
+@settings(suppress_health_check=[HealthCheck.too_slow], deadline=None)
+def test_round_trip(report):
+    assert columnar(report).to_report() == report
+
+
+@given(report=reports())
+@settings(suppress_health_check=[HealthCheck.too_slow], deadline=None)
+def test_queries(report):
+    converted = columnar(report)
+    assert (
+        converted.implementations,
+        converted.is_empty,
+        converted.total_tests,
+        converted.did_fail_fast,
+        [
+            (id, implementation, unsuccessful.counts())
+            for id, implementation, unsuccessful in converted.worst_to_best()
+        ],
+    ) == (
+        report.implementations,
+        report.is_empty,
+        report.total_tests,
+        report.did_fail_fast,
+        [
+            (id, implementation, unsuccessful.counts())
+            for id, implementation, unsuccessful in report.worst_to_best()
+        ],
+    )
+
+
+def test_serialized_round_trip():
+    report = Report.from_input(
+        _report_data(
+            "foo",
+            FOO,
+            [
+                (CASE1, CaseErrored(context={"message": "boom"}, caught=True)),
+                (CASE2, CaseSkipped(message="nope")),
+            ],
+            did_fail_fast=True,
+        ),
+    )
+    serialized = list(columnar(report).serialized())
+    assert Report.from_serialized(serialized) == report
+
+
+def test_round_trip_shared_registry():
+    report = Report.from_input(
+        _report_data(
+            "foo",
+            FOO,
+            [
+                (REMOTE1, CaseResult(results=[TestResult.INVALID])),
+                (REMOTE2, CaseResult(results=[TestResult.VALID])),
+            ],
+        ),
+    )
+    converted = columnar(report)
+    registries = [line for line in converted.lines() if "registry" in line]
+    assert (converted.to_report(), len(registries)) == (report, 1)
+
+
+def test_round_trip_many_tests():
+    tests = [Example(description="", instance=i) for i in range(2**16 + 1)]
+    case = TestCase(description="many", schema={}, tests=tests)
+    data = _report_data(
+        "foo",
+        FOO,
+        [(case, CaseResult(results=[TestResult.VALID] * len(tests)))],
+    )
+    file = BytesIO()
+    _columnar.write(data, file, validate=False)
+    converted = _columnar.ColumnarReport.from_buffer(file.getvalue())
+    assert list(converted.lines()) == data
+
+
+def test_is_columnar():
+    report = Report.from_input(
+        _report_data(
+            "foo",
+            FOO,
+            [(CASE1, CaseResult(results=[TestResult.VALID]))],
+        ),
+    )
+    file = BytesIO()
+    _columnar.write(map(json.loads, report.serialized()), file)
+    jsonl = "\n".join(report.serialized()).encode()
+    assert (
+        _columnar.is_columnar(BufferedReader(BytesIO(file.getvalue()))),
+        _columnar.is_columnar(BufferedReader(BytesIO(jsonl))),
+    ) == (True, False)
+
+
+def test_not_columnar():
+    with pytest.raises(Exception, match="Not a columnar report"):
+        _columnar.ColumnarReport.from_buffer(b"{}")
+
+
+def test_empty():
+    with pytest.raises(EmptyReport):
+        _columnar.write([], BytesIO())
+
+
+def test_missing_footer():
+    data = _report_data(
+        "foo",
+        FOO,
+        [(CASE1, CaseResult(results=[TestResult.VALID]))],
+    )
+    with pytest.raises(MissingFooter):
+        _columnar.write(data[:-1], BytesIO())
+
+
+def test_result_without_case():
+    header, _, *rest = _report_data(
+        "foo",
+        FOO,
+        [(CASE1, CaseResult(results=[TestResult.VALID]))],
+    )
+    with pytest.raises(InvalidReport):
+        _columnar.write([header, *rest], BytesIO())
+
+
+def test_unknown_registry():
+    report = Report.from_input(
+        _report_data(
+            "foo",
+            FOO,
+            [(REMOTE1, CaseResult(results=[TestResult.VALID]))],
+        ),
+    )
+    data = [json.loads(line) for line in report.serialized()]
+    without_registry = [line for line in data if "registry" not in line]
+    with pytest.raises(InvalidReport):
+        _columnar.write(without_registry, BytesIO())
+
+
+def test_combine_versioned_reports():
+    v1 = Report.from_input(
+        _report_data(
+            "baz_v1",
+            BAZ_V1,
+            [(CASE1, CaseResult(results=[TestResult.INVALID]))],
+        ),
+    )
+    v2 = Report.from_input(
+        _report_data(
+            "baz_v2",
+            BAZ_V2,
+            [(CASE1, CaseResult(results=[TestResult.VALID]))],
+        ),
+    )
+    combined = Report.combine_versioned_reports_for(
+        [v1, v2],
+        dialect=v1.metadata.dialect,
+    )
+    versions = _columnar.combine_versioned_reports_for(
+        [columnar(v1), columnar(v2)],
+        dialect=v1.metadata.dialect,
+    )
+    assert (
+        versions.total_tests,
+        [
+            (version, unsuccessful.counts())
+            for version, unsuccessful in versions.latest_to_oldest()
+        ],
+    ) == (
+        combined.total_tests,
+        [
+            (version, unsuccessful.counts())
+            for version, unsuccessful in combined.latest_to_oldest()
+        ],
+    )
@@ -2,15 +2,31 @@
 Tests for the commands Bowtie exchanges with harnesses.
 """
 
+import pytest
+
 from bowtie._commands import (
     Annotation,
     AnnotationsTestResult,
     Assertion,
+    Capabilities,
+    CaseErrored,
+    CaseResult,
     ExpectedAnnotations,
     ExpectedValidity,
     FlagTestResult,
+    Registered,
+    RegisterSchema,
+    Run,
+    RunMany,
+    Started,
+    TestResult,
+    _case_result,
     expectation_from_serialized,
 )
+from bowtie._direct_connectable import Direct
+from bowtie.exceptions import ProtocolError
+
+REGISTRY = Direct.from_id("python-jsonschema").registry()
 
 TITLE = Annotation(
     keyword="title",
@@ -214,3 +230,156 @@ def test_expectations_roundtrip():
     ]:
         serialized = expectation.serializable()
         assert expectation_from_serialized(serialized) == expectation
+
+
+def test_started_without_capabilities():
+    started = Started(implementation={}, version=1)
+    assert not started.capabilities.pipelining
+
+
+def test_started_capabilities_from_response():
+    started = Started(
+        implementation={},
+        version=1,
+        capabilities={"pipelining": True, "from-the-future": 12},
+    )
+    assert started.capabilities == Capabilities(pipelining=True)
+
+
+def test_run_many_request():
+    case = {
+        "description": "foo",
+        "schema": {},
+        "tests": [{"description": "one", "instance": 1}],
+    }
+    runs = [Run(seq=1, case=case), Run(seq=2, case=case)]
+    request = RunMany(runs=runs).to_request(registry=REGISTRY)
+    assert request == {
+        "cmd": "run-many",
+        "runs": [
+            {"seq": 1, "case": case, "output": "flag"},
+            {"seq": 2, "case": case, "output": "flag"},
+        ],
+    }
+
+
+def test_run_many_response():
+    responses = RunMany.from_response(
+        {
+            "responses": [
+                {"seq": 2, "results": [{"valid": False}]},
+                {"seq": 1, "errored": True, "context": {}},
+            ],
+        },
+        registry=REGISTRY,
+    )
+    assert responses[0] == (
+        2,
+        1,
+        CaseResult(results=[TestResult.INVALID]),
+    )
+    assert responses[1] == (1, 0, CaseErrored(context={}))
+
+
+def test_run_by_handle_request():
+    tests = [{"description": "one", "instance": 1}]
+    case = {"description": "foo", "schema": {}, "tests": tests}
+    run = Run(seq=1, case=case).by_handle(3)
+    assert run.to_request(registry=REGISTRY) == {
+        "cmd": "run",
+        "seq": 1,
+        "case": {"description": "foo", "handle": 3, "tests": tests},
+        "output": "flag",
+    }
+
+
+def test_register_schema_response():
+    register = RegisterSchema(handle=3, schema={})
+    assert register.from_response(
+        {"handle": 3},
+        registry=REGISTRY,
+    ) == Registered(handle=3)
+
+
+def test_register_schema_errored():
+    register = RegisterSchema(handle=3, schema={})
+    registered = register.from_response(
+        {"errored": True, "context": {"message": "Boom!"}},
+        registry=REGISTRY,
+    )
+    assert registered.handle is None
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        {"seq": 1, "results": [{"valid": True}, {"valid": False}]},
+        {"seq": "a", "results": []},
+        {
+            "seq": 1,
+            "results": [
+                {
+                    "valid": True,
+                    "annotations": [
+                        {
+                            "keyword": "title",
+                            "instanceLocation": "",
+                            "keywordLocation": "#/title",
+                            "annotation": "A string",
+                        },
+                    ],
+                },
+                {"skipped": True, "message": "nope"},
+                {"errored": True},
+                {"errored": True, "context": {"message": "boom"}},
+            ],
+        },
+        {"seq": 1, "skipped": True},
+        {"seq": 1, "skipped": True, "issue_url": "http://example.com"},
+        {"seq": 1, "errored": True, "context": {"traceback": "..."}},
+    ],
+)
+def test_run_response(response):
+    """
+    Run responses, however they are decoded, become what they always have.
+    """
+    assert Run.from_response(response, registry=REGISTRY) == _case_result(
+        **response,
+    )
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        {"results": [{"valid": True}]},
+        {"seq": 1, "results": [{"valid": 1}]},
+        {"seq": 1, "results": [{"valid": True, "extra": 12}]},
+        {"seq": 1, "results": [{"valid": True, "annotations": [{}]}]},
+        {"seq": 1, "results": {"valid": True}},
+        {"seq": 1, "results": [], "skipped": True},
+        {"seq": 1, "skipped": True, "message": 12},
+        {"seq": 1, "errored": True, "context": {"stderr": []}},
+        {"seq": 1, "errored": 1, "context": {}},
+        [],
+    ],
+)
+def test_invalid_run_response(response):
+    with pytest.raises(ProtocolError):
+        Run.from_response(response, registry=REGISTRY)
+
+
+def test_run_request():
+    tests = [{"description": "one", "instance": 1}]
+    case = {"description": "foo", "schema": {}, "tests": tests}
+    assert Run(seq=1, case=case).to_request(registry=REGISTRY) == {
+        "cmd": "run",
+        "seq": 1,
+        "case": case,
+        "output": "flag",
+    }
+
+
+def test_invalid_run_request():
+    case = {"description": "foo", "schema": {}, "tests": []}
+    with pytest.raises(ProtocolError):
+        Run(seq=1, case=case).to_request(registry=REGISTRY)
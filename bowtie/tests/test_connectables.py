@@ -1,13 +1,24 @@
-from imaged import NoSuchEngine
+from collections import deque
+from contextlib import asynccontextmanager
+import asyncio
+import json
+
+from attrs import field, mutable
+from imaged import NoSuchEngine, NoSuchImage, SessionClosed
 import pytest
 
 from bowtie._connectables import Connectable, UnknownConnector
 from bowtie._containers import (
     IMAGE_REPOSITORY,
+    AdaptiveTimeout,
     ConnectableContainer,
     ConnectableImage,
+    Connection,
+    FixedTimeout,
+    Pulls,
     chosen_engine,
 )
+from bowtie._core import Restarted
 from bowtie._direct_connectable import Direct
 from bowtie.exceptions import CannotConnect
 
@@ -15,6 +26,9 @@ validators = Direct.from_id("python-jsonschema").registry()
 validator = validators.for_uri("tag:bowtie.report,2024:connectables")
 validated, invalidated = validator.validated, validator.invalidated
 
+DRAFT7 = "http://json-schema.org/draft-07/schema#"
+DRAFT4 = "http://json-schema.org/draft-04/schema#"
+
 
 class TestImplicit:
     def test_with_repository(self):
@@ -91,6 +105,36 @@ class TestImage:
             ),
         )
 
+    def test_adaptive_timeout(self):
+        id = validated("image:bar:read_timeout_sec=adaptive")
+        assert Connectable.from_str(id) == Connectable(
+            id=id,
+            connector=ConnectableImage(
+                id=f"{IMAGE_REPOSITORY}/bar",
+                read_timeout_sec="adaptive",
+            ),
+        )
+
+    def test_pipeline(self):
+        id = validated("image:bar:pipeline=8")
+        assert Connectable.from_str(id) == Connectable(
+            id=id,
+            connector=ConnectableImage(
+                id=f"{IMAGE_REPOSITORY}/bar",
+                pipeline=8,
+            ),
+        )
+
+    def test_standby(self):
+        id = validated("image:bar:standby=true")
+        assert Connectable.from_str(id) == Connectable(
+            id=id,
+            connector=ConnectableImage(
+                id=f"{IMAGE_REPOSITORY}/bar",
+                standby=True,
+            ),
+        )
+
 
 class TestContainer:
     def test_uuid(self):
@@ -168,6 +212,62 @@ class TestDirect:
             ),
         )
 
+    def test_executor(self):
+        id = validated("direct:python-jsonschema:executor=process,workers=8")
+
+        from bowtie._direct_connectable import jsonschema
+
+        assert Connectable.from_str(id) == Connectable(
+            id=id,
+            connector=Direct(
+                wraps=jsonschema(),
+                executor="process",
+                workers=8,
+            ),
+        )
+
+    def test_unknown_executor(self):
+        with pytest.raises(ValueError, match="executor"):
+            Direct.from_id("python-jsonschema", executor="carrier-pigeon")
+
+    @pytest.mark.parametrize("executor", [None, "thread", "process"])
+    def test_run_many_in_executor(self, executor):
+        connector = Direct.from_id("python-jsonschema", executor=executor)
+        case = {
+            "description": "foo",
+            "schema": {"minimum": 0},
+            "tests": [
+                {"description": "one", "instance": 1},
+                {"description": "two", "instance": -1},
+            ],
+        }
+        runs = [{"seq": seq, "case": case, "output": "flag"} for seq in [1, 2]]
+
+        async def main():
+            async with connector.connect() as connection:
+                started = await connection.request(
+                    {"cmd": "start", "version": 1},
+                )
+                await connection.request({"cmd": "dialect", "dialect": DRAFT7})
+                run = await connection.request({"cmd": "run", **runs[0]})
+                many = await connection.request(
+                    {"cmd": "run-many", "runs": runs},
+                )
+                return started["capabilities"]["run_many"], run, many
+
+        run_many, run, many = asyncio.run(main())
+        results = [{"valid": True}, {"valid": False}]
+        assert (run_many, run, many) == (
+            executor is not None,
+            {"seq": 1, "results": results},
+            {
+                "responses": [
+                    {"seq": 1, "results": results},
+                    {"seq": 2, "results": results},
+                ],
+            },
+        )
+
     def test_import_missing_parameter(self):
         """
         The basic import syntax is direct:foo.bar:baz, not foo.bar.baz.
@@ -179,6 +279,95 @@ class TestDirect:
         with pytest.raises(CannotConnect, match=":always_invalid'"):
             Connectable.from_str(invalidated(f"{prefix}.{suffix}"))
 
+    def test_compiled_once(self):
+        from bowtie._direct_connectable import jsonschema
+
+        connection = jsonschema()()
+        case = {
+            "description": "foo",
+            "schema": {"$ref": "urn:example:positive"},
+            "registry": {"urn:example:positive": {"minimum": 0}},
+            "tests": [{"description": "one", "instance": 1}],
+        }
+
+        async def run(seq, case):
+            request = {"cmd": "run", "seq": seq, "case": case}
+            return await connection.request({**request, "output": "flag"})
+
+        async def main():
+            await connection.request({"cmd": "dialect", "dialect": DRAFT7})
+            first = await run(1, case)
+            second = await run(2, json.loads(json.dumps(case)))
+            return first, second
+
+        first, second = asyncio.run(main())
+        assert first["results"] == second["results"] == [{"valid": True}]
+        info = connection.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_compiled_per_dialect_and_registry(self):
+        from bowtie._direct_connectable import jsonschema
+
+        connection = jsonschema()()
+        case = {
+            "description": "foo",
+            "schema": {"$ref": "urn:example:it"},
+            "registry": {"urn:example:it": {"minimum": 0}},
+            "tests": [{"description": "one", "instance": -1}],
+        }
+        other = {
+            **case,
+            "registry": {"urn:example:it": {"maximum": 0}},
+        }
+
+        async def run(case):
+            request = {"cmd": "run", "seq": 1, "case": case, "output": "flag"}
+            response = await connection.request(request)
+            return [each["valid"] for each in response["results"]]
+
+        async def main():
+            await connection.request({"cmd": "dialect", "dialect": DRAFT7})
+            results = [await run(case), await run(other)]
+            await connection.request({"cmd": "dialect", "dialect": DRAFT4})
+            return [*results, await run(case)]
+
+        assert asyncio.run(main()) == [[False], [True], [False]]
+        info = connection.cache_info()
+        assert (info.hits, info.misses) == (0, 3)
+
+    def test_shared_registry_serialized_once(self, monkeypatch):
+        from bowtie import _direct_connectable
+        from bowtie._direct_connectable import jsonschema
+
+        registry = {"urn:example:positive": {"minimum": 0}}
+        serialized = []
+
+        def canonical(value):
+            if value is registry:
+                serialized.append(value)
+            return json.dumps(value, sort_keys=True)
+
+        monkeypatch.setattr(_direct_connectable, "canonical", canonical)
+
+        connection = jsonschema()()
+        case = {
+            "description": "foo",
+            "schema": {"$ref": "urn:example:positive"},
+            "registry": registry,
+            "tests": [{"description": "one", "instance": 1}],
+        }
+
+        async def main():
+            await connection.request({"cmd": "dialect", "dialect": DRAFT7})
+            for seq in range(3):
+                request = {"cmd": "run", "seq": seq, "case": case}
+                await connection.request({**request, "output": "flag"})
+
+        asyncio.run(main())
+        assert serialized == [registry]
+        info = connection.cache_info()
+        assert (info.hits, info.misses) == (2, 1)
+
 
 class TestExplicitHappy:
     def test_known_direct(self):
@@ -232,6 +421,264 @@ class TestToTerse:
         assert Connectable.from_str(id).to_terse() == "bar"
 
 
+class TestReportId:
+    def test_executor_dropped(self):
+        id = validated("direct:python-jsonschema:executor=thread,workers=2")
+        assert Connectable.from_str(id).report_id == "python-jsonschema"
+
+    def test_timeout_dropped(self):
+        id = validated("image:foo/bar:read_timeout_sec=5,pipeline=8")
+        assert Connectable.from_str(id).report_id == "foo/bar"
+
+    def test_tag_kept(self):
+        id = validated("image:foo/bar:latest")
+        assert Connectable.from_str(id).report_id == "foo/bar:latest"
+
+
+class TestAdaptiveTimeout:
+    def test_waits_as_usual_until_warmed_up(self):
+        initial = 2.0
+        timeout = AdaptiveTimeout(name="foo", initial=initial)
+        for _ in range(5):
+            timeout.observe(0.001)
+        assert timeout.budget(attempt=0) == initial
+
+    def test_predicted_from_recent_responses(self):
+        latency, factor = 1.0, 4
+        timeout = AdaptiveTimeout(name="foo", factor=factor)
+        for _ in range(100):
+            timeout.observe(latency)
+        assert timeout.budget(attempt=0) == latency * factor
+
+    def test_same_on_retry(self):
+        latency, factor = 1.0, 4
+        timeout = AdaptiveTimeout(name="foo", factor=factor)
+        for _ in range(100):
+            timeout.observe(latency)
+        assert timeout.budget(attempt=2) == latency * factor
+
+    def test_floor(self):
+        floor = 0.5
+        timeout = AdaptiveTimeout(name="foo", floor=floor)
+        for _ in range(100):
+            timeout.observe(0.001)
+        assert timeout.budget(attempt=0) == floor
+
+    def test_less_than_usual_for_fast_harnesses(self):
+        initial = 2.0
+        timeout = AdaptiveTimeout(name="foo", initial=initial)
+        for _ in range(100):
+            timeout.observe(0.001)
+        assert timeout.budget(attempt=0) < initial
+
+    def test_slow_responses(self):
+        timeout = AdaptiveTimeout(name="foo", initial=1.0)
+        timeout.observe(0.5)
+        timeout.observe(1.5)
+        assert timeout.slow_responses.seconds == [1.5]
+
+    def test_ceiling(self):
+        ceiling = 10
+        timeout = AdaptiveTimeout(name="foo", ceiling=ceiling)
+        for _ in range(100):
+            timeout.observe(30)
+        assert timeout.budget(attempt=0) == ceiling
+
+    def test_forgets_old_responses(self):
+        timeout = AdaptiveTimeout(name="foo", factor=1, floor=0.5)
+        for _ in range(100):
+            timeout.observe(30)
+        for _ in range(1000):
+            timeout.observe(1)
+        assert timeout.budget(attempt=0) == 1
+
+
+@mutable
+class FakeSession:
+    """
+    A session whose harness says whatever it was told to in advance.
+    """
+
+    responses: deque[str | None]
+    sent: list[str] = field(factory=list)
+    alive: bool = True
+
+    async def send(self, line: str) -> None:
+        if not self.alive:
+            raise SessionClosed()
+        self.sent.append(line)
+
+    async def receive(self) -> str:
+        response = self.responses.popleft()
+        if response is None:  # the harness is taking its time
+            await asyncio.Event().wait()
+        return response
+
+    def stderr(self) -> bytes:
+        return b""
+
+
+def connection_to(session: FakeSession, **kwargs) -> Connection:
+    @asynccontextmanager
+    async def new_session():
+        yield session
+
+    return Connection(new_session=new_session, **kwargs)
+
+
+def run(seq: int) -> dict:
+    return {"cmd": "run", "seq": seq, "case": {}}
+
+
+def ran(seq: int) -> str:
+    return json.dumps({"seq": seq, "results": [{"valid": True}]})
+
+
+@mutable
+class RecordedTimeout:
+    """
+    A timeout which remembers how long each response took.
+    """
+
+    observed: list[float] = field(factory=list)
+    slow_responses: None = None
+
+    def budget(self, attempt: int) -> float:
+        return 1.0
+
+    def observe(self, seconds: float) -> None:
+        self.observed.append(seconds)
+
+
+@pytest.mark.asyncio
+class TestConnection:
+    async def test_late_responses_are_discarded(self):
+        session = FakeSession(responses=deque([None, ran(1), ran(2)]))
+        connection = connection_to(
+            session,
+            read_timeout=FixedTimeout(seconds=0.01),
+            retry=1,
+        )
+        try:
+            assert await connection.request(run(1)) is None
+            assert await connection.request(run(2)) == json.loads(ran(2))
+        finally:
+            await connection.close()
+
+    async def test_forgets_requests_given_up_on(self):
+        session = FakeSession(responses=deque([None, None, ran(3)]))
+        connection = connection_to(
+            session,
+            read_timeout=FixedTimeout(seconds=0.01),
+            retry=1,
+            window=2,
+        )
+        try:
+            assert await connection.request(run(1)) is None
+            await connection.send(run(2))
+            await connection.send(run(3))
+            assert await connection.receive() is None
+            assert list(connection._sent_at) == [3]
+            assert await connection.receive() == json.loads(ran(3))
+        finally:
+            await connection.close()
+        assert not connection._sent_at
+
+    async def test_latency_is_from_when_sent(self):
+        delay = 0.05
+        timeout = RecordedTimeout()
+        session = FakeSession(responses=deque([ran(1), ran(2)]))
+        connection = connection_to(session, read_timeout=timeout, window=2)
+        try:
+            await connection.send(run(1))
+            await asyncio.sleep(delay)
+            await connection.send(run(2))
+            await connection.receive()
+            await connection.receive()
+        finally:
+            await connection.close()
+        assert timeout.observed[0] >= delay > timeout.observed[1]
+
+    async def test_failover_to_standby(self):
+        start, dialect = {"cmd": "start", "version": 1}, {"cmd": "dialect"}
+        started, ok = json.dumps({"version": 1}), json.dumps({"ok": True})
+        primary = FakeSession(responses=deque([started]))
+        spare = FakeSession(responses=deque([started, ok, ran(1)]))
+        unused = FakeSession(responses=deque())
+        sessions = deque([primary, spare, unused])
+
+        @asynccontextmanager
+        async def new_session():
+            yield sessions.popleft()
+
+        connection = Connection(new_session=new_session, standby=True)
+        try:
+            await connection.request(start)
+            await connection.standby([start])
+            await asyncio.sleep(0.01)  # for the spare to start
+            await connection.standby([start, dialect])
+            assert sessions == deque([unused])  # the spare was kept
+
+            primary.alive = False
+            with pytest.raises(Restarted) as restarted:
+                await connection.send(run(1))
+            assert restarted.value.caught_up
+            assert await connection.request(run(1)) == json.loads(ran(1))
+        finally:
+            await connection.close()
+
+        assert [json.loads(each) for each in primary.sent] == [start]
+        sent = [json.loads(each) for each in spare.sent]
+        assert sent == [start, dialect, run(1)]
+
+
+@mutable
+class PullingEngine:
+    """
+    An engine whose pulls take a moment, and which has no images to start.
+    """
+
+    pulled: set[str] = field(factory=set)
+    pulls: list[str] = field(factory=list)
+    concurrent: int = 0
+    most_concurrent: int = 0
+
+    async def pull(self, image):
+        self.pulls.append(image)
+        self.concurrent += 1
+        self.most_concurrent = max(self.most_concurrent, self.concurrent)
+        await asyncio.sleep(0.01)
+        self.concurrent -= 1
+        self.pulled.add(image)
+
+    async def create(self, image, network=True):
+        if image not in self.pulled:
+            raise NoSuchImage(image=image)
+        return f"{image}-container"
+
+
+@pytest.mark.asyncio
+class TestPulls:
+    async def test_only_so_many_at_once(self):
+        engine, maximum = PullingEngine(), 2
+        pulls = Pulls(maximum=maximum)
+        images = [f"image-{i}" for i in range(5)]
+        await asyncio.gather(*(pulls.pull(engine, each) for each in images))
+        assert engine.pulled == set(images)
+        assert engine.most_concurrent == maximum
+
+    async def test_the_same_image_once(self):
+        engine = PullingEngine()
+        pulls = Pulls()
+        await asyncio.gather(*(pulls.create(engine, "foo") for _ in range(3)))
+        assert engine.pulls == ["foo"]
+
+    async def test_no_pull_when_present(self):
+        engine = PullingEngine(pulled={"foo"})
+        assert await Pulls().create(engine, "foo") == "foo-container"
+        assert engine.pulls == []
+
+
 class TestChosenEngine:
     """
     Which container engine Bowtie will speak to.
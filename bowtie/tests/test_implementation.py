@@ -1,5 +1,323 @@
-from bowtie._core import Implementation
+from collections import deque
+from contextlib import aclosing
+from typing import Any
+
+from attrs import field, mutable
+import pytest
+
+from bowtie._commands import Capabilities, CaseErrored, CaseResult, SeqCase
+from bowtie._core import (
+    Dialect,
+    DialectRunner,
+    HarnessClient,
+    Implementation,
+    Restarted,
+    SchemaHandles,
+    Test,
+    TestCase,
+)
+from bowtie._direct_connectable import Direct
+from bowtie.exceptions import InvalidResponse
+
+DIALECT = Dialect.by_short_name()["draft2020-12"]
+
+#: Script entries for a harness which never answers, or which exits.
+DROP, CRASH = "drop", "crash"
 
 
 def test_known():
     assert "python-jsonschema" in Implementation.known()
+
+
+@mutable
+class FakeHarness:
+    """
+    A pipelining harness which answers runs in whatever order it's told to.
+    """
+
+    #: For each receive, which seq to answer, or whether to drop or crash.
+    script: deque[Any]
+    window: int = 4
+    alive: bool = True
+    sent: list[Any] = field(factory=list)
+
+    async def send(self, message: Any) -> None:
+        if not self.alive:
+            self.alive = True
+            raise Restarted(caught_up=True)
+        self.sent.append(message["seq"])
+
+    async def receive(self) -> Any:
+        if not self.script:
+            return None
+        seq = self.script.popleft()
+        if seq == CRASH:
+            self.alive = False
+            return None
+        if seq == DROP:
+            return None
+        return {"seq": seq, "results": [{"valid": True}]}
+
+    async def request(self, message: Any) -> Any:
+        await self.send(message)
+        return await self.receive()
+
+
+def runner_for(
+    harness: Any,
+    handles: SchemaHandles | None = None,
+    **capabilities: bool,
+) -> DialectRunner:
+    client = HarnessClient(
+        connection=harness,
+        registry=Direct.from_id("python-jsonschema").registry(),
+        capabilities=Capabilities(**capabilities),
+        handles=handles or SchemaHandles(),
+    )
+    return DialectRunner(
+        dialect=DIALECT,
+        implementation="fake",
+        harness=client,
+        schema_without_dialect=lambda _: None,
+    )
+
+
+def seq_cases(*seqs: int, schemas: int = 1) -> list[SeqCase]:
+    cases = [
+        TestCase(
+            description="a case",
+            schema={"$schema": str(DIALECT.uri), "minimum": i},
+            tests=[Test(description="a test", instance=12, valid=True)],
+        )
+        for i in range(schemas)
+    ]
+    return [SeqCase(seq=seq, case=cases[seq % schemas]) for seq in seqs]
+
+
+async def results(
+    runner: DialectRunner,
+    *seqs: int,
+    schemas: int = 1,
+) -> dict[int, Any]:
+    return {
+        seq_case.seq: seq_result.result
+        async for seq_case, seq_result in runner.validate_all(
+            seq_cases(*seqs, schemas=schemas),
+        )
+    }
+
+
+def errored(result: Any) -> bool:
+    return isinstance(result, CaseErrored) and not result.caught
+
+
+@pytest.mark.asyncio
+class TestPipeline:
+    async def test_reordered(self):
+        harness = FakeHarness(script=deque([2, 3, 1]))
+        runner = runner_for(harness, pipelining=True)
+
+        got = await results(runner, 1, 2, 3)
+        assert list(got) == [2, 3, 1]
+        assert all(isinstance(each, CaseResult) for each in got.values())
+
+    async def test_dropped(self):
+        harness = FakeHarness(script=deque([DROP, 2, 3]))
+        runner = runner_for(harness, pipelining=True)
+
+        got = await results(runner, 1, 2, 3)
+        assert errored(got[1])
+        assert isinstance(got[2], CaseResult)
+        assert isinstance(got[3], CaseResult)
+
+    async def test_delayed(self):
+        harness = FakeHarness(script=deque([DROP, 2, 1, 3]))
+        runner = runner_for(harness, pipelining=True)
+
+        got = await results(runner, 1, 2, 3)
+        assert errored(got[1])
+        assert got[1].message == "uncaught error"
+        assert isinstance(got[2], CaseResult)
+        assert isinstance(got[3], CaseResult)
+        assert not harness.script
+
+    async def test_mismatched_seq(self):
+        harness = FakeHarness(script=deque([7, 1, 2, 3]))
+        runner = runner_for(harness, pipelining=True)
+
+        got = await results(runner, 1, 2, 3)
+        assert errored(got[1])
+        assert got[1].message == "mismatched seq"
+        assert isinstance(got[2], CaseResult)
+        assert isinstance(got[3], CaseResult)
+
+    async def test_restart_resends_unanswered(self):
+        harness = FakeHarness(script=deque([1, CRASH, 3]), window=2)
+        runner = runner_for(harness, pipelining=True)
+
+        got = await results(runner, 1, 2, 3)
+        assert harness.sent == [1, 2, 3, 3]
+        assert isinstance(got[1], CaseResult)
+        assert errored(got[2])
+        assert isinstance(got[3], CaseResult)
+        assert len(runner.restarts.restart_sec) == 1
+
+    async def test_drains_when_closed_early(self):
+        harness = FakeHarness(script=deque([1, 2, 3]))
+        runner = runner_for(harness, pipelining=True)
+
+        async with aclosing(runner.validate_all(seq_cases(1, 2, 3))) as each:
+            async for seq_case, _ in each:
+                assert seq_case.seq == 1
+                break
+        assert not harness.script
+
+    async def test_drains_late_responses(self):
+        harness = FakeHarness(script=deque([DROP, 2, 3, 1]))
+        runner = runner_for(harness, pipelining=True)
+
+        got = await results(runner, 1, 2, 3)
+        assert errored(got[1])
+        assert not harness.script
+
+
+@mutable
+class AnsweringHarness:
+    """
+    A harness which answers each request as soon as it's sent.
+    """
+
+    #: Seqs the harness never responds to, or responds to with the wrong seq.
+    unanswered: frozenset[int] = frozenset()
+    misnumbered: frozenset[int] = frozenset()
+    registers: bool = True
+    releases: bool = True
+    sent: list[Any] = field(factory=list)
+
+    async def request(self, message: Any) -> Any:
+        self.sent.append(message)
+        match message:
+            case {"cmd": "run-many", "runs": runs}:
+                responses = [self.answer(run) for run in runs]
+                return {"responses": [each for each in responses if each]}
+            case {"cmd": "register-schema", "handle": handle}:
+                if self.registers:
+                    return {"handle": handle}
+                return {"errored": True, "context": {"message": "nope"}}
+            case {"cmd": "release"}:
+                if self.releases:
+                    return {"ok": True}
+                raise InvalidResponse(contents="nope")
+            case _:
+                return self.answer(message)
+
+    def answer(self, run: Any) -> Any:
+        if run["seq"] in self.unanswered:
+            return None
+        seq = (
+            run["seq"] + 100 if run["seq"] in self.misnumbered else run["seq"]
+        )
+        return {"seq": seq, "results": [{"valid": True}]}
+
+
+@pytest.mark.asyncio
+class TestBatch:
+    async def test_batched(self):
+        harness = AnsweringHarness()
+        runner = runner_for(harness, run_many=True)
+
+        got = await results(runner, 1, 2, 3)
+        assert all(isinstance(each, CaseResult) for each in got.values())
+        assert [each["cmd"] for each in harness.sent] == ["run-many"]
+
+    async def test_missing_seq(self):
+        harness = AnsweringHarness(unanswered=frozenset({2}))
+        runner = runner_for(harness, run_many=True)
+
+        got = await results(runner, 1, 2, 3)
+        assert isinstance(got[1], CaseResult)
+        assert errored(got[2])
+        assert isinstance(got[3], CaseResult)
+
+    async def test_wrong_seq(self):
+        harness = AnsweringHarness(misnumbered=frozenset({1}))
+        runner = runner_for(harness, run_many=True)
+
+        got = await results(runner, 1, 2, 3)
+        assert errored(got[1])
+        assert got[1].context == {}  # not some other seq's response
+        assert isinstance(got[2], CaseResult)
+        assert isinstance(got[3], CaseResult)
+
+    async def test_single_runs_otherwise(self):
+        harness = AnsweringHarness()
+        runner = runner_for(harness)
+
+        got = await results(runner, 1, 2, 3)
+        assert all(isinstance(each, CaseResult) for each in got.values())
+        assert [each["cmd"] for each in harness.sent] == ["run"] * len(got)
+
+
+@pytest.mark.asyncio
+class TestSchemaHandles:
+    async def test_registered_once_seen_twice(self):
+        harness = AnsweringHarness()
+        runner = runner_for(harness, schema_handles=True)
+
+        got = await results(runner, 1, 2, 3)
+        assert all(isinstance(each, CaseResult) for each in got.values())
+        assert [each["cmd"] for each in harness.sent] == [
+            "run",
+            "register-schema",
+            "run",
+            "run",
+        ]
+        by_handle = [each["case"] for each in harness.sent[2:]]
+        assert all("schema" not in each for each in by_handle)
+        assert {each["handle"] for each in by_handle} == {
+            harness.sent[1]["handle"],
+        }
+
+    async def test_sent_in_full_if_registering_fails(self):
+        harness = AnsweringHarness(registers=False)
+        runner = runner_for(harness, schema_handles=True)
+
+        got = await results(runner, 1, 2, 3)
+        assert all(isinstance(each, CaseResult) for each in got.values())
+        assert [each["cmd"] for each in harness.sent] == [
+            "run",
+            "register-schema",
+            "run",
+            "run",
+        ]
+        runs = [each for each in harness.sent if each["cmd"] == "run"]
+        assert all("schema" in each["case"] for each in runs)
+
+    async def test_run_even_if_releasing_fails(self):
+        harness = AnsweringHarness(releases=False)
+        runner = runner_for(
+            harness,
+            handles=SchemaHandles(maximum=1),
+            schema_handles=True,
+        )
+
+        got = await results(runner, 0, 1, 2, 3, schemas=2)
+        assert all(isinstance(each, CaseResult) for each in got.values())
+        assert [each["cmd"] for each in harness.sent] == [
+            "run",
+            "run",
+            "register-schema",
+            "run",
+            "release",
+            "register-schema",
+            "run",
+        ]
+        assert "handle" in harness.sent[-1]["case"]
+
+
+def test_schema_handles_forget_old_schemas():
+    handles = SchemaHandles(remembered=2)
+    for key in "abc":
+        assert not handles.worth_registering(key)
+    assert not handles.worth_registering("a")  # forgotten, so seen anew
+    assert handles.worth_registering("c")
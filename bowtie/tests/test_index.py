@@ -0,0 +1,201 @@
+from io import BytesIO
+
+from hypothesis import HealthCheck, given, settings
+
+from bowtie import _index
+from bowtie._commands import CaseErrored, CaseResult, CaseSkipped, TestResult
+from bowtie._report import Report, ReportWriter
+from bowtie.hypothesis import reports
+from bowtie.tests.test_report import (
+    BAR,
+    BAR_RUN,
+    CASE1,
+    CASE2,
+    FOO,
+    FOO_RUN,
+    REMOTE1,
+    REMOTE2,
+    _report_data,
+    _run_through,
+)
+
+
+def jsonl(report):
+    return "".join(f"{line}\n" for line in report.serialized()).encode()
+
+
+def indexed(report):
+    contents = jsonl(report)
+    index = _index.ReportIndex.of(BytesIO(contents))
+    return _index.IndexedReport.from_buffer(contents, index=index)
+
+
+@given(report=reports())
+@settings(suppress_health_check=[HealthCheck.too_slow], deadline=None)
+def test_round_trip(report):
+    assert indexed(report).to_report() == report
+
+
+@given(report=reports())
+@settings(suppress_health_check=[HealthCheck.too_slow], deadline=None)
+def test_queries(report):
+    converted = indexed(report)
+    assert (
+        converted.implementations,
+        converted.is_empty,
+        converted.total_tests,
+        converted.did_fail_fast,
+        [
+            (id, implementation, unsuccessful.counts())
+            for id, implementation, unsuccessful in converted.worst_to_best()
+        ],
+    ) == (
+        report.implementations,
+        report.is_empty,
+        report.total_tests,
+        report.did_fail_fast,
+        [
+            (id, implementation, unsuccessful.counts())
+            for id, implementation, unsuccessful in report.worst_to_best()
+        ],
+    )
+
+
+def test_only():
+    report = Report.combine(
+        Report.from_input(
+            _report_data("foo", FOO, [(CASE1, CaseSkipped(message="nope"))]),
+        ),
+        Report.from_input(
+            _report_data(
+                "bar",
+                BAR,
+                [(CASE1, CaseResult(results=[TestResult.VALID]))],
+            ),
+        ),
+    )
+    only = indexed(report).only(["bar"])
+    assert (
+        list(only.implementations),
+        [id for id, *_ in only.worst_to_best()],
+        only.to_report(),
+    ) == (["bar"], ["bar"], report.only(["bar"]))
+
+
+def test_shared_registry():
+    report = Report.from_input(
+        _report_data(
+            "foo",
+            FOO,
+            [
+                (REMOTE1, CaseResult(results=[TestResult.INVALID])),
+                (REMOTE2, CaseResult(results=[TestResult.VALID])),
+            ],
+        ),
+    )
+    assert indexed(report).to_report() == report
+
+
+def test_written_index_matches():
+    foo = [
+        (CASE1, CaseErrored(context={"message": "boom"}, caught=True)),
+        (CASE2, CaseResult(results=[TestResult.VALID])),
+    ]
+    bar = [
+        (CASE1, CaseResult(results=[TestResult.INVALID])),
+        (REMOTE1, CaseResult(results=[TestResult.VALID])),
+    ]
+
+    lines = []
+    indexer = _index.ReportIndexer()
+    writer = ReportWriter(write=lines.append, expecting=2, indexer=indexer)
+    _run_through(writer.reporter(), FOO_RUN, foo)
+    _run_through(writer.reporter(), BAR_RUN, bar)
+
+    contents = "".join(f"{line}\n" for line in lines).encode()
+    assert indexer.index() == _index.ReportIndex.of(BytesIO(contents))
+
+
+def test_sidecar(tmp_path):
+    report = Report.from_input(
+        _report_data(
+            "foo",
+            FOO,
+            [(CASE1, CaseResult(results=[TestResult.VALID]))],
+        ),
+    )
+    path = tmp_path / "report.jsonl"
+    path.write_bytes(jsonl(report))
+
+    with path.open("rb") as file:
+        assert _index.indexed(file) is None
+
+    with path.open("rb") as file:
+        index = _index.ReportIndex.of(file)
+    _index.path_for(path).write_text(index.serialized())
+
+    with path.open("rb") as file:
+        assert _index.indexed(file).to_report() == report  # type: ignore[reportOptionalMemberAccess]
+
+
+def test_stale_sidecar_is_ignored(tmp_path):
+    report = Report.from_input(
+        _report_data(
+            "foo",
+            FOO,
+            [(CASE1, CaseResult(results=[TestResult.VALID]))],
+        ),
+    )
+    path = tmp_path / "report.jsonl"
+    path.write_bytes(jsonl(report))
+    with path.open("rb") as file:
+        index = _index.ReportIndex.of(file)
+    _index.path_for(path).write_text(index.serialized())
+
+    with path.open("ab") as file:
+        file.write(b"\n")
+
+    with path.open("rb") as file:
+        assert _index.indexed(file) is None
+
+
+def test_changed_sidecar_of_same_size_is_ignored(tmp_path):
+    report = Report.from_input(
+        _report_data(
+            "foo",
+            FOO,
+            [(CASE1, CaseResult(results=[TestResult.VALID]))],
+        ),
+    )
+    path = tmp_path / "report.jsonl"
+    contents = jsonl(report)
+    path.write_bytes(contents)
+    with path.open("rb") as file:
+        index = _index.ReportIndex.of(file)
+    _index.path_for(path).write_text(index.serialized())
+
+    path.write_bytes(contents.replace(b'"instance": 1', b'"instance": 2'))
+
+    with path.open("rb") as file:
+        assert _index.indexed(file) is None
+
+
+def test_corrupt_sidecar_is_rebuilt(tmp_path):
+    report = Report.from_input(
+        _report_data(
+            "foo",
+            FOO,
+            [(CASE1, CaseResult(results=[TestResult.VALID]))],
+        ),
+    )
+    path = tmp_path / "report.jsonl"
+    path.write_bytes(jsonl(report))
+    sidecar = _index.path_for(path)
+    sidecar.write_text("{not json")
+
+    with path.open("rb") as file:
+        assert _index.indexed(file).to_report() == report  # type: ignore[reportOptionalMemberAccess]
+    with path.open("rb") as file:
+        assert _index.ReportIndex.from_serialized(
+            sidecar.read_bytes(),
+        ) == _index.ReportIndex.of(file)
@@ -11,6 +11,7 @@ from pathlib import Path
 from tempfile import TemporaryDirectory
 from textwrap import dedent
 import asyncio
+import gzip
 import json as _json
 import os
 import platform
@@ -29,6 +30,7 @@ import pexpect
 import pytest
 import pytest_asyncio
 
+from bowtie import _index
 from bowtie._cli import EX
 from bowtie._commands import ErroredTest, TestResult
 from bowtie._connectables import Connectable
@@ -863,6 +865,89 @@ async def test_site_combine(tmp_path):
     )
 
 
+def _counts(path):
+    report = Report.from_serialized(path.read_text().splitlines())
+    return [(id, u.counts()) for id, _, u in report.worst_to_best()]
+
+
+@pytest.mark.asyncio
+async def test_site_combine_update(tmp_path):
+    suite = tmp_path / "suite"
+    dialect_dir = suite / "tests" / "draft7"
+    dialect_dir.mkdir(parents=True)
+    dialect_dir.joinpath("type.json").write_text(
+        _json.dumps(
+            [
+                {
+                    "description": "integer",
+                    "schema": {"type": "integer"},
+                    "tests": [
+                        {
+                            "description": "an integer",
+                            "data": 1,
+                            "valid": True,
+                        },
+                        {
+                            "description": "a string",
+                            "data": "foo",
+                            "valid": False,
+                        },
+                    ],
+                },
+            ],
+        ),
+    )
+
+    a = tmp_path / "a"
+    b = tmp_path / "b"
+    for implementation, output in [
+        ("direct:null", a),
+        ("direct:python-jsonschema", b),
+    ]:
+        await bowtie(
+            "site",
+            "collect",
+            "-i",
+            implementation,
+            "--suite",
+            suite,
+            "--output",
+            output,
+        )
+
+    full = tmp_path / "full"
+    await bowtie("site", "combine", str(a), str(b), "--output", full)
+
+    # Add python-jsonschema to null's site data, then replace it again.
+    updated = tmp_path / "updated"
+    await bowtie("site", "combine", str(a), "--output", updated)
+    await bowtie("site", "combine", "--update", str(b), "--output", updated)
+    await bowtie("site", "combine", "--update", str(b), "--output", updated)
+
+    assert (
+        {path.relative_to(updated) for path in updated.rglob("*")},
+        _counts(updated / "draft7.json"),
+        updated.joinpath("implementations.json").read_text(),
+    ) == (
+        {path.relative_to(full) for path in full.rglob("*")},
+        _counts(full / "draft7.json"),
+        full.joinpath("implementations.json").read_text(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_site_combine_update_needs_previous(tmp_path):
+    await bowtie(
+        "site",
+        "combine",
+        "--update",
+        str(tmp_path),
+        "--output",
+        tmp_path / "nope",
+        exit_code=EX.CONFIG,
+    )
+
+
 def _has_bugs_connectable(version):
     return (
         f"direct:{_miniatures.__name__}:has_bugs_by_versions,version={version}"
@@ -1474,6 +1559,49 @@ async def test_max_fail():
     assert stderr != ""
 
 
+@pytest.mark.asyncio
+async def test_instances_per_implementation():
+    cases = """
+        {"description": "1", "schema": {"type": "integer"}, "tests": [{"description": "1", "instance": 1}] }
+        {"description": "2", "schema": {"type": "integer"}, "tests": [{"description": "2", "instance": "2"}] }
+        {"description": "3", "schema": {"type": "string"}, "tests": [{"description": "3", "instance": "3"}] }
+        {"description": "4", "schema": {"type": "string"}, "tests": [{"description": "4", "instance": 4}] }
+        {"description": "5", "schema": {"type": "null"}, "tests": [{"description": "5", "instance": null}] }
+        """  # noqa: E501
+
+    async with run("-i", "direct:python-jsonschema") as send:
+        one, _ = await send(cases)
+
+    async with run(
+        "-i",
+        "direct:python-jsonschema",
+        "--instances-per-implementation",
+        "3",
+    ) as send:
+        several, stderr = await send(cases)
+
+    assert several == one, stderr
+
+
+@pytest.mark.asyncio
+async def test_work_stealing():
+    cases = """
+        {"description": "1", "schema": {"type": "integer"}, "tests": [{"description": "1", "instance": 1}] }
+        {"description": "2", "schema": {"type": "integer"}, "tests": [{"description": "2", "instance": "2"}] }
+        {"description": "3", "schema": {"type": "string"}, "tests": [{"description": "3", "instance": "3"}] }
+        {"description": "4", "schema": {"type": "string"}, "tests": [{"description": "4", "instance": 4}] }
+        """  # noqa: E501
+    implementations = "-i", "direct:python-jsonschema", "-i", "direct:null"
+
+    async with run(*implementations) as send:
+        alone, _ = await send(cases)
+
+    async with run(*implementations, "-j", "4", "--work-stealing") as send:
+        stealing, stderr = await send(cases)
+
+    assert stealing == alone, stderr
+
+
 @pytest.mark.asyncio
 async def test_max_fail_with_fail_fast():
     stdout, stderr = await bowtie(
@@ -3061,6 +3189,76 @@ async def test_filter_dialects_no_results():
     assert (stdout.strip(), stderr) == ("", "No dialects match.\n")
 
 
+@pytest.mark.asyncio
+async def test_summary_newer_report_version():
+    header = {
+        "dialect": str(Dialect.by_short_name()["draft2020-12"].uri),
+        "implementations": {},
+        "report_version": 1000,
+    }
+    _, stderr = await bowtie(
+        "summary",
+        "--no-validate-report",
+        stdin=f"{_json.dumps(header)}\n",
+        exit_code=EX.DATAERR,
+    )
+    assert "unsupported-report-version" in stderr, stderr
+
+
+@pytest.mark.asyncio
+async def test_index_compressed(tmp_path):
+    report = tmp_path / "report.jsonl.gz"
+    report.write_bytes(gzip.compress(b"{}\n"))
+    _, stderr = await bowtie("index", report, exit_code=EX.DATAERR)
+    assert "gzip-compressed" in stderr, stderr
+    assert not _index.path_for(report).exists()
+
+
+@pytest.mark.asyncio
+async def test_index_not_json(tmp_path):
+    report = tmp_path / "report.jsonl"
+    report.write_text("not json\n")
+    _, stderr = await bowtie("index", report, exit_code=EX.DATAERR)
+    assert "Expecting value" in stderr, stderr
+    assert not _index.path_for(report).exists()
+
+
+@pytest.mark.asyncio
+async def test_convert_report_not_json():
+    _, stderr = await bowtie(
+        "convert-report",
+        stdin="not json\n",
+        exit_code=EX.DATAERR,
+    )
+    assert "report-not-json" in stderr, stderr
+
+
+@pytest.mark.asyncio
+async def test_convert_report_missing_footer():
+    _, stderr = await bowtie(
+        "convert-report",
+        "--no-validate-report",
+        stdin='{"implementations": {}}\n',
+        exit_code=EX.DATAERR,
+    )
+    assert "truncated-report" in stderr, stderr
+
+
+@pytest.mark.asyncio
+async def test_convert_report_invalid():
+    _, stderr = await bowtie(
+        "convert-report",
+        "--no-validate-report",
+        stdin=(
+            '{"implementations": {}}\n'
+            '{"seq": 1, "implementation": "foo", "expected": [], '
+            '"results": []}\n'
+        ),
+        exit_code=EX.DATAERR,
+    )
+    assert "invalid-report" in stderr, stderr
+
+
 @pytest.mark.asyncio
 async def test_validate(tmp_path):
     tmp_path.joinpath("schema.json").write_text("{}")
@@ -0,0 +1,110 @@
+from collections.abc import Iterator
+from itertools import count
+import asyncio
+import json
+
+from attrs import field, mutable
+import pytest
+
+from bowtie._pool import Pool, lease
+
+
+@mutable
+class FakeEngine:
+    """
+    Just enough of an engine to start and remove (imaginary) containers.
+    """
+
+    running: set[str] = field(factory=set)
+    _ids: Iterator[int] = field(factory=count)
+
+    async def create_pulling_if_needed(self, image, network=True):
+        return f"{image}-{next(self._ids)}"
+
+    async def start_detached(self, id):
+        self.running.add(id)
+
+    async def remove(self, id):
+        self.running.discard(id)
+
+
+@pytest.mark.asyncio
+async def test_leases_are_warmed_back_up():
+    engine = FakeEngine()
+    pool = Pool(engine=engine, warm=2)
+
+    first = await pool.lease("foo")
+    await asyncio.sleep(0)
+    assert engine.running == {first, "foo-1", "foo-2"}
+
+    second = await pool.lease("foo")
+    assert second == "foo-1"
+
+
+@pytest.mark.asyncio
+async def test_unused_containers_are_evicted():
+    engine = FakeEngine()
+    pool = Pool(engine=engine, ttl_sec=0.01)
+
+    leased = await pool.lease("foo")
+    await asyncio.sleep(0.02)
+    await pool._evict()
+    assert engine.running == {leased}
+
+
+@pytest.mark.asyncio
+async def test_lease_over_a_socket(tmp_path):
+    socket = tmp_path / "pool.sock"
+    engine = FakeEngine()
+    serving = asyncio.create_task(Pool(engine=engine).serve(socket))
+    while not socket.exists():  # noqa: ASYNC110
+        await asyncio.sleep(0)
+
+    leased = await lease(str(socket), "foo")
+    assert leased in engine.running
+
+    serving.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await serving
+    assert engine.running == {leased}
+
+
+@pytest.mark.asyncio
+async def test_no_pool_to_lease_from(tmp_path):
+    assert await lease(str(tmp_path / "nothing.sock"), "foo") is None
+
+
+@pytest.mark.asyncio
+async def test_lease_from_a_confused_pool(tmp_path):
+    socket = tmp_path / "pool.sock"
+
+    async def reply(reader, writer):
+        await reader.readline()
+        writer.write(b"[12]\n")
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_unix_server(reply, path=socket)
+    async with server:
+        assert await lease(str(socket), "foo") is None
+
+
+@pytest.mark.asyncio
+async def test_invalid_lease_request(tmp_path):
+    socket = tmp_path / "pool.sock"
+    engine = FakeEngine()
+    serving = asyncio.create_task(Pool(engine=engine).serve(socket))
+    while not socket.exists():  # noqa: ASYNC110
+        await asyncio.sleep(0)
+
+    reader, writer = await asyncio.open_unix_connection(socket)
+    writer.write(b'["foo"]\n')
+    await writer.drain()
+    response = json.loads(await reader.readline())
+    writer.close()
+
+    serving.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await serving
+    assert response == {"error": "invalid request"}
+    assert not engine.running
@@ -3,7 +3,12 @@ from url import URL
 import pytest
 
 from bowtie._direct_connectable import Direct
-from bowtie._registry import Invalid, UnexpectedlyValid
+from bowtie._registry import (
+    Compiled,
+    Invalid,
+    UnexpectedlyValid,
+    ValidatorRegistry,
+)
 
 ALL_VALID = URL.parse("urn:example:everything-valid")
 ALL_INVALID = URL.parse("urn:example:nothing-valid")
@@ -47,3 +52,52 @@ def test_is_valid():
 
 def test_is_not_valid():
     assert not VALIDATORS.for_uri(ALL_INVALID).is_valid(37)
+
+
+def test_is_valid_without_collecting_errors():
+    def validate(instance):
+        raise AssertionError("Collected errors!")
+
+    def compile(schema, registry):
+        return Compiled(validate=validate, is_valid=lambda instance: False)
+
+    instance = 37
+    validator = ValidatorRegistry(compile=compile).for_schema({})
+    assert validator.invalidated(instance) is instance
+
+
+def test_compiled_once():
+    validators = Direct.from_id("python-jsonschema").registry()
+    first = validators.for_schema({"type": "integer", "minimum": 0})
+    second = validators.for_schema({"minimum": 0, "type": "integer"})
+    assert (first, validators.cache_info().misses) == (second, 1)
+
+
+def test_cache_is_bounded():
+    validators = Direct.from_id("python-jsonschema").registry(cache_size=2)
+    for i in range(3):
+        validators.for_schema({"minimum": i})
+    validators.for_schema({"minimum": 0})  # evicted, so compiled again
+
+    info = validators.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 4, 2)
+
+
+def test_least_recently_used_is_evicted():
+    validators = Direct.from_id("python-jsonschema").registry(cache_size=2)
+    validators.for_schema({"minimum": 0})
+    validators.for_schema({"minimum": 1})
+    validators.for_schema({"minimum": 0})
+    validators.for_schema({"minimum": 2})  # evicts {"minimum": 1}
+    validators.for_schema({"minimum": 0})
+
+    info = validators.cache_info()
+    assert (info.hits, info.misses) == (2, 3)
+
+
+def test_different_registries_have_different_caches():
+    validators = VALIDATORS.for_uri(ALL_VALID)
+    extended = (
+        DRAFT202012.create_resource({"$id": "urn:example:more"}) @ VALIDATORS
+    )
+    assert extended.for_uri(ALL_VALID) is not validators
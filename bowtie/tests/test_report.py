@@ -1,3 +1,5 @@
+from io import BytesIO
+
 from hypothesis import HealthCheck, given, settings
 from hypothesis.strategies import sets
 import pytest
@@ -11,13 +13,27 @@ from bowtie._commands import (
     SeqResult,
     TestResult,
 )
-from bowtie._core import Dialect, Example, ImplementationInfo, TestCase
+from bowtie._compression import ZstdUnavailable
+from bowtie._core import (
+    Dialect,
+    Example,
+    ImplementationInfo,
+    TestCase,
+    populated_registry,
+    registry_id,
+)
 from bowtie._report import (
+    REPORT_VERSION,
     DuplicateImplementation,
     InconsistentCases,
     InconsistentDialects,
+    InvalidReport,
     Report,
+    ReportCollector,
+    Reporter,
+    ReportWriter,
     RunMetadata,
+    UnsupportedReportVersion,
 )
 from bowtie.hypothesis import (
     dialects,
@@ -83,6 +99,19 @@ CASE2 = TestCase(
     schema={"type": "string"},
     tests=[Example(description="2", instance="hello")],
 )
+REMOTES = populated_registry(
+    {"http://example.com/remote": {"type": "integer"}},
+    dialect=DIALECT_2020,
+)
+REMOTE1, REMOTE2 = (
+    TestCase(
+        description=f"remote{i}",
+        schema={"$ref": "http://example.com/remote"},
+        tests=[Example(description="1", instance=i)],
+        registry=REMOTES,
+    )
+    for i in range(2)
+)
 
 
 def _report_data(
@@ -92,6 +121,7 @@ def _report_data(
     dialect=DIALECT_2020,
     did_fail_fast=False,
     seq_start=1,
+    run_metadata={},
 ):
     """
     Build report data for a single implementation.
@@ -101,6 +131,7 @@ def _report_data(
     metadata = RunMetadata(
         dialect=dialect,
         implementations={impl_id: impl_info},
+        metadata=run_metadata,
     )
     data = [metadata.serializable()]
     for i, (case, result) in enumerate(case_results, seq_start):
@@ -555,6 +586,44 @@ def test_empty_with_implementations_is_empty(dialect, implementations):
     assert report.is_empty
 
 
+def test_trusted_input_is_not_validated():
+    data = _report_data(
+        "foo",
+        FOO,
+        [(CASE1, CaseResult(results=[TestResult.VALID]))],
+    )
+    assert Report.from_input(data, validate=False) == Report.from_input(data)
+
+
+@given(report=reports())
+@settings(suppress_health_check=[HealthCheck.too_slow])
+def test_trusted_round_trip(report):
+    assert (
+        Report.from_serialized(report.serialized(), validate=False) == report
+    )
+
+
+def test_unsuccessful():
+    data = _report_data(
+        "foo",
+        FOO,
+        [
+            (CASE1, CaseErrored(context={"message": "boom"}, caught=True)),
+            (CASE2, CaseSkipped(message="nope")),
+        ],
+    )
+    report = Report.from_input(data)
+    unsuccessful = report.unsuccessful("foo")
+    assert (
+        unsuccessful.counts(),
+        report.unsuccessful("foo") is unsuccessful,
+    ) == (
+        {"failed": 0, "errored": 1, "skipped": 1},
+        True,
+    )
+    assert report == Report.from_input(data)
+
+
 class TestSerialized:
     """Tests for Report.serialized()."""
 
@@ -628,12 +697,97 @@ class TestSerialized:
         assert result == report
         assert result.did_fail_fast
 
+    def test_round_trip_shared_registry(self):
+        data = _report_data(
+            "foo",
+            FOO,
+            [
+                (REMOTE1, CaseResult(results=[TestResult.INVALID])),
+                (REMOTE2, CaseResult(results=[TestResult.VALID])),
+            ],
+        )
+        report = Report.from_input(data)
+        serialized = list(report.serialized())
+        registries = [line for line in serialized if '"registry"' in line]
+
+        result = Report.from_serialized(serialized)
+        first, second = (case for case, _ in result.cases_with_results())
+        assert (
+            result,
+            len(registries),
+            first.registry is second.registry,
+        ) == (
+            report,
+            1,
+            True,
+        )
+
+    def test_newer_version(self):
+        header, *rest = _report_data(
+            "foo",
+            FOO,
+            [(CASE1, CaseResult(results=[TestResult.VALID]))],
+        )
+        newer = {**header, "report_version": REPORT_VERSION + 1}
+        with pytest.raises(UnsupportedReportVersion):
+            Report.from_input([newer, *rest])
+
+    def test_unknown_registry(self):
+        report = Report.from_input(
+            _report_data(
+                "foo",
+                FOO,
+                [(REMOTE1, CaseResult(results=[TestResult.VALID]))],
+            ),
+        )
+        serialized = report.serialized()
+        without_registry = [
+            line for line in serialized if '"registry"' not in line
+        ]
+        with pytest.raises(InvalidReport):
+            Report.from_serialized(without_registry)
+
+    @pytest.mark.parametrize("compression", [None, "gzip", "zstd"])
+    def test_round_trip_compressed(self, compression):
+        data = _report_data(
+            "foo",
+            FOO,
+            [(CASE1, CaseResult(results=[TestResult.VALID]))],
+        )
+        report = Report.from_input(data)
+
+        file = BytesIO()
+        try:
+            report.write(file, compression=compression)
+        except ZstdUnavailable:
+            pytest.skip("Zstandard is unavailable.")
+        file.seek(0)
+        assert Report.from_file(file) == report
+
     @given(report=reports())
     @settings(suppress_health_check=[HealthCheck.too_slow])
     def test_round_trip_any_report(self, report):
         result = Report.from_serialized(report.serialized())
         assert result == report
 
+    def test_each_serialized(self):
+        foo = Report.from_input(
+            _report_data(
+                "foo",
+                FOO,
+                [(CASE1, CaseResult(results=[TestResult.VALID]))],
+            ),
+        )
+        bar = Report.from_input(
+            _report_data(
+                "bar",
+                BAR,
+                [(REMOTE1, CaseSkipped(message="nope"))],
+            ),
+        )
+        serialized = ["\n".join(each.serialized()) for each in (foo, bar)]
+        assert Report.from_each_serialized(serialized) == [foo, bar]
+
 
 class TestCombine:
     """Tests for Report.combine()."""
@@ -680,6 +834,28 @@ class TestCombine:
         assert set(combined.implementations) == {"foo", "bar"}
         assert combined.total_tests == 1
 
+    def test_combine_same_cases_different_key_order(self):
+        case = TestCase.from_dict(
+            dialect=DIALECT_2020,
+            description="registry",
+            schema={"$ref": "http://example.com/a", "type": "object"},
+            tests=[{"description": "1", "instance": {}}],
+            registry={"http://example.com/a": {"b": 1, "a": 2}},
+        )
+        reordered = TestCase.from_dict(
+            dialect=DIALECT_2020,
+            description="registry",
+            schema={"type": "object", "$ref": "http://example.com/a"},
+            tests=[{"description": "1", "instance": {}}],
+            registry={"http://example.com/a": {"a": 2, "b": 1}},
+        )
+        valid = CaseResult(results=[TestResult.VALID])
+        combined = Report.combine(
+            Report.from_input(_report_data("foo", FOO, [(case, valid)])),
+            Report.from_input(_report_data("bar", BAR, [(reordered, valid)])),
+        )
+        assert combined.total_tests == 1
+
     def test_combine_multiple_cases(self):
         valid = CaseResult(results=[TestResult.VALID])
         invalid = CaseResult(results=[TestResult.INVALID])
@@ -720,6 +896,31 @@ class TestCombine:
         combined = Report.combine(foo_report, bar_report)
         assert combined.did_fail_fast
 
+    def test_combine_merges_per_implementation_metadata(self):
+        foo_restarts = {"restart_sec": [0.5], "replay_sec": [0.0]}
+        bar_restarts = {"restart_sec": [3.0], "replay_sec": [1.0]}
+        foo_report = Report.from_input(
+            _report_data(
+                "foo",
+                FOO,
+                [(CASE1, CaseResult(results=[TestResult.VALID]))],
+                run_metadata={"restarts": {"foo": foo_restarts}, "ci": 1},
+            ),
+        )
+        bar_report = Report.from_input(
+            _report_data(
+                "bar",
+                BAR,
+                [(CASE1, CaseResult(results=[TestResult.VALID]))],
+                run_metadata={"restarts": {"bar": bar_restarts}, "ci": 2},
+            ),
+        )
+        combined = Report.combine(foo_report, bar_report)
+        assert combined.metadata.metadata == {
+            "restarts": {"foo": foo_restarts, "bar": bar_restarts},
+            "ci": 1,
+        }
+
     def test_combine_errors_on_mismatched_dialects(self):
         bar_2019 = ImplementationInfo(
             name="bar",
@@ -867,3 +1068,164 @@ class TestCombine:
             ),
         )
         assert Report.from_serialized(combined.serialized()) == combined
+
+
+def _run_through(reporter, run, cases, **finished):
+    """
+    Report a run of the given ``(case, result)`` pairs as Bowtie would.
+    """
+    reporter.ready(run)
+    ((implementation, _),) = run.implementations.items()
+    for seq, (case, result) in enumerate(cases, 1):
+        got_result = reporter.case_started(
+            SeqCase(seq=seq, case=case),
+            run.dialect,
+        )
+        got_result(
+            result=SeqResult(
+                seq=seq,
+                implementation=implementation,
+                expected=[t.expected() for t in case.tests],
+                result=result,
+            ),
+        )
+    reporter.finished(**{"did_fail_fast": False, **finished})
+
+
+class TestReporter:
+    """Tests for reporting a run as it happens."""
+
+    def test_registries_written_in_each_report(self):
+        lines = []
+        reporter = Reporter(write=lambda **line: lines.append(line))
+        result = [(REMOTE1, CaseResult(results=[TestResult.VALID]))]
+        _run_through(reporter, FOO_RUN, result)
+        _run_through(reporter, FOO_RUN, result)
+
+        registries = [
+            line["registry_id"] for line in lines if "registry" in line
+        ]
+        assert registries == [registry_id(REMOTE1.registry)] * 2
+
+
+class TestReportWriter:
+    """Tests for writing a report as implementations run."""
+
+    def test_same_as_combined(self):
+        foo = [
+            (CASE1, CaseResult(results=[TestResult.VALID])),
+            (CASE2, CaseResult(results=[TestResult.VALID])),
+        ]
+        bar = [
+            (CASE1, CaseResult(results=[TestResult.INVALID])),
+            (CASE2, CaseSkipped(message="nope")),
+        ]
+
+        lines = []
+        writer = ReportWriter(write=lines.append, expecting=2)
+        _run_through(writer.reporter(), FOO_RUN, foo)
+        _run_through(writer.reporter(), BAR_RUN, bar, did_fail_fast=True)
+
+        combined = Report.combine(
+            Report.from_input(_report_data("foo", FOO, foo)),
+            Report.from_input(
+                _report_data("bar", BAR, bar, did_fail_fast=True),
+            ),
+        )
+        assert Report.from_serialized(lines) == combined
+
+        cases = [line for line in lines if '"case"' in line]
+        assert len(cases) == len(foo)
+
+    def test_registries_written_once(self):
+        foo = [(REMOTE1, CaseResult(results=[TestResult.INVALID]))]
+        bar = [(REMOTE1, CaseResult(results=[TestResult.VALID]))]
+
+        lines = []
+        writer = ReportWriter(write=lines.append, expecting=2)
+        _run_through(writer.reporter(), FOO_RUN, foo)
+        _run_through(writer.reporter(), BAR_RUN, bar)
+
+        combined = Report.combine(
+            Report.from_input(_report_data("foo", FOO, foo)),
+            Report.from_input(_report_data("bar", BAR, bar)),
+        )
+        assert Report.from_serialized(lines) == combined
+
+        registries = [line for line in lines if '"registry"' in line]
+        assert len(registries) == 1
+
+    def test_held_until_everyone_started(self):
+        lines = []
+        writer = ReportWriter(write=lines.append, expecting=3)
+        foo = writer.reporter()
+        foo.ready(FOO_RUN)
+        foo.case_started(SeqCase(seq=1, case=CASE1), DIALECT_2020)
+        assert not lines
+
+        writer.reporter().ready(BAR_RUN)
+        assert not lines
+
+        writer.dropped()
+        assert writer.wrote_header
+        assert len(lines) == 2  # noqa: PLR2004
+
+    def test_nobody_started(self):
+        lines = []
+        writer = ReportWriter(write=lines.append, expecting=2)
+        writer.dropped()
+        writer.dropped()
+        assert (lines, writer.wrote_header) == ([], False)
+
+    def test_finished_metadata(self):
+        foo_restarts = {"restart_sec": [0.5], "replay_sec": [0.0]}
+        bar_restarts = {"restart_sec": [3.0], "replay_sec": [1.0]}
+        result = [(CASE1, CaseResult(results=[TestResult.VALID]))]
+
+        lines = []
+        writer = ReportWriter(write=lines.append, expecting=2)
+        _run_through(
+            writer.reporter(),
+            FOO_RUN,
+            result,
+            metadata={"restarts": {"foo": foo_restarts}},
+        )
+        _run_through(
+            writer.reporter(),
+            BAR_RUN,
+            result,
+            metadata={"restarts": {"bar": bar_restarts}},
+        )
+
+        report = Report.from_serialized(lines)
+        assert report.metadata.metadata == {
+            "restarts": {"foo": foo_restarts, "bar": bar_restarts},
+        }
+
+
+class TestReportCollector:
+    """Tests for collecting a run directly into a report."""
+
+    def test_same_as_replayed(self):
+        results = [
+            (CASE1, CaseResult(results=[TestResult.VALID])),
+            (CASE2, CaseErrored(context={"message": "boom"}, caught=True)),
+        ]
+        collector = ReportCollector()
+        _run_through(collector, FOO_RUN, results)
+        _, *rest = _report_data("foo", FOO, results)
+        replayed = Report.from_input([FOO_RUN.serializable(), *rest])
+        collected = collector.report()
+        assert Report.from_serialized(collected.serialized()) == replayed
+
+    def test_finished_metadata(self):
+        restarts = {"restart_sec": [0.5], "replay_sec": [0.0]}
+        collector = ReportCollector()
+        _run_through(
+            collector,
+            FOO_RUN,
+            [(CASE1, CaseResult(results=[TestResult.VALID]))],
+            metadata={"restarts": {"foo": restarts}},
+        )
+        report = collector.report()
+        assert report.metadata.metadata == {"restarts": {"foo": restarts}}
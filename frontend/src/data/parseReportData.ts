@@ -83,10 +83,20 @@ export const parseReportData = (
   }
 
   const caseMap = new Map<number, Case>();
+  const registries = new Map<string, Record<string, unknown>>();
   let didFailFast = false;
   for (const line of lines) {
-    if (line.case) {
-      caseMap.set(line.seq as number, line.case as Case);
+    if (line.registry_id && line.registry) {
+      registries.set(
+        line.registry_id as string,
+        line.registry as Record<string, unknown>,
+      );
+    } else if (line.case) {
+      const caseData = line.case as Case;
+      if (line.registry_id) {
+        caseData.registry = registries.get(line.registry_id as string);
+      }
+      caseMap.set(line.seq as number, caseData);
     } else if (line.implementation) {
       const caseData = caseMap.get(line.seq as number)!;
       const implementationResults = implementationsResultsMap.get(
@@ -211,6 +221,7 @@ export const calculateTotals = (data: ReportData): Totals => {
 interface Header {
   dialect: string;
   bowtie_version: string;
+  report_version?: number;
   metadata: Record<string, unknown>;
   implementations: Record<string, RawImplementationData>;
   started: number;
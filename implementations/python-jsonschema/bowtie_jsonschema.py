@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from importlib import metadata
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 import json
 import platform
 import sys
@@ -21,6 +21,7 @@ else:
     from jsonschema.validators import RefResolver
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
     import io
 
     from jsonschema.protocols import Validator
@@ -32,11 +33,14 @@ class Runner:
     _stdout: io.TextIOWrapper = sys.stdout
     _DefaultValidator: Validator | None = None
     _default_spec = None
+    _registered: dict[int, Validator] = field(
+        default_factory=dict[int, "Validator"],
+    )
 
     def run(self, stdin=sys.stdin):
         for line in stdin:
             each = json.loads(line)
-            cmd = each.pop("cmd")
+            cmd = each.pop("cmd").replace("-", "_")
             response = getattr(self, f"cmd_{cmd}")(**each)
             self._stdout.write(f"{json.dumps(response)}\n")
             self._stdout.flush()
@@ -69,6 +73,7 @@ class Runner:
                 os=os_release["ID"],
                 os_version=os_release["VERSION_ID"],
             ),
+            capabilities=dict(schema_handles=True),
         )
 
     def cmd_dialect(self, dialect):
@@ -80,6 +85,46 @@ class Runner:
             )
         return dict(ok=True)
 
+    def _validator_for(
+        self,
+        schema: Any,
+        registry: Mapping[str, Any],
+    ) -> Validator:
+        Validator = validator_for(schema, self._DefaultValidator)
+        assert Validator is not None, (
+            "No dialect sent and schema is missing $schema."
+        )
+
+        if use_referencing_library:
+            registry = referencing.Registry().with_contents(
+                registry.items(),
+                default_specification=self._default_spec,
+            )
+            return Validator(schema, registry=registry)
+        resolver = RefResolver.from_schema(schema, store=registry)
+        return Validator(schema, resolver=resolver)
+
+    def cmd_register_schema(
+        self,
+        handle: int,
+        schema: Any,
+        registry: Mapping[str, Any] = {},
+    ) -> dict[str, Any]:
+        assert self._started, "Not started!"
+        try:
+            self._registered[handle] = self._validator_for(schema, registry)
+        except Exception:
+            return dict(
+                errored=True,
+                context={"traceback": traceback.format_exc()},
+            )
+        return dict(handle=handle)
+
+    def cmd_release(self, handle: int) -> dict[str, Any]:
+        assert self._started, "Not started!"
+        self._registered.pop(handle, None)
+        return dict(ok=True)
+
     def cmd_run(self, case, seq, output="flag"):
         assert self._started, "Not started!"
         if output == "annotations":
@@ -88,23 +133,14 @@ class Runner:
                 message="jsonschema does not support annotation collection",
             )
             return dict(seq=seq, results=[skipped for _ in case["tests"]])
-        schema = case["schema"]
         try:
-            Validator = validator_for(schema, self._DefaultValidator)
-            assert Validator is not None, (
-                "No dialect sent and schema is missing $schema."
-            )
-
-            if use_referencing_library:
-                registry = referencing.Registry().with_contents(
-                    case.get("registry", {}).items(),
-                    default_specification=self._default_spec,
-                )
-                validator = Validator(schema, registry=registry)
+            if "handle" in case:
+                validator = self._registered[case["handle"]]
             else:
-                registry = case.get("registry", {})
-                resolver = RefResolver.from_schema(schema, store=registry)
-                validator = Validator(schema, resolver=resolver)
+                validator = self._validator_for(
+                    case["schema"],
+                    case.get("registry", {}),
+                )
 
             results = [
                 {"valid": validator.is_valid(test["instance"])}